@@ -1,3 +1,12 @@
+from ._async_benchmark import AsyncBenchmarkResult, abenchmark
+from ._benchmark_result import BenchmarkResult
+from ._isolation import available_cpus, benchmark_isolated
+from ._memory_profile import MemoryProfile, profile_memory
 from ._micro_benchmark import benchmark
+from ._parallel_scaling import ParallelLevelResult, ParallelScalingResult, benchmark_parallel
+from ._profiler import Profiler, RegionStats, profile, profiler
+from ._registry import BenchmarkCase, BenchmarkRegistry, benchmark_registry, register_benchmark
+from ._scaling import ComplexityFit, ScalingResult, benchmark_scaling, crossover_size, fit_complexity
 from ._sleep import high_precision_sleep
+from ._suite import BenchmarkComparison, compare_results, load_results, run_benchmarks, save_results
 from ._timer import Timer
@@ -0,0 +1,174 @@
+import asyncio
+import time
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable
+
+import numpy as np
+
+from brtp.formatting._time_duration import format_short_time_duration
+
+from ._benchmark_result import BenchmarkResult
+from ._micro_benchmark import _adjust_n_executions
+from ._timer import Timer
+
+
+# =================================================================================================
+#  AsyncBenchmarkResult
+# =================================================================================================
+@dataclass(frozen=True)
+class AsyncBenchmarkResult(BenchmarkResult):
+    """
+    Detailed result of abenchmark(..., return_result=True).  On top of BenchmarkResult, where t_sec represents the
+    (inverse) throughput, i.e. wall-clock duration of each run divided by its number of executions, this contains the
+    latency of each individual await at the given concurrency level.
+    """
+
+    concurrency: int = 1
+    latency_sec: np.ndarray = field(default_factory=lambda: np.zeros(0))  # latency of each await in benchmark runs
+
+    @property
+    def throughput(self) -> float:
+        """Median number of executions per second."""
+        return 1 / self.median if self.median > 0 else float("inf")
+
+    def latency_quantiles(self, q: list[float] | np.ndarray) -> list[float]:
+        """Quantiles (q in [0, 1]) of the latency per await in seconds."""
+        return [float(v) for v in np.quantile(self.latency_sec, q)]
+
+    def __str__(self) -> str:
+        p50, p99 = self.latency_quantiles([0.5, 0.99])
+        return (
+            f"{super().__str__()}, "
+            f"throughput: {self.throughput:.1f}/s, "
+            f"latency p50: {_format(p50)}, p99: {_format(p99)} "
+            f"(concurrency: {self.concurrency})"
+        )
+
+
+def _format(t_sec: float) -> str:
+    return format_short_time_duration(dt_sec=t_sec, spaced=True, long_units=True)
+
+
+# =================================================================================================
+#  Main benchmarking function
+# =================================================================================================
+async def abenchmark(
+    f: Callable[[], Awaitable[Any]],
+    t_per_run: float = 0.1,
+    n_warmup: int = 10,
+    n_benchmark: int = 30,
+    concurrency: int = 1,
+    silent: bool = False,
+    return_result: bool = False,
+) -> float | AsyncBenchmarkResult:
+    """
+    Adaptive micro-benchmarking of coroutine functions, the asynchronous counterpart of benchmark(), using the same
+    adaptive number of executions per run.  Runs on the current event loop, e.g. ...
+
+        t = await abenchmark(fetch)                  # from within a running event loop
+        t = asyncio.run(abenchmark(fetch))           # on a dedicated event loop
+
+    With concurrency > 1, each run awaits its executions using `concurrency` concurrent workers, such that both
+    throughput & latency at that concurrency level can be determined.
+
+    :param f: (Callable) Coroutine function to benchmark. Should take no arguments.
+    :param t_per_run: (float, default=0.1) see benchmark().
+    :param n_warmup: (int, default=10) see benchmark().
+    :param n_benchmark: (int, default=30) see benchmark().
+    :param concurrency: (int, default=1) number of awaits in flight at any time.
+    :param silent: (bool, default=False) If True, suppresses any output during benchmarking.
+    :param return_result: (bool, default=False) If True, an AsyncBenchmarkResult is returned, containing throughput
+                          & latency statistics.
+    :return: Median estimate of (wall-clock) duration/execution in seconds, i.e. the inverse of the throughput, or
+             AsyncBenchmarkResult if return_result=True.
+    """
+
+    # --- init --------------------------------------------
+    if concurrency < 1:
+        raise ValueError(f"concurrency should be >= 1, got {concurrency}.")
+
+    lst_t = []  # list of measured times per execution in seconds
+    lst_n_executions = []  # list of number of executions per run
+    lst_t_baseline = []  # list of measured baseline times per execution in seconds
+    lst_latency = []  # list of arrays with latency per await of each benchmark run, in seconds
+    n_executions = 1  # number of executions per run, adjusted dynamically
+
+    if not silent:
+        print("Benchmarking: ", end="")
+
+    # --- main loop ---------------------------------------
+    for i in range(n_warmup + n_benchmark):
+        # run
+        t_baseline, _ = await _timed_run(_abaseline_fun, n_executions, concurrency)
+        t_f, latency_nsec = await _timed_run(f, n_executions, concurrency)
+
+        # store results of benchmark runs
+        if i >= n_warmup:
+            lst_t.append(abs(t_f - t_baseline) / n_executions)  # abs value to avoid negative times for very fast 'f'.
+            lst_n_executions.append(n_executions)
+            lst_t_baseline.append(t_baseline / n_executions)
+            lst_latency.append(np.array(latency_nsec) / 1e9)
+            if not silent:
+                print(".", end="")
+        else:
+            if not silent:
+                print("w", end="")
+
+        # adjust n_executions
+        n_executions = _adjust_n_executions(n_executions, t_per_run, t_tot=t_baseline + t_f)
+
+    # --- finalize ----------------------------------------
+    result = AsyncBenchmarkResult(
+        t_sec=np.array(lst_t),
+        n_executions=np.array(lst_n_executions),
+        t_baseline_sec=np.array(lst_t_baseline),
+        concurrency=concurrency,
+        latency_sec=np.concatenate(lst_latency),
+    )
+    if not silent:
+        q25, q50, q75 = result.quantiles([0.25, 0.50, 0.75])
+        p50, p99 = result.latency_quantiles([0.5, 0.99])
+        s_median = format_short_time_duration(dt_sec=q50, right_aligned=True, spaced=True, long_units=True)
+        s_perc = f"{50 * (q75 - q25) / q50:.1f}%"
+        print(f"   {s_median} ± {s_perc} per execution")
+        print(f"Throughput:   {result.throughput:.1f}/s (concurrency: {concurrency})")
+        print(f"Latency:      p50: {_format(p50)}, p99: {_format(p99)}")
+
+    # --- return result -----------------------------------
+    if return_result:
+        return result
+    else:
+        return result.median
+
+
+# =================================================================================================
+#  Helpers
+# =================================================================================================
+async def _timed_run(f: Callable[[], Awaitable[Any]], n_executions: int, concurrency: int) -> tuple[float, list[int]]:
+    """
+    Await f n_executions times using `concurrency` workers;  returns (wall-clock duration in seconds, list of latency
+    per await in nanoseconds).
+    """
+    executions = iter(range(n_executions))  # shared by all workers
+    latency_nsec = []
+
+    async def worker():
+        for _ in executions:
+            t_start = time.perf_counter_ns()
+            await f()
+            latency_nsec.append(time.perf_counter_ns() - t_start)
+
+    with Timer() as timer:
+        if concurrency == 1:
+            await worker()
+        else:
+            await asyncio.gather(*[worker() for _ in range(min(concurrency, n_executions))])
+
+    return timer.t_elapsed_sec(), latency_nsec
+
+
+# =================================================================================================
+#  Baseline benchmarks
+# =================================================================================================
+async def _abaseline_fun():
+    pass
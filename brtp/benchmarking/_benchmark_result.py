@@ -0,0 +1,124 @@
+from dataclasses import dataclass
+
+import numpy as np
+
+from brtp.formatting._time_duration import format_short_time_duration
+
+from ._memory_profile import MemoryProfile
+
+
+# =================================================================================================
+#  BenchmarkResult
+# =================================================================================================
+@dataclass(frozen=True)
+class BenchmarkResult:
+    """
+    Detailed result of benchmark(..., return_result=True), containing all per-run measurements (warmup runs excluded)
+    and methods to derive statistics from them.
+    """
+
+    t_sec: np.ndarray  # duration/execution of each run in seconds, baseline overhead subtracted
+    n_executions: np.ndarray  # number of executions of each run
+    t_baseline_sec: np.ndarray  # baseline overhead/execution of each run in seconds (as measured by _baseline_fun)
+    memory: MemoryProfile | None = None  # only if benchmark(..., profile_memory=True)
+
+    # -------------------------------------------------------------------------
+    #  Basic statistics
+    # -------------------------------------------------------------------------
+    @property
+    def n_runs(self) -> int:
+        return len(self.t_sec)
+
+    @property
+    def median(self) -> float:
+        return float(np.median(self.t_sec))
+
+    @property
+    def mean(self) -> float:
+        return float(np.mean(self.t_sec))
+
+    @property
+    def iqr(self) -> float:
+        q25, q75 = self.quantiles([0.25, 0.75])
+        return q75 - q25
+
+    @property
+    def baseline_overhead_sec(self) -> float:
+        """Median baseline overhead/execution in seconds, which was subtracted from the measured durations."""
+        return float(np.median(self.t_baseline_sec))
+
+    def quantiles(self, q: list[float] | np.ndarray) -> list[float]:
+        """Quantiles (q in [0, 1]) of the duration/execution."""
+        return [float(v) for v in np.quantile(self.t_sec, q)]
+
+    # -------------------------------------------------------------------------
+    #  Confidence interval
+    # -------------------------------------------------------------------------
+    def median_ci(
+        self,
+        confidence: float = 0.95,
+        n_bootstrap: int = 10_000,
+        seed: int | None = 0,
+    ) -> tuple[float, float]:
+        """
+        Bootstrap (percentile) confidence interval of the median duration/execution.
+
+        :param confidence: (float, default=0.95) confidence level.
+        :param n_bootstrap: (int, default=10_000) number of bootstrap resamples.
+        :param seed: (int, optional, default=0) seed of the random generator, for reproducible results.
+        :return: (lower, upper) bounds of the confidence interval in seconds.
+        """
+        rng = np.random.default_rng(seed)
+        samples = rng.choice(self.t_sec, size=(n_bootstrap, self.n_runs), replace=True)
+        medians = np.median(samples, axis=1)
+        alpha = (1 - confidence) / 2
+        lower, upper = np.quantile(medians, [alpha, 1 - alpha])
+        return float(lower), float(upper)
+
+    # -------------------------------------------------------------------------
+    #  Outliers
+    # -------------------------------------------------------------------------
+    def tukey_fences(self, k: float = 1.5) -> tuple[float, float]:
+        """(lower, upper) Tukey fences, i.e. Q1 - k*IQR and Q3 + k*IQR."""
+        q25, q75 = self.quantiles([0.25, 0.75])
+        return q25 - k * (q75 - q25), q75 + k * (q75 - q25)
+
+    def outliers(self, k: float = 1.5) -> np.ndarray:
+        """Boolean mask indicating which runs lie outside of the Tukey fences with given k."""
+        lower, upper = self.tukey_fences(k)
+        return (self.t_sec < lower) | (self.t_sec > upper)
+
+    def classify_outliers(self) -> dict[str, int]:
+        """
+        Count outliers per category, using Tukey fences with k=1.5 ('mild') and k=3 ('severe'):
+        'low_severe', 'low_mild', 'high_mild', 'high_severe'.
+        """
+        mild_lower, mild_upper = self.tukey_fences(1.5)
+        severe_lower, severe_upper = self.tukey_fences(3.0)
+        t = self.t_sec
+        return dict(
+            low_severe=int(np.sum(t < severe_lower)),
+            low_mild=int(np.sum((severe_lower <= t) & (t < mild_lower))),
+            high_mild=int(np.sum((mild_upper < t) & (t <= severe_upper))),
+            high_severe=int(np.sum(t > severe_upper)),
+        )
+
+    # -------------------------------------------------------------------------
+    #  Formatting
+    # -------------------------------------------------------------------------
+    def __float__(self) -> float:
+        return self.median
+
+    def __str__(self) -> str:
+        ci_lower, ci_upper = self.median_ci()
+        return (
+            f"{_format(self.median)} per execution "
+            f"(95% CI: {_format(ci_lower).strip()} - {_format(ci_upper).strip()}, "
+            f"IQR: {_format(self.iqr).strip()}, "
+            f"outliers: {int(np.sum(self.outliers()))}/{self.n_runs}, "
+            f"baseline: {_format(self.baseline_overhead_sec).strip()})"
+        )
+
+
+def _format(t_sec: float) -> str:
+    return format_short_time_duration(dt_sec=t_sec, right_aligned=True, spaced=True, long_units=True)
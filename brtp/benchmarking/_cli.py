@@ -0,0 +1,106 @@
+import argparse
+from pathlib import Path
+
+from ._discovery import _import_source
+from ._registry import benchmark_registry
+from ._suite import compare_results, load_results, run_benchmarks, save_results
+
+_DEFAULT_PATH = "benchmarks"
+
+
+# =================================================================================================
+#  Main entrypoint
+# =================================================================================================
+def main(argv: list[str] | None = None) -> int:
+    """
+    Command-line runner for benchmark suites:  python -m brtp.benchmarking [options] [paths or modules].
+
+    Benchmarks are discovered by importing the provided modules, python files or directories (recursively looking
+    for files named bench*.py or *_bench*.py), after which all functions registered using @register_benchmark are run.
+
+    Returns exit code 1 if regressions w.r.t. the baseline were detected, 0 otherwise.
+    """
+    args = _parse_args(argv)
+
+    # --- discover ----------------------------------------
+    default_sources = [_DEFAULT_PATH] if Path(_DEFAULT_PATH).is_dir() else []
+    for source in args.sources or default_sources:
+        _import_source(source)
+    cases = benchmark_registry.cases(groups=args.group, pattern=args.filter)
+
+    if args.list:
+        for case in cases:
+            print(case.name)
+        return 0
+    if not cases:
+        print("No benchmarks found.")
+        return 0
+
+    # --- run ---------------------------------------------
+    results = run_benchmarks(
+        cases,
+        t_per_run=args.t_per_run,
+        n_warmup=args.n_warmup,
+        n_benchmark=args.n_benchmark,
+        silent=args.quiet,
+        return_results=True,
+        isolated=args.isolated,
+        cpus=args.cpus,
+    )
+    if args.output:
+        save_results(results, args.output)
+
+    # --- compare -----------------------------------------
+    if args.baseline:
+        comparisons = compare_results(results, load_results(args.baseline), threshold=args.threshold)
+        regressions = [c for c in comparisons if c.is_regression]
+        print()
+        print(f"Comparison with baseline '{args.baseline}' (threshold: {100 * args.threshold:.1f}%):")
+        for comparison in comparisons:
+            print(f"  {comparison}")
+        if regressions:
+            print(f"{len(regressions)} regression(s) detected.")
+            return 1
+
+    return 0
+
+
+# =================================================================================================
+#  Helpers
+# =================================================================================================
+def _parse_args(argv: list[str] | None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog="python -m brtp.benchmarking", description="Run registered benchmarks.")
+    parser.add_argument(
+        "sources",
+        nargs="*",
+        help=f"modules, python files or directories to discover benchmarks in (default: '{_DEFAULT_PATH}')",
+    )
+    parser.add_argument("-g", "--group", action="append", help="only run benchmarks of this group (repeatable)")
+    parser.add_argument("-k", "--filter", help="only run benchmarks with names matching this glob pattern")
+    parser.add_argument("-o", "--output", help="write results to this JSON file")
+    parser.add_argument("-b", "--baseline", help="compare results with this JSON file")
+    parser.add_argument("--threshold", type=float, default=0.1, help="relative regression threshold (default: 0.1)")
+    parser.add_argument("--t-per-run", type=float, default=0.1, help="target time per run in seconds")
+    parser.add_argument("--n-warmup", type=int, default=10, help="number of warmup runs")
+    parser.add_argument("--n-benchmark", type=int, default=30, help="number of benchmark runs")
+    parser.add_argument("--isolated", action="store_true", help="run each benchmark in a fresh, CPU-pinned process")
+    parser.add_argument(
+        "--cpus",
+        type=_parse_cpus,
+        help="comma-separated cores to run isolated benchmarks on in parallel, e.g. '2,3,6-9' (default: all)",
+    )
+    parser.add_argument("--list", action="store_true", help="only list discovered benchmarks")
+    parser.add_argument("-q", "--quiet", action="store_true", help="suppress progress output")
+    return parser.parse_args(argv)
+
+
+def _parse_cpus(s: str) -> list[int]:
+    """Parse comma-separated list of cores and ranges of cores, e.g. '0,2,4-7'."""
+    cpus = []
+    for part in s.split(","):
+        if "-" in part:
+            first, last = part.split("-")
+            cpus.extend(range(int(first), int(last) + 1))
+        else:
+            cpus.append(int(part))
+    return cpus
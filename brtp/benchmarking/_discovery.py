@@ -0,0 +1,34 @@
+import importlib
+import importlib.util
+import re
+import sys
+from pathlib import Path
+
+_FILE_PATTERNS = ("bench*.py", "*_bench*.py")
+_MODULE_PREFIX = "_brtp_benchmarks_"  # prefix of module names of benchmark files imported by path
+
+
+# =================================================================================================
+#  Importing benchmark sources
+# =================================================================================================
+def _import_source(source: str):
+    """Import module name, python file or all benchmark files in a directory, registering their benchmarks."""
+    path = Path(source)
+    if path.is_dir():
+        files = sorted({file for pattern in _FILE_PATTERNS for file in path.rglob(pattern)})
+        for file in files:
+            _import_file(file)
+    elif path.suffix == ".py":
+        _import_file(path)
+    else:
+        importlib.import_module(source)
+
+
+def _import_file(path: Path):
+    module_name = _MODULE_PREFIX + re.sub(r"\W", "_", path.resolve().with_suffix("").as_posix())
+    if module_name in sys.modules:
+        return
+    spec = importlib.util.spec_from_file_location(module_name, path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[module_name] = module
+    spec.loader.exec_module(module)
@@ -0,0 +1,176 @@
+import functools
+import multiprocessing
+import multiprocessing.connection
+import os
+import pickle
+import sys
+import traceback
+from pathlib import Path
+from typing import Callable
+
+from brtp.formatting._time_duration import format_short_time_duration
+
+from ._benchmark_result import BenchmarkResult
+from ._discovery import _MODULE_PREFIX, _import_file
+from ._micro_benchmark import benchmark
+
+
+# =================================================================================================
+#  Main functions
+# =================================================================================================
+def benchmark_isolated(
+    f: Callable,
+    cpu: int | None = None,
+    t_per_run: float = 0.1,
+    n_warmup: int = 10,
+    n_benchmark: int = 30,
+    silent: bool = False,
+    return_result: bool = False,
+    profile_memory: bool = False,
+) -> float | BenchmarkResult:
+    """
+    Run benchmark(f, ...) in a fresh python process, optionally pinned to a single CPU core, such that results are not
+    affected by state of the calling process (warm caches, heap fragmentation, gc generation sizes, ...).
+
+    f is sent to the child process by pickling, so it should be e.g. a module-level function (or a functools.partial
+    thereof);  lambdas and locally defined functions are not supported.
+
+    :param f: (Callable) Function to benchmark. Should take no arguments & be picklable.
+    :param cpu: (int, optional) CPU core to pin the child process to (Linux only, ignored on other platforms).
+    :param t_per_run: (float, default=0.1) see benchmark().
+    :param n_warmup: (int, default=10) see benchmark().
+    :param n_benchmark: (int, default=30) see benchmark().
+    :param silent: (bool, default=False) If True, suppresses any output.
+    :param return_result: (bool, default=False) see benchmark().
+    :param profile_memory: (bool, default=False) see benchmark().
+    :return: Median estimate of duration/execution of `f` in seconds, or BenchmarkResult if return_result=True.
+    """
+    results = _run_isolated(
+        {getattr(f, "__name__", "benchmark"): f},
+        cpus=[cpu],
+        t_per_run=t_per_run,
+        n_warmup=n_warmup,
+        n_benchmark=n_benchmark,
+        silent=silent,
+        profile_memory=profile_memory,
+    )
+    result = next(iter(results.values()))
+    return result if return_result else result.median
+
+
+def available_cpus() -> list[int]:
+    """CPU cores the current process is allowed to run on (all cores on platforms without affinity support)."""
+    if hasattr(os, "sched_getaffinity"):
+        return sorted(os.sched_getaffinity(0))
+    else:
+        return list(range(os.cpu_count() or 1))
+
+
+# =================================================================================================
+#  Internal - parent process
+# =================================================================================================
+def _run_isolated(
+    funcs: dict[str, Callable],
+    cpus: list[int | None],
+    silent: bool = False,
+    **benchmark_kwargs,
+) -> dict[str, BenchmarkResult]:
+    """
+    Benchmark each function in a separate, freshly spawned process, running at most len(cpus) processes in parallel,
+    each pinned to a different core (cpu=None means no pinning).  Returns dict name -> BenchmarkResult, in the order
+    of funcs.
+    """
+
+    # --- init --------------------------------------------
+    if len(cpus) == 0:
+        raise ValueError("At least 1 cpu should be provided.")
+    if len(set(cpus)) < len(cpus):
+        raise ValueError(f"cpus should be distinct, got {cpus}.")
+
+    context = multiprocessing.get_context("spawn")  # fresh interpreter, nothing inherited from the parent's state
+    pending = [(name, pickle.dumps(f), _module_files(f)) for name, f in funcs.items()]  # fails early if unpicklable
+    free_cpus = list(cpus)
+    running = dict()  # connection -> (name, process, cpu)
+    results = dict()
+    name_width = max([len(name) for name in funcs], default=0)
+
+    # --- run ---------------------------------------------
+    try:
+        while pending or running:
+            # start processes on free cpus
+            while pending and free_cpus:
+                name, f_pickled, module_files = pending.pop(0)
+                cpu = free_cpus.pop(0)
+                conn_parent, conn_child = context.Pipe(duplex=False)
+                process = context.Process(
+                    target=_isolated_worker,
+                    args=(conn_child, cpu, f_pickled, module_files, benchmark_kwargs),
+                    daemon=True,
+                )
+                process.start()
+                conn_child.close()
+                running[conn_parent] = (name, process, cpu)
+
+            # collect results of finished processes
+            for conn in multiprocessing.connection.wait(list(running)):
+                name, process, cpu = running.pop(conn)
+                try:
+                    success, value = conn.recv()
+                except EOFError:
+                    process.join()
+                    success, value = False, f"process exited unexpectedly with exit code {process.exitcode}."
+                conn.close()
+                process.join()
+                free_cpus.append(cpu)
+
+                if not success:
+                    raise RuntimeError(f"Benchmark '{name}' failed in isolated process:\n{value}")
+                results[name] = value
+                if not silent:
+                    s_median = format_short_time_duration(
+                        value.median, right_aligned=True, spaced=True, long_units=True
+                    )
+                    s_cpu = "-" if cpu is None else str(cpu)
+                    print(f"{name.ljust(name_width)} | cpu {s_cpu:>3} | {s_median} per execution")
+    finally:
+        for name, process, cpu in running.values():
+            process.terminate()
+            process.join()
+
+    # --- return results ----------------------------------
+    return {name: results[name] for name in funcs}
+
+
+def _module_files(f: Callable) -> dict[str, str]:
+    """Benchmark files (imported by path) the function is defined in, which need to be imported by the child first."""
+    while isinstance(f, functools.partial):
+        f = f.func
+    module = sys.modules.get(getattr(f, "__module__", None) or "")
+    if module is not None and module.__name__.startswith(_MODULE_PREFIX):
+        return {module.__name__: module.__file__}
+    else:
+        return dict()
+
+
+# =================================================================================================
+#  Internal - child process
+# =================================================================================================
+def _isolated_worker(
+    conn: multiprocessing.connection.Connection,
+    cpu: int | None,
+    f_pickled: bytes,
+    module_files: dict[str, str],
+    benchmark_kwargs: dict,
+):
+    try:
+        if (cpu is not None) and hasattr(os, "sched_setaffinity"):
+            os.sched_setaffinity(0, {cpu})
+        for file in module_files.values():
+            _import_file(Path(file))
+        f = pickle.loads(f_pickled)
+        result = benchmark(f, silent=True, return_result=True, **benchmark_kwargs)
+        conn.send((True, result))
+    except BaseException:
+        conn.send((False, traceback.format_exc()))
+    finally:
+        conn.close()
@@ -0,0 +1,121 @@
+import gc
+import tracemalloc
+from dataclasses import dataclass
+from typing import Any, Callable
+
+import numpy as np
+
+
+# =================================================================================================
+#  MemoryProfile
+# =================================================================================================
+@dataclass(frozen=True)
+class MemoryProfile:
+    """
+    Memory & allocation statistics of a callable, with 1 value per profiled execution:
+      - peak_bytes:      peak traced memory during the execution, relative to the traced memory before it
+      - net_bytes:       traced memory still allocated after the execution (e.g. results, caches, leaks)
+      - net_blocks:      number of memory blocks still allocated after the execution
+      - gc_collections:  number of garbage collections (any generation) triggered during the execution
+    """
+
+    peak_bytes: np.ndarray
+    net_bytes: np.ndarray
+    net_blocks: np.ndarray
+    gc_collections: np.ndarray
+
+    @property
+    def median_peak_bytes(self) -> float:
+        return float(np.median(self.peak_bytes))
+
+    @property
+    def median_net_bytes(self) -> float:
+        return float(np.median(self.net_bytes))
+
+    @property
+    def median_net_blocks(self) -> float:
+        return float(np.median(self.net_blocks))
+
+    @property
+    def mean_gc_collections(self) -> float:
+        return float(np.mean(self.gc_collections))
+
+    def __str__(self) -> str:
+        return (
+            f"peak {_format_bytes(self.median_peak_bytes)}, "
+            f"net {_format_bytes(self.median_net_bytes)} / {self.median_net_blocks:.0f} blocks, "
+            f"{self.mean_gc_collections:.2f} gc collections per execution"
+        )
+
+
+# =================================================================================================
+#  Profiling
+# =================================================================================================
+def profile_memory(
+    f: Callable,
+    n_executions: int,
+    setup: Callable[[], Any] | None = None,
+    teardown: Callable[[], Any] | None = None,
+) -> MemoryProfile:
+    """
+    Profile memory usage of n_executions separate executions of f using tracemalloc.  Tracing slows down execution
+    considerably, which is why this should not be combined with timing measurements.
+
+    Optional setup & teardown hooks are called before & after each execution, outside of the profiled region.
+    """
+
+    # --- init --------------------------------------------
+    was_tracing = tracemalloc.is_tracing()
+    if not was_tracing:
+        tracemalloc.start()
+    own_allocations = tracemalloc.Filter(inclusive=False, filename_pattern=tracemalloc.__file__)
+
+    peak_bytes, net_bytes, net_blocks, gc_collections = [], [], [], []
+
+    # --- profile -----------------------------------------
+    try:
+        for _ in range(n_executions):
+            if setup is not None:
+                setup()
+            snapshot_before = tracemalloc.take_snapshot().filter_traces([own_allocations])
+            n_collections_before = _n_gc_collections()
+            tracemalloc.reset_peak()
+            size_before, _ = tracemalloc.get_traced_memory()
+
+            f()
+
+            _, size_peak = tracemalloc.get_traced_memory()
+            n_collections_after = _n_gc_collections()
+            snapshot_after = tracemalloc.take_snapshot().filter_traces([own_allocations])
+
+            peak_bytes.append(max(0, size_peak - size_before))
+            net_bytes.append(sum(stat.size_diff for stat in snapshot_after.compare_to(snapshot_before, "filename")))
+            net_blocks.append(sum(stat.count_diff for stat in snapshot_after.compare_to(snapshot_before, "filename")))
+            gc_collections.append(n_collections_after - n_collections_before)
+            if teardown is not None:
+                teardown()
+    finally:
+        if not was_tracing:
+            tracemalloc.stop()
+
+    # --- return results ----------------------------------
+    return MemoryProfile(
+        peak_bytes=np.array(peak_bytes),
+        net_bytes=np.array(net_bytes),
+        net_blocks=np.array(net_blocks),
+        gc_collections=np.array(gc_collections),
+    )
+
+
+# =================================================================================================
+#  Helpers
+# =================================================================================================
+def _n_gc_collections() -> int:
+    return sum(stats["collections"] for stats in gc.get_stats())
+
+
+def _format_bytes(n_bytes: float) -> str:
+    for unit in ["B", "KB", "MB", "GB"]:
+        if abs(n_bytes) < 1024 or unit == "GB":
+            return f"{n_bytes:.0f} {unit}" if unit == "B" else f"{n_bytes:.1f} {unit}"
+        n_bytes /= 1024
@@ -1,10 +1,13 @@
-from typing import Callable
+from typing import Any, Callable
 
 import numpy as np
 
 from brtp.formatting._time_duration import format_short_time_duration
 from brtp.math.utils._clip import clip
 
+from ._benchmark_result import BenchmarkResult
+from ._memory_profile import MemoryProfile
+from ._memory_profile import profile_memory as _profile_memory
 from ._timer import Timer
 
 
@@ -17,46 +20,77 @@ def benchmark(
     n_warmup: int = 10,
     n_benchmark: int = 30,
     silent: bool = False,
-) -> float:
+    return_result: bool = False,
+    profile_memory: bool = False,
+    setup: Callable[[], Any] | None = None,
+    teardown: Callable[[], Any] | None = None,
+    setup_execution: Callable[[], Any] | None = None,
+    teardown_execution: Callable[[], Any] | None = None,
+    arg_provider: Callable[[], Any] | None = None,
+) -> float | BenchmarkResult:
     """
     Adaptive micro-benchmarking function, to determine the duration/execution of the provided callable `f`.
 
-    :param f: (Callable) Function to benchmark. Should take no arguments.
-    :param t_per_run: (float, default=0.1) time in seconds we want to target per benchmarking run.
-                      # of executions/run is adjusted to meet this target.
+    Hooks & inputs are prepared outside the timed region, which allows benchmarking in-place or state-mutating
+    operations, e.g. for sorting a fresh copy of an array in each execution:
+
+        benchmark(lambda x: x.sort(), arg_provider=lambda: values.copy())
+
+    :param f: (Callable) Function to benchmark. Should take no arguments, or 1 argument if arg_provider is provided.
+    :param t_per_run: (float, default=0.1) time in seconds we want to target per benchmarking run, including any
+                      hooks & input generation.  # of executions/run is adjusted to meet this target.
     :param n_warmup: (int, default=10) Number of warmup runs to perform before benchmarking.
     :param n_benchmark: (int, default=30) Number of benchmark runs to perform.
     :param silent: (bool, default=False) If True, suppresses any output during benchmarking.
-    :return: Median estimate of duration/execution of `f` in seconds.
+    :param return_result: (bool, default=False) If True, a BenchmarkResult is returned with all per-run timings,
+                          allowing to compute quantiles, confidence intervals, outliers, ...
+    :param profile_memory: (bool, default=False) If True, n_benchmark additional executions are profiled after the
+                           timed runs, measuring peak memory, net allocated memory & blocks (using tracemalloc) and
+                           garbage collections per execution.  Results are printed & available as
+                           BenchmarkResult.memory;  timings are not affected.
+    :param setup: (Callable, optional) called before each run (untimed).
+    :param teardown: (Callable, optional) called after each run (untimed).
+    :param setup_execution: (Callable, optional) called before each execution (untimed).  Executions are then timed
+                            individually, which adds some overhead that is subtracted using the baseline, but makes
+                            results less accurate for functions taking less than ~1µs.
+    :param teardown_execution: (Callable, optional) called after each execution (untimed), see setup_execution.
+    :param arg_provider: (Callable, optional) called before each run (untimed) to generate 1 input per execution,
+                         which is passed to f as its only argument.
+    :return: Median estimate of duration/execution of `f` in seconds, or BenchmarkResult if return_result=True.
     """
 
     # --- init --------------------------------------------
     lst_t = []  # list of measured times per execution in seconds
+    lst_n_executions = []  # list of number of executions per run
+    lst_t_baseline = []  # list of measured baseline times per execution in seconds
     n_executions = 1  # number of executions per run, adjusted dynamically
-    f_baseline = _baseline_fun  # baseline function to subtract overhead
+    f_baseline = _baseline_fun if arg_provider is None else _baseline_fun_arg  # baseline function to subtract overhead
 
     if not silent:
         print("Benchmarking: ", end="")
 
     # --- main loop ---------------------------------------
     for i in range(n_warmup + n_benchmark):
-        # run
         with Timer() as timer_tot:
-            # baseline
-            with Timer() as timer_baseline:
-                for _ in range(n_executions):
-                    f_baseline()
-            t_baseline = timer_baseline.t_elapsed_sec()
+            # prepare
+            if setup is not None:
+                setup()
+            inputs = None if arg_provider is None else [arg_provider() for _ in range(n_executions)]
 
-            # actual function
-            with Timer() as timer_f:
-                for _ in range(n_executions):
-                    f()
-            t_f = timer_f.t_elapsed_sec()
+            # run
+            t_baseline = _time_executions(f_baseline, n_executions, inputs, setup_execution, teardown_execution)
+            t_f = _time_executions(f, n_executions, inputs, setup_execution, teardown_execution)
+
+            # clean up
+            del inputs
+            if teardown is not None:
+                teardown()
 
         # store results of benchmark runs
         if i >= n_warmup:
             lst_t.append(abs(t_f - t_baseline) / n_executions)  # abs value to avoid negative times for very fast 'f'.
+            lst_n_executions.append(n_executions)
+            lst_t_baseline.append(t_baseline / n_executions)
             if not silent:
                 print(".", end="")
         else:
@@ -64,14 +98,8 @@ def benchmark(
                 print("w", end="")
 
         # adjust n_executions
-        t_tot = timer_tot.t_elapsed_sec()
-        n_executions = round(
-            clip(
-                value=n_executions * (t_per_run / t_tot),
-                min_value=max(1.0, n_executions / 10),
-                max_value=n_executions * 10,
-            )
-        )
+        #   (based on total wall time, including untimed hooks & input generation, such that runs take ~t_per_run)
+        n_executions = _adjust_n_executions(n_executions, t_per_run, t_tot=timer_tot.t_elapsed_sec())
 
     # --- finalize ----------------------------------------
     q25, q50, q75 = np.percentile(lst_t, [25, 50, 75])
@@ -80,8 +108,104 @@ def benchmark(
     if not silent:
         print(f"   {s_median} ± {s_perc} per execution")
 
-    # --- return median -----------------------------------
-    return float(q50)
+    # --- memory profiling --------------------------------
+    memory = None
+    if profile_memory:
+        memory = _profile_memory_with_hooks(
+            f, n_benchmark, setup, teardown, setup_execution, teardown_execution, arg_provider
+        )
+        if not silent:
+            print(f"Memory:       {memory}")
+
+    # --- return result -----------------------------------
+    if return_result:
+        return BenchmarkResult(
+            t_sec=np.array(lst_t),
+            n_executions=np.array(lst_n_executions),
+            t_baseline_sec=np.array(lst_t_baseline),
+            memory=memory,
+        )
+    else:
+        return float(q50)
+
+
+# =================================================================================================
+#  Helpers
+# =================================================================================================
+def _adjust_n_executions(n_executions: int, t_per_run: float, t_tot: float) -> int:
+    """Number of executions for the next run, such that it takes ~t_per_run, changing by at most a factor 10."""
+    return round(
+        clip(
+            value=n_executions * (t_per_run / t_tot),
+            min_value=max(1.0, n_executions / 10),
+            max_value=n_executions * 10,
+        )
+    )
+
+
+def _time_executions(
+    f: Callable,
+    n_executions: int,
+    inputs: list | None,
+    setup_execution: Callable[[], Any] | None,
+    teardown_execution: Callable[[], Any] | None,
+) -> float:
+    """Total duration in seconds of n_executions executions of f, excluding per-execution hooks."""
+    if (setup_execution is None) and (teardown_execution is None):
+        # time all executions at once
+        with Timer() as timer:
+            if inputs is None:
+                for _ in range(n_executions):
+                    f()
+            else:
+                for arg in inputs:
+                    f(arg)
+        return timer.t_elapsed_sec()
+    else:
+        # time each execution individually
+        t_nsec = 0
+        for i in range(n_executions):
+            if setup_execution is not None:
+                setup_execution()
+            with Timer() as timer:
+                if inputs is None:
+                    f()
+                else:
+                    f(inputs[i])
+            t_nsec += timer.t_elapsed_nsec()
+            if teardown_execution is not None:
+                teardown_execution()
+        return t_nsec / 1e9
+
+
+def _profile_memory_with_hooks(
+    f: Callable,
+    n_executions: int,
+    setup: Callable[[], Any] | None,
+    teardown: Callable[[], Any] | None,
+    setup_execution: Callable[[], Any] | None,
+    teardown_execution: Callable[[], Any] | None,
+    arg_provider: Callable[[], Any] | None,
+) -> MemoryProfile:
+    """profile_memory() for f, with all hooks & input generation happening outside of the profiled executions."""
+    current_input = []
+
+    def before_execution():
+        if setup_execution is not None:
+            setup_execution()
+        if arg_provider is not None:
+            current_input[:] = [arg_provider()]
+
+    def execute():
+        return f() if arg_provider is None else f(current_input[0])
+
+    if setup is not None:
+        setup()
+    try:
+        return _profile_memory(execute, n_executions, setup=before_execution, teardown=teardown_execution)
+    finally:
+        if teardown is not None:
+            teardown()
 
 
 # =================================================================================================
@@ -89,3 +213,7 @@ def benchmark(
 # =================================================================================================
 def _baseline_fun():
     pass
+
+
+def _baseline_fun_arg(arg):
+    pass
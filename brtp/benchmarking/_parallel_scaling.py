@@ -0,0 +1,272 @@
+import math
+import multiprocessing
+import multiprocessing.connection
+import pickle
+import threading
+import time
+import traceback
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable
+
+import numpy as np
+
+from brtp.formatting._time_duration import format_short_time_duration
+
+from ._discovery import _import_file
+from ._isolation import _module_files, available_cpus
+
+_MAX_LATENCIES_PER_RUN = 1000  # max. number of latencies kept per worker per run (uniformly subsampled)
+
+
+# =================================================================================================
+#  Results
+# =================================================================================================
+@dataclass(frozen=True)
+class ParallelLevelResult:
+    """Measurements for 1 level of parallelism, i.e. f called continuously from n_workers threads or processes."""
+
+    n_workers: int
+    throughput: np.ndarray  # aggregate number of calls/sec of each benchmark run
+    latency_sec: np.ndarray = field(repr=False)  # (subsampled) duration of individual calls across all runs & workers
+
+    @property
+    def median_throughput(self) -> float:
+        return float(np.median(self.throughput))
+
+    def latency_quantiles(self, q: list[float] | np.ndarray) -> list[float]:
+        """Quantiles (q in [0, 1]) of the latency per call in seconds."""
+        return [float(v) for v in np.quantile(self.latency_sec, q)]
+
+
+@dataclass(frozen=True)
+class ParallelScalingResult:
+    """Result of benchmark_parallel, with 1 ParallelLevelResult per number of workers (in increasing order)."""
+
+    use_processes: bool
+    levels: list[ParallelLevelResult]
+
+    @property
+    def n_workers(self) -> np.ndarray:
+        return np.array([level.n_workers for level in self.levels])
+
+    @property
+    def throughput(self) -> np.ndarray:
+        """Median aggregate throughput (calls/sec) for each number of workers."""
+        return np.array([level.median_throughput for level in self.levels])
+
+    @property
+    def speedup(self) -> np.ndarray:
+        """Throughput relative to the single-worker throughput, for each number of workers."""
+        return self.throughput / self.levels[0].median_throughput
+
+    @property
+    def efficiency(self) -> np.ndarray:
+        """Parallel efficiency, i.e. speedup / n_workers, for each number of workers;  1.0 = perfect scaling."""
+        return self.speedup / self.n_workers
+
+    def __str__(self) -> str:
+        worker_type = "processes" if self.use_processes else "threads"
+        lines = [f"{worker_type:>9} | {'throughput':>14} | speedup | efficiency | {'latency p50':>13} | {'p99':>13}"]
+        for level, speedup, efficiency in zip(self.levels, self.speedup, self.efficiency):
+            p50, p99 = level.latency_quantiles([0.5, 0.99])
+            lines.append(
+                f"{level.n_workers:>9} | {level.median_throughput:>12.1f}/s | {speedup:>6.2f}x | "
+                f"{100 * efficiency:>9.1f}% | {_format(p50):>13} | {_format(p99):>13}"
+            )
+        return "\n".join(lines)
+
+
+def _format(t_sec: float) -> str:
+    return format_short_time_duration(dt_sec=t_sec, right_aligned=True, spaced=True, long_units=True)
+
+
+# =================================================================================================
+#  Main function
+# =================================================================================================
+def benchmark_parallel(
+    f: Callable,
+    n_workers: list[int] | None = None,
+    use_processes: bool = False,
+    t_per_run: float = 0.1,
+    n_warmup: int = 2,
+    n_benchmark: int = 10,
+    silent: bool = False,
+) -> ParallelScalingResult:
+    """
+    Benchmark how the throughput of f scales when calling it simultaneously from 1, 2, 4, ... threads (or processes).
+
+    For each number of workers, n_warmup + n_benchmark runs are performed, during which all workers start at the same
+    time & call f continuously for t_per_run seconds.  Each call is timed individually, so results are only
+    meaningful for functions taking more than a few µs.
+
+    Threads only scale for code releasing the GIL (e.g. most numpy routines, numba with nogil=True) or on
+    free-threaded python builds.  With use_processes=True, f should be picklable (see benchmark_isolated()).
+
+    :param f: (Callable) Function to benchmark. Should take no arguments.
+    :param n_workers: (list of int, optional) numbers of workers to benchmark;  1 is always included, as baseline.
+                      Default: 1, 2, 4, ... up to the number of available cores (which is included as well).
+    :param use_processes: (bool, default=False) If True, workers are separate processes instead of threads.
+    :param t_per_run: (float, default=0.1) duration of each run in seconds.
+    :param n_warmup: (int, default=2) number of warmup runs per number of workers.
+    :param n_benchmark: (int, default=10) number of benchmark runs per number of workers.
+    :param silent: (bool, default=False) If True, suppresses any output during benchmarking.
+    :return: ParallelScalingResult object.
+    """
+
+    # --- init --------------------------------------------
+    if n_workers is None:
+        n_cpus = len(available_cpus())
+        n_workers = [2**i for i in range(int(math.log2(n_cpus)) + 1)] + [n_cpus]
+    n_workers = sorted({1, *n_workers})
+    if n_workers[0] < 1:
+        raise ValueError(f"n_workers should be >= 1, got {n_workers}.")
+
+    run_workers = _run_processes if use_processes else _run_threads
+
+    # --- benchmark ---------------------------------------
+    levels = []
+    for n in n_workers:
+        if not silent:
+            print(f"Benchmarking with n_workers={n} ({'processes' if use_processes else 'threads'})...")
+        worker_results = run_workers(f, n, n_warmup + n_benchmark, t_per_run)
+        levels.append(_level_result(n, worker_results, n_warmup))
+
+    # --- return result -----------------------------------
+    result = ParallelScalingResult(use_processes=use_processes, levels=levels)
+    if not silent:
+        print(result)
+    return result
+
+
+def _level_result(n_workers: int, worker_results: list[list[tuple]], n_warmup: int) -> ParallelLevelResult:
+    """Combine per-worker, per-run (n_calls, t_start_nsec, t_end_nsec, latency_nsec) tuples into 1 result."""
+    throughput, latency_nsec = [], []
+    for run_results in list(zip(*worker_results))[n_warmup:]:
+        n_calls = sum(r[0] for r in run_results)
+        t_wall_nsec = max(r[2] for r in run_results) - min(r[1] for r in run_results)
+        throughput.append(1e9 * n_calls / t_wall_nsec)
+        latency_nsec.extend(lat for r in run_results for lat in r[3])
+    return ParallelLevelResult(
+        n_workers=n_workers,
+        throughput=np.array(throughput),
+        latency_sec=np.array(latency_nsec) / 1e9,
+    )
+
+
+# =================================================================================================
+#  Workers
+# =================================================================================================
+def _worker_loop(f: Callable, barrier, n_runs: int, t_per_run: float) -> list[tuple]:
+    """
+    Perform n_runs runs, each starting when all workers are ready & calling f continuously for t_per_run seconds.
+    Returns list of (n_calls, t_start_nsec, t_end_nsec, latency_nsec) tuples, 1 per run.
+    """
+    try:
+        results = []
+        for _ in range(n_runs):
+            latency_nsec = []
+            barrier.wait()
+            t_start = time.perf_counter_ns()
+            t_deadline = t_start + round(1e9 * t_per_run)
+            t_end = t_start
+            while t_end < t_deadline:
+                t_call = time.perf_counter_ns()
+                f()
+                t_end = time.perf_counter_ns()
+                latency_nsec.append(t_end - t_call)
+            stride = math.ceil(len(latency_nsec) / _MAX_LATENCIES_PER_RUN)
+            results.append((len(latency_nsec), t_start, t_end, latency_nsec[::stride]))
+        return results
+    except BaseException:
+        barrier.abort()  # make sure other workers don't wait forever
+        raise
+
+
+def _run_threads(f: Callable, n_workers: int, n_runs: int, t_per_run: float) -> list[list[tuple]]:
+    barrier = threading.Barrier(n_workers)
+    results = [None] * n_workers
+    errors = []
+
+    def target(i: int):
+        try:
+            results[i] = _worker_loop(f, barrier, n_runs, t_per_run)
+        except threading.BrokenBarrierError:
+            pass  # another worker failed
+        except BaseException as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=target, args=(i,), daemon=True) for i in range(n_workers)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    if errors:
+        raise errors[0]
+    return results
+
+
+def _run_processes(f: Callable, n_workers: int, n_runs: int, t_per_run: float) -> list[list[tuple]]:
+    context = multiprocessing.get_context("spawn")
+    barrier = context.Barrier(n_workers)
+    f_pickled, module_files = pickle.dumps(f), _module_files(f)
+
+    connections, processes = [], []
+    try:
+        for _ in range(n_workers):
+            conn_parent, conn_child = context.Pipe(duplex=False)
+            process = context.Process(
+                target=_process_worker,
+                args=(conn_child, barrier, f_pickled, module_files, n_runs, t_per_run),
+                daemon=True,
+            )
+            process.start()
+            conn_child.close()
+            connections.append(conn_parent)
+            processes.append(process)
+
+        results, errors = [], []
+        for conn, process in zip(connections, processes):
+            try:
+                success, value = conn.recv()
+            except EOFError:
+                process.join()
+                success, value = False, f"process exited unexpectedly with exit code {process.exitcode}."
+            if success:
+                results.append(value)
+            elif value is not None:
+                errors.append(value)
+    finally:
+        for conn, process in zip(connections, processes):
+            conn.close()
+            process.join(timeout=1)
+            if process.is_alive():
+                process.terminate()
+                process.join()
+
+    if errors:
+        raise RuntimeError(f"Parallel benchmark failed in worker process:\n{errors[0]}")
+    return results
+
+
+def _process_worker(
+    conn: multiprocessing.connection.Connection,
+    barrier,
+    f_pickled: bytes,
+    module_files: dict[str, str],
+    n_runs: int,
+    t_per_run: float,
+):
+    try:
+        for file in module_files.values():
+            _import_file(Path(file))
+        f = pickle.loads(f_pickled)
+        conn.send((True, _worker_loop(f, barrier, n_runs, t_per_run)))
+    except threading.BrokenBarrierError:
+        conn.send((False, None))  # another worker failed
+    except BaseException:
+        barrier.abort()
+        conn.send((False, traceback.format_exc()))
+    finally:
+        conn.close()
@@ -0,0 +1,317 @@
+import contextvars
+import functools
+import itertools
+import threading
+import time
+import weakref
+from dataclasses import dataclass, field
+from typing import Callable
+
+from brtp.formatting._time_duration import format_time_duration
+
+
+# =================================================================================================
+#  RegionStats
+# =================================================================================================
+@dataclass(frozen=True)
+class RegionStats:
+    """Aggregated statistics of a named region at a specific position in the call tree (all threads combined)."""
+
+    name: str
+    count: int
+    total_sec: float  # total time spent in this region
+    self_sec: float  # total time spent in this region, excluding time spent in child regions
+    min_sec: float
+    max_sec: float
+    children: list["RegionStats"] = field(default_factory=list)
+
+    @property
+    def mean_sec(self) -> float:
+        return self.total_sec / self.count if self.count > 0 else 0.0
+
+    def find(self, *path: str) -> "RegionStats | None":
+        """Find descendant by path of region names, e.g. stats.find('load', 'parse')."""
+        node = self
+        for name in path:
+            node = next((child for child in node.children if child.name == name), None)
+            if node is None:
+                return None
+        return node
+
+
+# =================================================================================================
+#  Profiler
+# =================================================================================================
+class Profiler:
+    """
+    Low-overhead, hierarchical profiler of named regions, using the same clock as Timer.
+
+    Regions can be nested & are aggregated as a call tree, i.e. the same region name at different positions in the
+    tree is reported separately.  Each thread records in its own tree (without locking), which are merged when
+    requesting results using tree() or report();  trees of finished threads are merged into a shared tree.
+
+    The stack of active regions is kept in a context variable, such that regions in concurrent asyncio tasks are
+    attributed to the region in which the task was created, rather than to each other.
+
+    When disabled, region() returns a shared no-op context manager, such that regions can be left in hot paths.
+
+    Example:
+
+        profiler = Profiler()
+
+        with profiler.region("aggregate"):
+            with profiler.region("sort"):
+                ...
+
+        @profiler.region("load")
+        def load(): ...
+
+        print(profiler.report())
+    """
+
+    # --- constructor -------------------------------------
+    def __init__(self, enabled: bool = True):
+        self.enabled = enabled
+        self._local = threading.local()
+        self._lock = threading.RLock()
+        self._frame = contextvars.ContextVar(f"brtp_profiler_{id(self)}", default=None)  # innermost active region
+        self._roots: dict[int, _Node] = dict()  # root node of each live thread that recorded regions
+        self._retired = _Node("")  # merged trees of finished threads
+        self._thread_keys = itertools.count()
+        self._regions: dict[str, _Region] = dict()  # name -> (stateless, reusable) region
+        self._null_regions: dict[str, _NullRegion] = dict()  # name -> no-op region, used when disabled
+
+    # --- enable / disable --------------------------------
+    def enable(self):
+        self.enabled = True
+
+    def disable(self):
+        self.enabled = False
+
+    # --- regions -----------------------------------------
+    def region(self, name: str) -> "_Region | _NullRegion":
+        """Named region, to be used as a context manager or as a decorator."""
+        regions = self._regions if self.enabled else self._null_regions
+        try:
+            return regions[name]
+        except KeyError:
+            return regions.setdefault(name, (_Region if self.enabled else _NullRegion)(self, name))
+
+    def _current_frame(self) -> tuple:
+        """
+        Innermost active (node, t_start_nsec, parent_frame, thread_id)-frame of the current context, or the root frame
+        of the current thread if none (or if it was inherited from a context of another thread, e.g. asyncio.to_thread).
+        """
+        frame = self._frame.get()
+        if (frame is not None) and (frame[3] == threading.get_ident()):
+            return frame
+        try:
+            return self._local.thread_root.frame
+        except AttributeError:
+            thread_root = self._local.thread_root = _ThreadRoot()
+            key = next(self._thread_keys)
+            with self._lock:
+                self._roots[key] = thread_root.frame[0]
+            # merge into the shared tree as soon as the thread finishes (i.e. its thread-local data is released)
+            weakref.finalize(thread_root, _retire, self._lock, self._roots, self._retired, key)
+            return thread_root.frame
+
+    # --- results -----------------------------------------
+    def reset(self):
+        """Discard all recorded statistics (regions that are active at this time will not be recorded)."""
+        with self._lock:
+            for root in [*self._roots.values(), self._retired]:
+                root.children = dict()
+
+    def tree(self) -> list[RegionStats]:
+        """Statistics of all top-level regions, with their child regions, merged across all threads."""
+        with self._lock:
+            roots = [self._retired, *self._roots.values()]
+            return _merge([child for root in roots for child in list(root.children.values())])
+
+    def report(self) -> str:
+        """Tree of all regions with their statistics, formatted as a table."""
+        lines = [
+            f"{'region':<40} {'count':>10} {'total':>10} {'self':>10} {'mean':>10} {'min':>10} {'max':>10}",
+        ]
+
+        def add_lines(stats: RegionStats, depth: int):
+            lines.append(
+                f"{('  ' * depth + stats.name):<40} {stats.count:>10} "
+                + " ".join(
+                    format_time_duration(t)
+                    for t in [stats.total_sec, stats.self_sec, stats.mean_sec, stats.min_sec, stats.max_sec]
+                )
+            )
+            for child in stats.children:
+                add_lines(child, depth + 1)
+
+        for stats in self.tree():
+            add_lines(stats, 0)
+        return "\n".join(lines)
+
+
+# =================================================================================================
+#  Regions
+# =================================================================================================
+class _Region:
+    """Context manager & decorator recording a named region;  all state is kept in the profiler's per-thread stack."""
+
+    __slots__ = ("_profiler", "_name")
+
+    def __init__(self, profiler: Profiler, name: str):
+        self._profiler = profiler
+        self._name = name
+
+    def __enter__(self):
+        parent = self._profiler._current_frame()
+        node = parent[0].children.get(self._name)
+        if node is None:
+            node = parent[0].children[self._name] = _Node(self._name)
+        self._profiler._frame.set((node, time.perf_counter_ns(), parent, parent[3]))
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        t_end = time.perf_counter_ns()
+        frame = self._profiler._frame.get()
+        if (frame is None) or (frame[0].name != self._name):
+            return  # not the innermost region of this context (e.g. exited in another task) -> ignore
+        node, t_start, parent, _ = frame
+        node.record(t_end - t_start)
+        parent[0].child_nsec += t_end - t_start
+        self._profiler._frame.set(parent)
+
+    def __call__(self, f: Callable) -> Callable:
+        return _decorate(self._profiler, self._name, f)
+
+
+class _NullRegion:
+    """No-op region returned by a disabled profiler."""
+
+    __slots__ = ("_profiler", "_name")
+
+    def __init__(self, profiler: Profiler, name: str):
+        self._profiler = profiler
+        self._name = name
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        pass
+
+    def __call__(self, f: Callable) -> Callable:
+        return _decorate(self._profiler, self._name, f)
+
+
+def _decorate(profiler: Profiler, name: str, f: Callable) -> Callable:
+    # the region is resolved at each call, such that the profiler can be enabled/disabled after decorating
+    @functools.wraps(f)
+    def wrapper(*args, **kwargs):
+        if not profiler.enabled:
+            return f(*args, **kwargs)
+        with profiler.region(name):
+            return f(*args, **kwargs)
+
+    return wrapper
+
+
+# =================================================================================================
+#  Call tree
+# =================================================================================================
+class _ThreadRoot:
+    """Root frame of the call tree of a single thread, stored in thread-local data & released when the thread ends."""
+
+    __slots__ = ("frame", "__weakref__")
+
+    def __init__(self):
+        self.frame = (_Node(""), 0, None, threading.get_ident())
+
+
+def _retire(lock: threading.RLock, roots: dict[int, "_Node"], retired: "_Node", key: int):
+    """Move the tree of a finished thread into the shared tree of retired threads."""
+    with lock:
+        retired.absorb(roots.pop(key))
+
+
+class _Node:
+    """Mutable statistics of a region in the call tree of a single thread."""
+
+    __slots__ = ("name", "children", "count", "total_nsec", "child_nsec", "min_nsec", "max_nsec")
+
+    def __init__(self, name: str):
+        self.name = name
+        self.children: dict[str, _Node] = dict()
+        self.count = 0
+        self.total_nsec = 0
+        self.child_nsec = 0
+        self.min_nsec = 0
+        self.max_nsec = 0
+
+    def record(self, dt_nsec: int):
+        if self.count == 0:
+            self.min_nsec = self.max_nsec = dt_nsec
+        else:
+            self.min_nsec = min(self.min_nsec, dt_nsec)
+            self.max_nsec = max(self.max_nsec, dt_nsec)
+        self.count += 1
+        self.total_nsec += dt_nsec
+
+    def absorb(self, other: "_Node"):
+        """Add statistics of other (incl. its children) to this node;  other should no longer be recorded into."""
+        if other.count > 0:
+            self.min_nsec = other.min_nsec if self.count == 0 else min(self.min_nsec, other.min_nsec)
+            self.max_nsec = other.max_nsec if self.count == 0 else max(self.max_nsec, other.max_nsec)
+        self.count += other.count
+        self.total_nsec += other.total_nsec
+        self.child_nsec += other.child_nsec
+        for name, child in other.children.items():
+            if name in self.children:
+                self.children[name].absorb(child)
+            else:
+                self.children[name] = child
+
+
+def _merge(nodes: list[_Node]) -> list[RegionStats]:
+    """Merge nodes with identical names (from different threads) into RegionStats, in order of first appearance."""
+    groups: dict[str, list[_Node]] = dict()
+    for node in nodes:
+        groups.setdefault(node.name, []).append(node)
+
+    result = []
+    for name, group in groups.items():
+        recorded = [node for node in group if node.count > 0]
+        total_nsec = sum(node.total_nsec for node in group)
+        result.append(
+            RegionStats(
+                name=name,
+                count=sum(node.count for node in group),
+                total_sec=total_nsec / 1e9,
+                self_sec=(total_nsec - sum(node.child_nsec for node in group)) / 1e9,
+                min_sec=min([node.min_nsec for node in recorded], default=0) / 1e9,
+                max_sec=max([node.max_nsec for node in recorded], default=0) / 1e9,
+                children=_merge([child for node in group for child in list(node.children.values())]),
+            )
+        )
+    return result
+
+
+# =================================================================================================
+#  Global profiler
+# =================================================================================================
+profiler = Profiler(enabled=False)
+
+
+def profile(name: str) -> _Region | _NullRegion:
+    """
+    Named region of the global profiler (disabled by default), to be used as a context manager or decorator:
+
+        with profile("aggregate"):
+            ...
+
+        @profile("load")
+        def load(): ...
+
+    Enable using profiler.enable() & dump the call tree using print(profiler.report()).
+    """
+    return profiler.region(name)
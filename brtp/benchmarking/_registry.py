@@ -0,0 +1,144 @@
+import fnmatch
+import functools
+import itertools
+import threading
+from dataclasses import dataclass, field
+from typing import Any, Callable, Iterable, Sequence
+
+
+# =================================================================================================
+#  Benchmark definitions
+# =================================================================================================
+@dataclass(frozen=True)
+class BenchmarkCase:
+    """Single benchmark to be run, i.e. a registered benchmark function with 1 specific combination of parameters."""
+
+    name: str  # full name, e.g. 'caching/lookup[n=10]'
+    group: str
+    func: Callable
+    params: dict[str, Any] = field(default_factory=dict)
+
+    def as_callable(self) -> Callable:
+        """Zero-argument callable to be benchmarked."""
+        return functools.partial(self.func, **self.params) if self.params else self.func
+
+
+@dataclass(frozen=True)
+class RegisteredBenchmark:
+    """Benchmark function registered using @register_benchmark, possibly with a grid of parameters."""
+
+    name: str
+    group: str
+    func: Callable
+    params: dict[str, Sequence] = field(default_factory=dict)
+
+    @property
+    def full_name(self) -> str:
+        return f"{self.group}/{self.name}"
+
+    def cases(self) -> list[BenchmarkCase]:
+        """All cases of this benchmark, one per combination of parameter values (cartesian product)."""
+        if not self.params:
+            return [BenchmarkCase(self.full_name, self.group, self.func)]
+
+        cases = []
+        for values in itertools.product(*self.params.values()):
+            params = dict(zip(self.params.keys(), values))
+            s_params = ",".join(f"{k}={v}" for k, v in params.items())
+            cases.append(BenchmarkCase(f"{self.full_name}[{s_params}]", self.group, self.func, params))
+        return cases
+
+
+# =================================================================================================
+#  BenchmarkRegistry
+# =================================================================================================
+class BenchmarkRegistry:
+    """
+    Registry of benchmark functions, organized in groups.
+
+    The global instance benchmark_registry is used by @register_benchmark and by the command-line runner
+    (python -m brtp.benchmarking).
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._benchmarks: dict[str, RegisteredBenchmark] = dict()  # full name -> benchmark
+
+    def register(self, benchmark: RegisteredBenchmark):
+        """Register benchmark;  a benchmark with the same group & name is replaced (e.g. when reloading modules)."""
+        with self._lock:
+            self._benchmarks[benchmark.full_name] = benchmark
+
+    def groups(self) -> list[str]:
+        with self._lock:
+            return sorted({b.group for b in self._benchmarks.values()})
+
+    def benchmarks(self) -> list[RegisteredBenchmark]:
+        with self._lock:
+            return [self._benchmarks[name] for name in sorted(self._benchmarks)]
+
+    def cases(self, groups: Iterable[str] | None = None, pattern: str | None = None) -> list[BenchmarkCase]:
+        """
+        Return all benchmark cases, optionally filtered by group and/or by a glob-style pattern (e.g. '*lookup*')
+        matched against the full case name.
+        """
+        groups = None if groups is None else set(groups)
+        return [
+            case
+            for benchmark in self.benchmarks()
+            if (groups is None) or (benchmark.group in groups)
+            for case in benchmark.cases()
+            if (pattern is None) or fnmatch.fnmatchcase(case.name, pattern)
+        ]
+
+    def clear(self):
+        with self._lock:
+            self._benchmarks.clear()
+
+
+benchmark_registry = BenchmarkRegistry()
+
+
+# =================================================================================================
+#  Decorator
+# =================================================================================================
+def register_benchmark(
+    func: Callable | None = None,
+    *,
+    name: str | None = None,
+    group: str = "default",
+    params: dict[str, Sequence] | None = None,
+    registry: BenchmarkRegistry | None = None,
+):
+    """
+    Decorator registering a function as a benchmark, to be run using run_benchmarks or the command-line runner
+    (python -m brtp.benchmarking).  The decorated function itself is returned unchanged.
+
+    With params provided, the function is benchmarked for each combination of parameter values, which are passed
+    as keyword arguments.  Each combination results in a separate case, named e.g. 'group/name[n=10,method=a]'.
+
+    Example:
+
+        @register_benchmark(group="aggregation", params=dict(n=[10, 1000]))
+        def bench_ema(n: int):
+            ema(values[:n], c=0.1)
+
+    :param func: (Callable) function to be benchmarked.
+    :param name: (str, optional) name of the benchmark.  Default: the function's name.
+    :param group: (str, default='default') group the benchmark belongs to.
+    :param params: (dict, optional) mapping each parameter name to a sequence of values.
+    :param registry: (BenchmarkRegistry, optional) registry to register in.  Default: the global benchmark_registry.
+    """
+
+    def decorator(wrapped: Callable) -> Callable:
+        (registry or benchmark_registry).register(
+            RegisteredBenchmark(
+                name=name or wrapped.__name__,
+                group=group,
+                func=wrapped,
+                params={k: list(v) for k, v in (params or dict()).items()},
+            )
+        )
+        return wrapped
+
+    return decorator if func is None else decorator(func)
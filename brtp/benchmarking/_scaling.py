@@ -0,0 +1,184 @@
+import math
+from dataclasses import dataclass, field
+from typing import Any, Callable
+
+import numpy as np
+
+from brtp.math.sampling import logspace
+
+from ._micro_benchmark import benchmark
+
+# =================================================================================================
+#  Complexity models
+# =================================================================================================
+# name -> g(n), for models of the form  t(n) = a + b*g(n)
+_LINEAR_MODELS: dict[str, Callable[[np.ndarray], np.ndarray]] = {
+    "O(1)": lambda n: np.zeros_like(n),
+    "O(log n)": lambda n: np.log(n),
+    "O(n)": lambda n: n,
+    "O(n log n)": lambda n: n * np.log(n),
+}
+_POWER_LAW_MODEL = "O(n^k)"
+
+
+@dataclass(frozen=True)
+class ComplexityFit:
+    """
+    Least-squares fit of a complexity model to measured durations, minimizing relative errors.
+      - for O(1), O(log n), O(n), O(n log n):  t(n) = a + b*g(n), with a, b >= 0
+      - for O(n^k):                            t(n) = a * n^b
+    """
+
+    model: str
+    a: float
+    b: float
+    rel_error: float  # root-mean-square relative error of the fit
+
+    def predict(self, n: float | np.ndarray) -> float | np.ndarray:
+        n = np.asarray(n, dtype=float)
+        if self.model == _POWER_LAW_MODEL:
+            return self.a * n**self.b
+        else:
+            return self.a + self.b * _LINEAR_MODELS[self.model](n)
+
+
+def fit_complexity(sizes: np.ndarray, t_sec: np.ndarray) -> dict[str, ComplexityFit]:
+    """Fit all complexity models to durations t_sec measured for the given sizes;  returns dict model -> fit."""
+    n = np.asarray(sizes, dtype=float)
+    t = np.asarray(t_sec, dtype=float)
+
+    fits = {model: _fit_linear_model(model, g(n), t) for model, g in _LINEAR_MODELS.items()}
+
+    # power law: linear regression in log-log space
+    b, log_a = np.polyfit(np.log(n), np.log(t), deg=1)
+    fits[_POWER_LAW_MODEL] = ComplexityFit(
+        _POWER_LAW_MODEL, math.exp(log_a), float(b), _rel_error(t, np.exp(log_a) * n**b)
+    )
+
+    return fits
+
+
+def _fit_linear_model(model: str, g: np.ndarray, t: np.ndarray) -> ComplexityFit:
+    # weighted least squares with weights 1/t, such that all sizes contribute equally in relative terms
+    w = 1 / t
+    if np.all(g == 0):
+        a, b = float(np.sum(w) / np.sum(w * w)), 0.0  # minimizes sum((a/t - 1)^2)
+    else:
+        (a, b), *_ = np.linalg.lstsq(np.column_stack([w, g * w]), np.ones_like(t), rcond=None)
+        if a < 0:
+            a, b = 0.0, float(np.sum(g * w) / np.sum((g * w) ** 2))
+        elif b < 0:
+            a, b = float(np.sum(w) / np.sum(w * w)), 0.0
+    return ComplexityFit(model, float(a), float(b), _rel_error(t, a + b * g))
+
+
+def _rel_error(t: np.ndarray, t_fit: np.ndarray) -> float:
+    return float(np.sqrt(np.mean(((t_fit - t) / t) ** 2)))
+
+
+# =================================================================================================
+#  ScalingResult
+# =================================================================================================
+@dataclass(frozen=True)
+class ScalingResult:
+    """Result of benchmark_scaling, i.e. median duration/execution for a range of sizes & fitted complexity models."""
+
+    sizes: np.ndarray
+    t_sec: np.ndarray
+    fits: dict[str, ComplexityFit] = field(repr=False)
+
+    @property
+    def exponent(self) -> float:
+        """Best-fitting exponent k of a power law t(n) ~ n^k."""
+        return self.fits[_POWER_LAW_MODEL].b
+
+    @property
+    def best_fit(self) -> ComplexityFit:
+        """
+        Best-fitting complexity model, with a preference for simpler models:  the first model of O(1), O(log n), O(n),
+        O(n log n), O(n^k) with a relative error of at most 1.5x the lowest relative error across all models.
+        """
+        min_rel_error = min(fit.rel_error for fit in self.fits.values())
+        return next(fit for fit in self.fits.values() if fit.rel_error <= 1.5 * min_rel_error)
+
+    def __str__(self) -> str:
+        return f"best fit: {self.best_fit.model}, exponent: {self.exponent:.2f}"
+
+
+# =================================================================================================
+#  Main functions
+# =================================================================================================
+def benchmark_scaling(
+    f: Callable[[Any], Any],
+    n_min: int,
+    n_max: int,
+    n_sizes: int = 10,
+    setup: Callable[[int], Any] | None = None,
+    t_per_run: float = 0.05,
+    n_warmup: int = 3,
+    n_benchmark: int = 10,
+    silent: bool = False,
+) -> ScalingResult:
+    """
+    Benchmark f for a range of logarithmically spaced sizes n in [n_min, n_max] & fit complexity models
+    (O(1), O(log n), O(n), O(n log n), O(n^k)) to the resulting durations.
+
+    Example:
+
+        result = benchmark_scaling(np.sort, 100, 1_000_000, setup=lambda n: np.random.rand(n))
+        print(result.best_fit.model, result.exponent)
+
+    :param f: (Callable) function to benchmark, called as f(n), or as f(setup(n)) if setup is provided.
+    :param n_min: (int) smallest size.
+    :param n_max: (int) largest size.
+    :param n_sizes: (int, default=10) number of sizes (duplicates after rounding to integers are removed).
+    :param setup: (Callable, optional) function preparing the input of f for size n, outside of the timed region.
+    :param t_per_run: (float, default=0.05) see benchmark().
+    :param n_warmup: (int, default=3) see benchmark().
+    :param n_benchmark: (int, default=10) see benchmark().
+    :param silent: (bool, default=False) If True, suppresses any output during benchmarking.
+    :return: ScalingResult object.
+    """
+
+    # --- sizes -------------------------------------------
+    sizes = np.array(sorted({round(n) for n in logspace(n_min, n_max, n_sizes)}))
+
+    # --- benchmark ---------------------------------------
+    t_sec = []
+    for n in sizes:
+        if not silent:
+            print(f"n={n:>12} | ", end="")
+        arg = int(n) if setup is None else setup(int(n))
+        t_sec.append(
+            benchmark(lambda: f(arg), t_per_run=t_per_run, n_warmup=n_warmup, n_benchmark=n_benchmark, silent=silent)
+        )
+    t_sec = np.array(t_sec)
+
+    # --- fit ---------------------------------------------
+    result = ScalingResult(sizes=sizes, t_sec=t_sec, fits=fit_complexity(sizes, t_sec))
+    if not silent:
+        print(result)
+
+    return result
+
+
+def crossover_size(result_a: ScalingResult, result_b: ScalingResult) -> float | None:
+    """
+    Size at which the relative performance of 2 implementations (benchmarked with the same sizes) flips, e.g. the
+    size above which a compiled implementation with a higher fixed overhead starts to beat a plain one.  Determined
+    by interpolating log(t_a / t_b) linearly in log(n) between the first pair of sizes where its sign changes.
+
+    :return: crossover size, or None if one implementation is faster for all sizes.
+    """
+    if not np.array_equal(result_a.sizes, result_b.sizes):
+        raise ValueError("Both results should be benchmarked with the same sizes.")
+
+    log_n = np.log(result_a.sizes.astype(float))
+    log_ratio = np.log(result_a.t_sec / result_b.t_sec)
+    for i in range(len(log_n) - 1):
+        if log_ratio[i] == 0:
+            return float(result_a.sizes[i])
+        if np.sign(log_ratio[i]) != np.sign(log_ratio[i + 1]):
+            frac = log_ratio[i] / (log_ratio[i] - log_ratio[i + 1])
+            return float(np.exp(log_n[i] + frac * (log_n[i + 1] - log_n[i])))
+    return None
@@ -0,0 +1,174 @@
+import datetime
+import json
+import platform
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+
+from brtp.formatting._time_duration import format_short_time_duration
+
+from ._benchmark_result import BenchmarkResult
+from ._isolation import _run_isolated, available_cpus
+from ._micro_benchmark import benchmark
+from ._registry import BenchmarkCase, BenchmarkRegistry, benchmark_registry
+
+_RESULTS_FORMAT_VERSION = 1
+
+
+# =================================================================================================
+#  Running
+# =================================================================================================
+def run_benchmarks(
+    cases: list[BenchmarkCase] | None = None,
+    registry: BenchmarkRegistry | None = None,
+    t_per_run: float = 0.1,
+    n_warmup: int = 10,
+    n_benchmark: int = 30,
+    silent: bool = False,
+    return_results: bool = False,
+    isolated: bool = False,
+    cpus: list[int] | None = None,
+) -> dict[str, float] | dict[str, BenchmarkResult]:
+    """
+    Run a suite of benchmarks using benchmark() & return a dict mapping case names to median duration/execution.
+
+    :param cases: (list of BenchmarkCase, optional) cases to run.  Default: all cases of the registry.
+    :param registry: (BenchmarkRegistry, optional) registry to take cases from.  Default: benchmark_registry.
+    :param t_per_run: (float, default=0.1) see benchmark().
+    :param n_warmup: (int, default=10) see benchmark().
+    :param n_benchmark: (int, default=30) see benchmark().
+    :param silent: (bool, default=False) If True, suppresses any output during benchmarking.
+    :param return_results: (bool, default=False) If True, BenchmarkResult objects are returned instead of medians.
+    :param isolated: (bool, default=False) If True, each case is run in a fresh process (see benchmark_isolated()),
+                     with cases running in parallel, each pinned to a different core.  Case functions should be
+                     picklable, e.g. module-level functions registered from benchmark files or modules.
+    :param cpus: (list of int, optional) cores to use if isolated=True;  1 case runs on each core at any time.
+                 Default: all available cores.  Use fewer cores than available to limit interference between cases
+                 through shared caches, memory bandwidth & frequency scaling.
+    :return: dict mapping case names to median estimates of duration/execution in seconds (or BenchmarkResult).
+    """
+    if cases is None:
+        cases = (registry or benchmark_registry).cases()
+
+    if isolated:
+        results = _run_isolated(
+            {case.name: case.as_callable() for case in cases},
+            cpus=cpus or available_cpus(),
+            t_per_run=t_per_run,
+            n_warmup=n_warmup,
+            n_benchmark=n_benchmark,
+            silent=silent,
+        )
+        return results if return_results else {name: result.median for name, result in results.items()}
+
+    name_width = max([len(case.name) for case in cases], default=0)
+    results = dict()
+    for case in cases:
+        if not silent:
+            print(f"{case.name.ljust(name_width)} | ", end="")
+        results[case.name] = benchmark(
+            case.as_callable(),
+            t_per_run=t_per_run,
+            n_warmup=n_warmup,
+            n_benchmark=n_benchmark,
+            silent=silent,
+            return_result=return_results,
+        )
+    return results
+
+
+# =================================================================================================
+#  Persisting results
+# =================================================================================================
+def save_results(results: dict[str, float] | dict[str, BenchmarkResult], path: str | Path):
+    """
+    Save benchmark results to a JSON file, together with some metadata about the environment.  For BenchmarkResult
+    objects, quartiles, a 95% confidence interval of the median & the number of outliers are stored as well.
+    """
+    content = dict(
+        version=_RESULTS_FORMAT_VERSION,
+        metadata=dict(
+            timestamp=datetime.datetime.now(datetime.timezone.utc).isoformat(timespec="seconds"),
+            python=sys.version.split()[0],
+            implementation=platform.python_implementation(),
+            platform=platform.platform(),
+            machine=platform.machine(),
+        ),
+        results={name: _result_as_dict(result) for name, result in results.items()},
+    )
+    Path(path).write_text(json.dumps(content, indent=2))
+
+
+def load_results(path: str | Path) -> dict[str, float]:
+    """Load benchmark results saved using save_results(), returning a dict mapping names to median durations."""
+    content = json.loads(Path(path).read_text())
+    if content.get("version") != _RESULTS_FORMAT_VERSION:
+        raise ValueError(f"Unsupported benchmark results version: {content.get('version')}.")
+    return {name: result["median_sec"] for name, result in content["results"].items()}
+
+
+def _result_as_dict(result: float | BenchmarkResult) -> dict:
+    if isinstance(result, BenchmarkResult):
+        q25, q75 = result.quantiles([0.25, 0.75])
+        ci_lower, ci_upper = result.median_ci()
+        return dict(
+            median_sec=result.median,
+            q25_sec=q25,
+            q75_sec=q75,
+            median_ci95_sec=[ci_lower, ci_upper],
+            n_runs=result.n_runs,
+            n_outliers=int(result.outliers().sum()),
+            baseline_overhead_sec=result.baseline_overhead_sec,
+        )
+    else:
+        return dict(median_sec=float(result))
+
+
+# =================================================================================================
+#  Comparing results
+# =================================================================================================
+@dataclass(frozen=True)
+class BenchmarkComparison:
+    name: str
+    t_baseline_sec: float
+    t_current_sec: float
+    threshold: float  # relative slowdown beyond which a regression is flagged, e.g. 0.1 = 10%
+
+    @property
+    def ratio(self) -> float:
+        """Current duration relative to baseline, i.e. >1 means slower."""
+        return self.t_current_sec / self.t_baseline_sec if self.t_baseline_sec > 0 else float("inf")
+
+    @property
+    def is_regression(self) -> bool:
+        return self.ratio > 1 + self.threshold
+
+    @property
+    def is_improvement(self) -> bool:
+        return self.ratio < 1 / (1 + self.threshold)
+
+    def __str__(self) -> str:
+        s_baseline = format_short_time_duration(self.t_baseline_sec, right_aligned=True, spaced=True)
+        s_current = format_short_time_duration(self.t_current_sec, right_aligned=True, spaced=True)
+        flag = "REGRESSION" if self.is_regression else ("improved" if self.is_improvement else "")
+        return f"{self.name} | {s_baseline} -> {s_current} | {100 * (self.ratio - 1):+7.1f}% {flag}".rstrip()
+
+
+def compare_results(
+    results: dict[str, float] | dict[str, BenchmarkResult],
+    baseline: dict[str, float] | dict[str, BenchmarkResult],
+    threshold: float = 0.1,
+) -> list[BenchmarkComparison]:
+    """
+    Compare benchmark results to a baseline, for all cases present in both.
+
+    :param results: dict mapping case names to median durations, as returned by run_benchmarks().
+    :param baseline: dict mapping case names to median durations, e.g. loaded using load_results().
+    :param threshold: (float, default=0.1) relative slowdown beyond which a case is flagged as a regression.
+    :return: list of BenchmarkComparison objects, in the order of results.
+    """
+    return [
+        BenchmarkComparison(name, float(baseline[name]), float(result), threshold)
+        for name, result in results.items()
+        if name in baseline
+    ]
@@ -1 +1,12 @@
-from ._per_instance_caching import per_instance_cache, per_instance_lru_cache
+from ._batch_cache import batch_cache
+from ._disk_cache import disk_cache
+from ._memory_budget import MemoryBudget
+from ._per_instance_caching import (
+    per_instance_async_cache,
+    per_instance_cache,
+    per_instance_generator_cache,
+    per_instance_lru_cache,
+)
+from ._shared_memory_cache import SharedMemoryCache
+from ._snapshots import export_cache_snapshot, import_cache_snapshot
+from ._statistics import CacheStats, CacheStatsRegistry, cache_stats_registry
@@ -0,0 +1,91 @@
+import asyncio
+import functools
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Hashable
+
+from ._method_cache import CacheInfo, _make_key
+
+
+# =================================================================================================
+#  AsyncMethodCache
+# =================================================================================================
+class AsyncMethodCache:
+    """
+    Async counterpart of MethodCache, wrapping a coroutine function and caching its awaited results.
+
+    Concurrent awaits for a key that is not cached yet are deduplicated into a single task; all awaiting callers
+    receive the same result (or exception).  The shared task is shielded from cancellation of individual callers,
+    such that cancelling one caller does not affect the others.
+
+    Intended to be used from a single event loop thread; the cache itself is not thread-safe.
+    """
+
+    # -------------------------------------------------------------------------
+    #  Constructor
+    # -------------------------------------------------------------------------
+    def __init__(self, func: Callable[..., Awaitable], maxsize: int | None = None, typed: bool = False):
+        # settings
+        self._func = func
+        self._maxsize = maxsize
+        self._typed = typed
+
+        # state
+        self._data: OrderedDict[Hashable, Any] = OrderedDict()  # ordered from least to most recently used
+        self._in_flight: dict[Hashable, asyncio.Task] = dict()
+        self._hits = 0
+        self._misses = 0
+
+        functools.update_wrapper(self, func)
+
+    # -------------------------------------------------------------------------
+    #  Main functionality
+    # -------------------------------------------------------------------------
+    async def __call__(self, *args, **kwargs) -> Any:
+        key = _make_key(args, kwargs, self._typed)
+
+        # --- cache lookup --------------------------------
+        if key in self._data:
+            self._hits += 1
+            self._data.move_to_end(key)
+            return self._data[key]
+
+        # --- join or start computation -------------------
+        task = self._in_flight.get(key)
+        if task is None:
+            self._misses += 1
+            task = self._in_flight[key] = asyncio.ensure_future(self._compute(key, args, kwargs))
+        else:
+            self._hits += 1
+
+        return await asyncio.shield(task)
+
+    async def _compute(self, key: Hashable, args: tuple, kwargs: dict) -> Any:
+        try:
+            result = await self._func(*args, **kwargs)
+            self._store(key, result)
+            return result
+        finally:
+            del self._in_flight[key]
+
+    def _store(self, key: Hashable, value: Any):
+        """Store new key-value pair & evict least recently used entries if needed."""
+        self._data[key] = value
+        self._data.move_to_end(key)
+        if self._maxsize is not None:
+            while len(self._data) > max(0, self._maxsize):
+                self._data.popitem(last=False)
+
+    # -------------------------------------------------------------------------
+    #  lru_cache-compatible API
+    # -------------------------------------------------------------------------
+    def cache_info(self) -> CacheInfo:
+        return CacheInfo(self._hits, self._misses, self._maxsize, len(self._data))
+
+    def cache_clear(self):
+        """Clear all cached results; computations that are still in flight are not affected."""
+        self._data.clear()
+        self._hits = 0
+        self._misses = 0
+
+    def cache_parameters(self) -> dict:
+        return dict(maxsize=self._maxsize, typed=self._typed)
@@ -0,0 +1,190 @@
+import functools
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Sequence
+
+import numpy as np
+
+from ._method_cache import CacheInfo, _make_key
+from ._per_instance_caching import _PerInstanceCacheDescriptor
+
+
+# =================================================================================================
+#  batch_cache
+# =================================================================================================
+def batch_cache(func: Callable | None = None, *, maxsize: int | None = None):
+    """
+    Caching decorator for vectorized functions that take a batch of keys as first argument and return an array of
+    results, with result[i] corresponding to keys[i].
+
+    Each key in the batch is looked up individually in the cache.  The wrapped function is then called only once,
+    with the (de-duplicated) subset of missing keys, after which all results are stitched back together in the
+    original order.  This way, vectorization & memoization can be combined.
+
+    All other arguments (which should be hashable) are part of the cache key, i.e. results for the same key element
+    but with different other arguments are cached separately.
+
+    Example:
+
+        @batch_cache
+        def exponential_weights(c: np.ndarray, n: int) -> np.ndarray:
+            # vectorized computation of a (len(c), n)-shaped result
+            pass
+
+        exponential_weights(np.array([1.0, 2.0]), 10)       # computes c=1.0 & c=2.0
+        exponential_weights(np.array([2.0, 3.0, 1.0]), 10)  # only computes c=3.0
+
+    Can also be applied to instance methods, in which case the batch of keys is the first argument after self and
+    results are cached per instance, analogous to per_instance_cache (class-wide management is available through
+    MyClass.method.cache_clear_all(), cache_info_all() & n_instances()):
+
+        class MyClass:
+
+            @batch_cache(maxsize=10_000)
+            def compute_rows(self, keys: np.ndarray) -> np.ndarray:
+                pass
+
+    :param func: (Callable) vectorized function to be decorated;  first argument is a 1D batch of keys.
+    :param maxsize: (int, optional) max number of cached elements;  least recently used elements are evicted first.
+                    Default: unbounded.
+    """
+
+    def decorator(wrapped: Callable) -> Callable:
+        return functools.update_wrapper(BatchCache(wrapped, maxsize=maxsize), wrapped)
+
+    return decorator if func is None else decorator(func)
+
+
+# =================================================================================================
+#  BatchCache
+# =================================================================================================
+class BatchCache:
+    """Callable wrapper implementing the functionality of the batch_cache decorator.  See batch_cache for details."""
+
+    # -------------------------------------------------------------------------
+    #  Constructor
+    # -------------------------------------------------------------------------
+    def __init__(self, func: Callable, maxsize: int | None = None):
+        # settings
+        self._func = func
+        self._maxsize = maxsize
+
+        # state
+        self._lock = threading.RLock()
+        self._data: OrderedDict[tuple[Any, Hashable], Any] = OrderedDict()  # (element, context) -> result row
+        self._hits = 0
+        self._misses = 0
+
+        # per-instance caches, when used as a method  (created on first use, since plain callables have no __name__)
+        self._descriptor: _PerInstanceCacheDescriptor | None = None
+
+    # -------------------------------------------------------------------------
+    #  Descriptor - per-instance caching of methods
+    # -------------------------------------------------------------------------
+    def __set_name__(self, owner: type, name: str):
+        self._get_descriptor().__set_name__(owner, name)
+
+    def __get__(self, instance: object | None, owner: type | None = None):
+        if instance is None:
+            return self
+        return self._get_descriptor().__get__(instance, owner)
+
+    def _get_descriptor(self) -> _PerInstanceCacheDescriptor:
+        if self._descriptor is None:
+            self._descriptor = _PerInstanceCacheDescriptor(self._func, self._create_instance_cache, thread_safe=True)
+        return self._descriptor
+
+    def _create_instance_cache(self, instance: object) -> "BatchCache":
+        bound_method = functools.update_wrapper(functools.partial(self._func, instance), self._func)
+        return BatchCache(bound_method, maxsize=self._maxsize)
+
+    def cache_clear_all(self):
+        """Clear the caches of all live instances (when used as a method)."""
+        self._get_descriptor().cache_clear_all()
+
+    def cache_info_all(self) -> CacheInfo:
+        """Hits, misses & currsize summed across the caches of all live instances (when used as a method)."""
+        return self._get_descriptor().cache_info_all()
+
+    def n_instances(self) -> int:
+        """Number of live instances for which a cache was created (when used as a method)."""
+        return self._get_descriptor().n_instances()
+
+    # -------------------------------------------------------------------------
+    #  Main functionality
+    # -------------------------------------------------------------------------
+    def __call__(self, keys: Sequence | np.ndarray, *args, **kwargs) -> np.ndarray:
+        keys = np.asarray(keys)
+        if keys.ndim != 1:
+            raise ValueError(f"Batch of keys should be 1-dimensional, here shape={keys.shape}.")
+        if len(keys) == 0:
+            return np.asarray(self._func(keys, *args, **kwargs))
+
+        context = _make_key(args, kwargs, typed=False)
+        elements = keys.tolist()  # python scalars, which are hashable
+
+        # --- lookup --------------------------------------
+        with self._lock:
+            rows = [self._lookup((element, context)) for element in elements]
+
+        # --- compute missing -----------------------------
+        missing = list(dict.fromkeys(e for e, row in zip(elements, rows) if row is _MISSING))  # unique, ordered
+        if missing:
+            computed = np.asarray(self._func(np.asarray(missing, dtype=keys.dtype), *args, **kwargs))
+            if len(computed) != len(missing):
+                raise ValueError(f"Expected {len(missing)} results from wrapped function, got {len(computed)}.")
+            computed_rows = {element: _copy_row(computed[i]) for i, element in enumerate(missing)}
+
+            with self._lock:
+                self._misses += len(missing)
+                for element, row in computed_rows.items():
+                    self._store((element, context), row)
+
+            rows = [computed_rows[e] if row is _MISSING else row for e, row in zip(elements, rows)]
+
+        # --- stitch results ------------------------------
+        return np.array(rows)
+
+    def _lookup(self, key: tuple[Any, Hashable]) -> Any:
+        """Return cached row & register hit, or _MISSING.  Assumes lock is held."""
+        row = self._data.get(key, _MISSING)
+        if row is not _MISSING:
+            self._hits += 1
+            self._data.move_to_end(key)
+        return row
+
+    def _store(self, key: tuple[Any, Hashable], row: Any):
+        """Store row & evict least recently used rows if needed.  Assumes lock is held."""
+        self._data[key] = row
+        self._data.move_to_end(key)
+        if self._maxsize is not None:
+            while len(self._data) > max(0, self._maxsize):
+                self._data.popitem(last=False)
+
+    # -------------------------------------------------------------------------
+    #  lru_cache-compatible API
+    # -------------------------------------------------------------------------
+    def cache_info(self) -> CacheInfo:
+        """Hits & misses are counted per element;  currsize is the number of cached elements."""
+        with self._lock:
+            return CacheInfo(self._hits, self._misses, self._maxsize, len(self._data))
+
+    def cache_clear(self):
+        with self._lock:
+            self._data.clear()
+            self._hits = 0
+            self._misses = 0
+
+    def cache_parameters(self) -> dict:
+        return dict(maxsize=self._maxsize)
+
+
+# =================================================================================================
+#  Helpers
+# =================================================================================================
+_MISSING = object()
+
+
+def _copy_row(row: Any) -> Any:
+    # copy array rows, such that the cache does not keep the entire batch result alive
+    return row.copy() if isinstance(row, np.ndarray) else row
@@ -0,0 +1,205 @@
+import functools
+import threading
+import weakref
+from typing import Any, Callable, Hashable, Iterable
+
+from ._dependencies import register_dependencies
+from ._method_cache import CacheInfo, _make_key
+
+
+# =================================================================================================
+#  CompactMethodCache
+# =================================================================================================
+class CompactMethodCache:
+    """
+    Descriptor implementing a compact per-instance cache, which does not need an instance __dict__ and hence also
+    works for classes with __slots__ (which should include '__weakref__').
+
+    Instead of creating a partial & lru_cache object per instance, all cached results of the decorated method are
+    kept in 1 shared table, mapping each instance to a plain dict with its cached results.  Instances are tracked
+    using weak references, such that their entries are freed as soon as the instance is garbage collected.
+
+    Accessing the method on an instance returns a light-weight bound object offering __call__, cache_clear,
+    cache_info & cache_parameters on a per-instance basis.  Hits & misses are however counted per method (i.e.
+    aggregated across all instances), to avoid per-instance counters.
+    """
+
+    # -------------------------------------------------------------------------
+    #  Constructor
+    # -------------------------------------------------------------------------
+    def __init__(
+        self,
+        func: Callable,
+        maxsize: int | None = 128,
+        typed: bool = False,
+        content_keys: bool = False,
+        depends_on: Iterable[str] = (),
+    ):
+        # settings
+        self._func = func
+        self._maxsize = maxsize
+        self._typed = typed
+        self._content_keys = content_keys
+        self._depends_on = tuple(depends_on)
+
+        # state
+        self._lock = threading.RLock()
+        self._tables: dict[int, tuple[weakref.ref, dict[Hashable, Any]]] = dict()  # id(instance) -> (ref, table)
+        self._hits = 0
+        self._misses = 0
+
+        functools.update_wrapper(self, func)
+
+    # -------------------------------------------------------------------------
+    #  Descriptor
+    # -------------------------------------------------------------------------
+    def __get__(self, instance: object | None, owner: type | None = None):
+        if instance is None:
+            return self
+        return _BoundCompactMethodCache(self, instance)
+
+    def __set_name__(self, owner: type, name: str):
+        if self._depends_on:
+            register_dependencies(owner, self, self._depends_on)
+
+    def invalidate(self, instance: object):
+        """
+        Clear all cached results of the given instance.  The table is replaced rather than cleared, such that results
+        of computations that are in progress at this time are not stored (see _call).
+        """
+        with self._lock:
+            entry = self._tables.get(id(instance))
+            if entry is not None:
+                self._tables[id(instance)] = (entry[0], dict())
+
+    # -------------------------------------------------------------------------
+    #  Main functionality
+    # -------------------------------------------------------------------------
+    def _call(self, instance: object, args: tuple, kwargs: dict) -> Any:
+        key = _make_key(args, kwargs, self._typed, self._content_keys)
+
+        # --- cache lookup --------------------------------
+        with self._lock:
+            entry = self._tables.get(id(instance))
+            if (entry is not None) and (key in entry[1]):
+                self._hits += 1
+                table = entry[1]
+                if self._maxsize is not None:
+                    table[key] = table.pop(key)  # mark as most recently used
+                return table[key]
+            self._misses += 1
+            table = self._get_table(instance)
+
+        # --- compute & store -----------------------------
+        result = self._func(instance, *args, **kwargs)
+        with self._lock:
+            if self._tables.get(id(instance), (None, None))[1] is table:  # not invalidated in the meantime
+                self._store(table, key, result)
+
+        return result
+
+    def _store(self, table: dict[Hashable, Any], key: Hashable, value: Any):
+        """Store key-value pair & evict least recently used entries if needed.  Assumes lock is held."""
+        table[key] = value
+        if self._maxsize is not None:
+            while len(table) > max(0, self._maxsize):
+                del table[next(iter(table))]
+
+    def _get_table(self, instance: object) -> dict[Hashable, Any]:
+        """Get table with cached results of instance, creating it if needed.  Assumes lock is held."""
+        instance_id = id(instance)
+        entry = self._tables.get(instance_id)
+        if entry is None:
+            try:
+                ref = weakref.ref(instance, functools.partial(self._release, instance_id))
+            except TypeError:
+                raise TypeError(
+                    f"Instances of {type(instance).__name__} do not support weak references, which is required for "
+                    f"compact per-instance caching; add '__weakref__' to __slots__."
+                ) from None
+            entry = self._tables[instance_id] = (ref, dict())
+        return entry[1]
+
+    def _release(self, instance_id: int, _ref: weakref.ref):
+        """Weakref callback, removing all cached results of a garbage collected instance."""
+        with self._lock:
+            self._tables.pop(instance_id, None)
+
+    # -------------------------------------------------------------------------
+    #  Method-level API
+    # -------------------------------------------------------------------------
+    def n_instances(self) -> int:
+        """Number of instances with a cache table."""
+        with self._lock:
+            return len(self._tables)
+
+    def cache_clear_all(self):
+        """Clear the cached results of all instances & reset hit/miss counts."""
+        with self._lock:
+            for instance_id, (ref, _) in list(self._tables.items()):
+                self._tables[instance_id] = (ref, dict())  # replaced rather than cleared;  see invalidate()
+            self._hits = 0
+            self._misses = 0
+
+    def cache_info_all(self) -> CacheInfo:
+        """Hits, misses & currsize across all instances;  maxsize is per instance."""
+        with self._lock:
+            currsize = sum(len(table) for _, table in self._tables.values())
+            return CacheInfo(self._hits, self._misses, self._maxsize, currsize)
+
+
+# =================================================================================================
+#  Bound object
+# =================================================================================================
+class _BoundCompactMethodCache:
+    """Light-weight object returned when accessing a CompactMethodCache on an instance."""
+
+    __slots__ = ("_cache", "_instance")
+
+    def __init__(self, cache: CompactMethodCache, instance: object):
+        self._cache = cache
+        self._instance = instance
+
+    def __call__(self, *args, **kwargs) -> Any:
+        return self._cache._call(self._instance, args, kwargs)
+
+    @property
+    def __wrapped__(self) -> Callable:
+        return self._cache._func
+
+    # -------------------------------------------------------------------------
+    #  lru_cache-compatible API
+    # -------------------------------------------------------------------------
+    def cache_info(self) -> CacheInfo:
+        """Hits & misses aggregated across all instances;  currsize of this instance."""
+        cache = self._cache
+        with cache._lock:
+            entry = cache._tables.get(id(self._instance))
+            return CacheInfo(cache._hits, cache._misses, cache._maxsize, len(entry[1]) if entry else 0)
+
+    def cache_clear(self):
+        self._cache.invalidate(self._instance)
+
+    def cache_export(self) -> list[tuple[Hashable, Any, None]]:
+        """Export all entries of this instance as (key, value, None)-tuples;  see MethodCache.cache_export()."""
+        cache = self._cache
+        with cache._lock:
+            entry = cache._tables.get(id(self._instance))
+            return [(key, value, None) for key, value in entry[1].items()] if entry else []
+
+    def cache_import(self, entries: Iterable[tuple[Hashable, Any, float | None]]) -> int:
+        """Pre-populate the cache of this instance;  see MethodCache.cache_import().  Expiry info is ignored."""
+        cache = self._cache
+        with cache._lock:
+            table = cache._get_table(self._instance)
+            keys = dict()  # used as ordered set
+            for key, value, _ in entries:
+                cache._store(table, key, value)
+                keys[key] = None
+            return sum(key in table for key in keys)
+
+    def cache_parameters(self) -> dict:
+        parameters = dict(maxsize=self._cache._maxsize, typed=self._cache._typed, compact=True)
+        if self._cache._content_keys:
+            parameters["content_keys"] = True
+        return parameters
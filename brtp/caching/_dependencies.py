@@ -0,0 +1,51 @@
+from typing import Iterable, Protocol
+
+_DEPENDENCIES_ATTR = "__brtp_cache_dependencies__"
+
+
+# =================================================================================================
+#  Protocol
+# =================================================================================================
+class InvalidatableCache(Protocol):
+    """Per-instance cache descriptor that can invalidate all cached results of a given instance."""
+
+    def invalidate(self, instance: object): ...
+
+
+# =================================================================================================
+#  Registration
+# =================================================================================================
+def register_dependencies(owner: type, cache: InvalidatableCache, depends_on: Iterable[str]):
+    """
+    Register that cached results of 'cache' depend on the given attributes of instances of 'owner'.
+
+    The first time this is called for a class, its __setattr__ & __delattr__ are wrapped such that, whenever one of
+    the registered attributes is reassigned or deleted, the per-instance caches depending on it are invalidated for
+    that instance.  Caches not depending on the attribute are left untouched.
+    """
+
+    # --- install hooks (once per class) ------------------
+    dependencies: dict[str, list[InvalidatableCache]] | None = owner.__dict__.get(_DEPENDENCIES_ATTR)
+    if dependencies is None:
+        dependencies = dict()
+        setattr(owner, _DEPENDENCIES_ATTR, dependencies)
+
+        original_setattr = owner.__setattr__
+        original_delattr = owner.__delattr__
+
+        def __setattr__(self, name: str, value):
+            original_setattr(self, name, value)
+            for dependent_cache in dependencies.get(name, ()):
+                dependent_cache.invalidate(self)
+
+        def __delattr__(self, name: str):
+            original_delattr(self, name)
+            for dependent_cache in dependencies.get(name, ()):
+                dependent_cache.invalidate(self)
+
+        owner.__setattr__ = __setattr__
+        owner.__delattr__ = __delattr__
+
+    # --- register ----------------------------------------
+    for attr_name in depends_on:
+        dependencies.setdefault(attr_name, []).append(cache)
@@ -0,0 +1,214 @@
+import functools
+import os
+import pickle
+import tempfile
+from pathlib import Path
+from typing import Any, Callable, Iterator
+
+import numpy as np
+
+from ._file_lock import file_lock
+from ._hashing import stable_hash
+from ._method_cache import CacheInfo
+
+
+# =================================================================================================
+#  disk_cache
+# =================================================================================================
+def disk_cache(
+    func: Callable | None = None,
+    *,
+    cache_dir: str | Path | None = None,
+    max_bytes: int | None = None,
+    version: str = "",
+    mmap: bool = True,
+):
+    """
+    Caching decorator storing results persistently on local disk, such that they survive process restarts and are
+    shared between processes (e.g. workers of a process pool).
+
+    Entries are content-addressed, i.e. keyed by a stable hash of...
+      - the function identity (module, qualified name & the provided version string)
+      - all arguments  (numpy arrays are hashed by dtype, shape & contents)
+
+    Numpy array results are stored as .npy files, which are by default loaded using memory mapping (read-only),
+    such that only the parts that are actually accessed are read from disk.  All other results are pickled.
+
+    Multiple processes can safely use the same cache directory:
+      - files are written atomically (write to temp file + rename), so readers never see partially written entries
+      - computations of the same entry are serialized using file locks (POSIX only), such that concurrent processes
+        needing the same entry wait for the first one to finish instead of all computing it
+
+    When max_bytes is provided, least recently used entries (based on file modification times, which are updated on
+    each hit) are deleted whenever the total size of the cache directory exceeds max_bytes.
+
+    Example:
+
+        @disk_cache(max_bytes=10_000_000_000)
+        def compute_something(x: float, arr: np.ndarray) -> np.ndarray:
+            # expensive computation here
+            pass
+
+        @disk_cache(version="2")    # bump version to invalidate results of older implementations
+        def compute_something_else(y: int) -> dict:
+            # expensive computation here
+            pass
+
+    :param func: (Callable) function to be decorated.
+    :param cache_dir: (str | Path, optional) root directory of the cache;  defaults to $XDG_CACHE_HOME/brtp or
+                       ~/.cache/brtp.  Can be shared between multiple decorated functions.
+    :param max_bytes: (int, optional) max total size of all files in cache_dir.  Default: unbounded.
+    :param version: (str, default="") version string included in the function identity.
+    :param mmap: (bool, default=True) load numpy array results as read-only memory mapped arrays.
+    """
+
+    def decorator(wrapped: Callable) -> Callable:
+        disk_cache_obj = DiskCache(
+            wrapped,
+            cache_dir=Path(cache_dir) if cache_dir is not None else _default_cache_dir(),
+            max_bytes=max_bytes,
+            version=version,
+            mmap=mmap,
+        )
+        return functools.update_wrapper(disk_cache_obj, wrapped)
+
+    return decorator if func is None else decorator(func)
+
+
+# =================================================================================================
+#  DiskCache
+# =================================================================================================
+class DiskCache:
+    """Callable wrapper implementing the functionality of the disk_cache decorator.  See disk_cache for details."""
+
+    _N_LOCK_STRIPES = 256  # number of lock files per function; keys are mapped to lock files based on their hash
+
+    # -------------------------------------------------------------------------
+    #  Constructor
+    # -------------------------------------------------------------------------
+    def __init__(self, func: Callable, cache_dir: Path, max_bytes: int | None, version: str, mmap: bool):
+        self._func = func
+        self._cache_dir = cache_dir
+        self._func_dir = cache_dir / stable_hash(func.__module__, func.__qualname__, version)
+        self._max_bytes = max_bytes
+        self._mmap = mmap
+
+        # statistics of the current process
+        self._hits = 0
+        self._misses = 0
+
+    # -------------------------------------------------------------------------
+    #  Main functionality
+    # -------------------------------------------------------------------------
+    def __call__(self, *args, **kwargs) -> Any:
+        key = stable_hash(args, kwargs)
+
+        # --- fast path: lock-free lookup -----------------
+        found, result = self._load(key)
+        if found:
+            self._hits += 1
+            return result
+
+        # --- slow path: compute under lock ---------------
+        self._func_dir.mkdir(parents=True, exist_ok=True)
+        with file_lock(self._func_dir / f"{int(key[:8], 16) % self._N_LOCK_STRIPES:03d}.lock"):
+            found, result = self._load(key)  # another process might have computed it while we were waiting
+            if found:
+                self._hits += 1
+                return result
+
+            self._misses += 1
+            result = self._func(*args, **kwargs)
+            path = self._save(key, result)
+
+        if self._max_bytes is not None:
+            self._evict(keep=path)
+
+        return result
+
+    # -------------------------------------------------------------------------
+    #  Cache management
+    # -------------------------------------------------------------------------
+    def cache_info(self) -> CacheInfo:
+        """Hits & misses of the current process;  currsize = number of entries on disk for this function."""
+        return CacheInfo(self._hits, self._misses, None, len(list(self._entry_files())))
+
+    def cache_clear(self):
+        """Delete all entries of this function from disk."""
+        for path in self._entry_files():
+            path.unlink(missing_ok=True)
+        self._hits = 0
+        self._misses = 0
+
+    def cache_parameters(self) -> dict:
+        return dict(cache_dir=str(self._cache_dir), max_bytes=self._max_bytes, mmap=self._mmap)
+
+    # -------------------------------------------------------------------------
+    #  Internal - file handling
+    # -------------------------------------------------------------------------
+    def _entry_files(self) -> Iterator[Path]:
+        if self._func_dir.is_dir():
+            for path in self._func_dir.iterdir():
+                if path.suffix in (".npy", ".pkl"):
+                    yield path
+
+    def _load(self, key: str) -> tuple[bool, Any]:
+        try:
+            path = self._func_dir / f"{key}.npy"
+            if path.exists():
+                result = np.load(path, mmap_mode="r" if self._mmap else None, allow_pickle=False)
+            else:
+                path = self._func_dir / f"{key}.pkl"
+                with open(path, "rb") as f:
+                    result = pickle.load(f)
+            os.utime(path)  # mark as recently used
+            return True, result
+        except FileNotFoundError:
+            # not cached or evicted by another process in the meantime
+            return False, None
+
+    def _save(self, key: str, result: Any) -> Path:
+        """Atomically write result to disk & return path of the entry."""
+        is_array = (type(result) is np.ndarray) and not result.dtype.hasobject
+        path = self._func_dir / f"{key}.{'npy' if is_array else 'pkl'}"
+        fd, tmp_path = tempfile.mkstemp(dir=self._func_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                if is_array:
+                    np.save(f, result, allow_pickle=False)
+                else:
+                    pickle.dump(result, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, path)
+        except BaseException:
+            Path(tmp_path).unlink(missing_ok=True)
+            raise
+        return path
+
+    def _evict(self, keep: Path):
+        """Delete least recently used entries in the entire cache_dir until total size <= max_bytes."""
+        with file_lock(self._cache_dir / "evict.lock"):
+            # --- collect entries -------------------------
+            entries = []  # list of (mtime, size, path)
+            for path in self._cache_dir.glob("*/*"):
+                if path.suffix in (".npy", ".pkl"):
+                    try:
+                        stat = path.stat()
+                    except FileNotFoundError:
+                        continue
+                    entries.append((stat.st_mtime, stat.st_size, path))
+
+            # --- evict -----------------------------------
+            total_bytes = sum(size for _, size, _ in entries)
+            for _, size, path in sorted(entries):
+                if total_bytes <= self._max_bytes:
+                    break
+                if path != keep:
+                    path.unlink(missing_ok=True)
+                    total_bytes -= size
+
+
+# =================================================================================================
+#  Helpers
+# =================================================================================================
+def _default_cache_dir() -> Path:
+    return Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "brtp"
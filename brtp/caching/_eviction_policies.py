@@ -0,0 +1,269 @@
+"""
+Eviction policies for MethodCache, all implemented with O(1) (amortized) operations.
+
+Each policy tracks the keys that are resident in the cache and decides which key to evict when the cache is full.
+Contract with the cache:
+  - on_insert(key)   called after a new key was added to the cache
+  - on_hit(key)      called when a resident key is accessed
+  - on_remove(key)   called when a key is removed from the cache, for whatever reason  (no-op for unknown keys)
+  - victim()         returns a resident key to be evicted next;  the cache subsequently removes it via on_remove.
+                     Called before a new key is inserted (if the cache is full), never after.
+"""
+
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Hashable
+
+
+# =================================================================================================
+#  Base class
+# =================================================================================================
+class EvictionPolicy(ABC):
+    def __init__(self, maxsize: int | None):
+        self.maxsize = maxsize
+
+    @abstractmethod
+    def on_insert(self, key: Hashable): ...
+
+    @abstractmethod
+    def on_hit(self, key: Hashable): ...
+
+    @abstractmethod
+    def on_remove(self, key: Hashable): ...
+
+    @abstractmethod
+    def victim(self) -> Hashable: ...
+
+
+# =================================================================================================
+#  LRU
+# =================================================================================================
+class LruPolicy(EvictionPolicy):
+    """Least Recently Used."""
+
+    def __init__(self, maxsize: int | None):
+        super().__init__(maxsize)
+        self._order: OrderedDict[Hashable, None] = OrderedDict()  # least to most recently used
+
+    def on_insert(self, key: Hashable):
+        self._order[key] = None
+
+    def on_hit(self, key: Hashable):
+        self._order.move_to_end(key)
+
+    def on_remove(self, key: Hashable):
+        self._order.pop(key, None)
+
+    def victim(self) -> Hashable:
+        return next(iter(self._order))
+
+
+# =================================================================================================
+#  LFU
+# =================================================================================================
+class LfuPolicy(EvictionPolicy):
+    """
+    Least Frequently Used, with aging:  every 10*maxsize accesses, all access counts are halved, such that entries
+    that were popular in the past, but not anymore, eventually become eligible for eviction.  Ties are broken in
+    least-recently-used order.
+    """
+
+    def __init__(self, maxsize: int | None):
+        super().__init__(maxsize)
+        self._freq: dict[Hashable, int] = dict()
+        self._buckets: dict[int, OrderedDict[Hashable, None]] = dict()  # freq -> keys, least to most recently used
+        self._lower: dict[int, int | None] = dict()  # freq -> next lower freq with a non-empty bucket
+        self._higher: dict[int, int | None] = dict()  # freq -> next higher freq with a non-empty bucket
+        self._min_freq: int | None = None  # lowest freq with a non-empty bucket
+        self._aging_period = 10 * max(1, maxsize or 0)
+        self._n_accesses = 0
+
+    def on_insert(self, key: Hashable):
+        self._add(key, 1, after=None)
+        self._tick()
+
+    def on_hit(self, key: Hashable):
+        freq, lower = self._discard(key)
+        self._add(key, freq + 1, after=lower)
+        self._tick()
+
+    def on_remove(self, key: Hashable):
+        if key in self._freq:
+            self._discard(key)
+
+    def victim(self) -> Hashable:
+        return next(iter(self._buckets[self._min_freq]))
+
+    # --- internal ----------------------------------------
+    def _add(self, key: Hashable, freq: int, after: int | None):
+        """Add key with given freq;  if its bucket does not exist yet, it is linked right after freq 'after'."""
+        self._freq[key] = freq
+        bucket = self._buckets.get(freq)
+        if bucket is None:
+            bucket = self._buckets[freq] = OrderedDict()
+            higher = self._min_freq if after is None else self._higher[after]
+            self._lower[freq], self._higher[freq] = after, higher
+            if after is None:
+                self._min_freq = freq
+            else:
+                self._higher[after] = freq
+            if higher is not None:
+                self._lower[higher] = freq
+        bucket[key] = None
+
+    def _discard(self, key: Hashable) -> tuple[int, int | None]:
+        """Remove key & return (freq, lower), with lower the highest remaining freq <= freq (None if none)."""
+        freq = self._freq.pop(key)
+        bucket = self._buckets[freq]
+        del bucket[key]
+        if bucket:
+            return freq, freq
+        del self._buckets[freq]
+        lower, higher = self._lower.pop(freq), self._higher.pop(freq)
+        if lower is None:
+            self._min_freq = higher
+        else:
+            self._higher[lower] = higher
+        if higher is not None:
+            self._lower[higher] = lower
+        return freq, lower
+
+    def _tick(self):
+        self._n_accesses += 1
+        if self._n_accesses >= self._aging_period:
+            # halve all counts (amortized O(1), since this happens only once every aging_period accesses)
+            self._n_accesses = 0
+            old_buckets = self._buckets
+            self._freq, self._buckets, self._lower, self._higher = dict(), dict(), dict(), dict()
+            self._min_freq = None
+            top = (
+                None  # highest freq added so far;  halved freqs are non-decreasing, so new buckets are linked after it
+            )
+            for freq in sorted(old_buckets):
+                for key in old_buckets[freq]:
+                    self._add(key, max(1, freq // 2), after=top)
+                    top = max(1, freq // 2)
+
+
+# =================================================================================================
+#  2Q
+# =================================================================================================
+class TwoQueuePolicy(EvictionPolicy):
+    """
+    2Q (Johnson & Shasha, 1994), which is scan-resistant:
+      - new keys enter a FIFO queue A1in (25% of maxsize)
+      - keys evicted from A1in are remembered in a ghost queue A1out (keys only, 50% of maxsize)
+      - keys that are re-inserted while in A1out are considered hot & enter an LRU queue Am
+    One-off keys therefore never flush out hot entries in Am.
+    """
+
+    def __init__(self, maxsize: int):
+        super().__init__(maxsize)
+        self._k_in = max(1, maxsize // 4)
+        self._k_out = max(1, maxsize // 2)
+        self._a1_in: OrderedDict[Hashable, None] = OrderedDict()  # FIFO, resident
+        self._a1_out: OrderedDict[Hashable, None] = OrderedDict()  # FIFO, ghost
+        self._am: OrderedDict[Hashable, None] = OrderedDict()  # LRU, resident
+
+    def on_insert(self, key: Hashable):
+        if key in self._a1_out:
+            del self._a1_out[key]
+            self._am[key] = None
+        else:
+            self._a1_in[key] = None
+
+    def on_hit(self, key: Hashable):
+        if key in self._am:
+            self._am.move_to_end(key)
+        # hits in A1in are considered correlated references -> no promotion
+
+    def on_remove(self, key: Hashable):
+        self._a1_in.pop(key, None)
+        self._am.pop(key, None)
+
+    def victim(self) -> Hashable:
+        if (len(self._a1_in) > self._k_in) or not self._am:
+            key = next(iter(self._a1_in))
+            self._a1_out[key] = None
+            if len(self._a1_out) > self._k_out:
+                self._a1_out.popitem(last=False)
+            return key
+        else:
+            return next(iter(self._am))
+
+
+# =================================================================================================
+#  S3-FIFO
+# =================================================================================================
+class S3FifoPolicy(EvictionPolicy):
+    """
+    S3-FIFO (Yang et al., 2023), using only FIFO queues:
+      - new keys enter a small FIFO queue S (10% of maxsize)
+      - keys leaving S that were accessed while in S move to the main FIFO queue M; other keys are evicted and
+        remembered in a ghost queue G (keys only)
+      - keys that are re-inserted while in G directly enter M
+      - keys leaving M are re-inserted in M if they were accessed (with decremented access count, max 3)
+    """
+
+    _MAX_FREQ = 3
+
+    def __init__(self, maxsize: int):
+        super().__init__(maxsize)
+        self._small_size = max(1, maxsize // 10)
+        self._ghost_size = max(1, maxsize - self._small_size)
+        self._s: OrderedDict[Hashable, int] = OrderedDict()  # key -> access count
+        self._m: OrderedDict[Hashable, int] = OrderedDict()  # key -> access count
+        self._g: OrderedDict[Hashable, None] = OrderedDict()
+
+    def on_insert(self, key: Hashable):
+        if key in self._g:
+            del self._g[key]
+            self._m[key] = 0
+        else:
+            self._s[key] = 0
+
+    def on_hit(self, key: Hashable):
+        queue = self._s if key in self._s else self._m
+        queue[key] = min(queue[key] + 1, self._MAX_FREQ)
+
+    def on_remove(self, key: Hashable):
+        self._s.pop(key, None)
+        self._m.pop(key, None)
+
+    def victim(self) -> Hashable:
+        while True:
+            if (len(self._s) >= self._small_size) or not self._m:
+                key, freq = next(iter(self._s.items()))
+                if freq > 0:
+                    del self._s[key]
+                    self._m[key] = 0  # promote to main queue
+                else:
+                    self._g[key] = None
+                    if len(self._g) > self._ghost_size:
+                        self._g.popitem(last=False)
+                    return key
+            else:
+                key, freq = next(iter(self._m.items()))
+                if freq > 0:
+                    del self._m[key]
+                    self._m[key] = freq - 1  # re-insert at tail
+                else:
+                    return key
+
+
+# =================================================================================================
+#  Factory
+# =================================================================================================
+POLICIES: dict[str, type[EvictionPolicy]] = {
+    "lru": LruPolicy,
+    "lfu": LfuPolicy,
+    "2q": TwoQueuePolicy,
+    "s3fifo": S3FifoPolicy,
+}
+
+
+def validate_policy(policy: str, maxsize: int | None):
+    if policy not in POLICIES:
+        raise ValueError(f"Unknown eviction policy '{policy}'; choose from {list(POLICIES)}.")
+    if (policy != "lru") and (maxsize is None):
+        raise ValueError(f"Eviction policy '{policy}' requires maxsize to be set.")
@@ -0,0 +1,21 @@
+import contextlib
+from pathlib import Path
+
+try:
+    import fcntl
+except ImportError:
+    # not available on Windows -> no inter-process locking
+    fcntl = None
+
+
+@contextlib.contextmanager
+def file_lock(path: Path):
+    """Exclusive inter-process lock based on a lock file (no-op on platforms without fcntl)."""
+    with open(path, "a+b") as f:
+        if fcntl is not None:
+            fcntl.flock(f, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(f, fcntl.LOCK_UN)
@@ -0,0 +1,116 @@
+import functools
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Iterable, Iterator
+
+from ._method_cache import CacheInfo, _make_key
+
+
+# =================================================================================================
+#  GeneratorMethodCache
+# =================================================================================================
+class GeneratorMethodCache:
+    """
+    Counterpart of MethodCache for generator (or other iterator-returning) functions.
+
+    Instead of the (single-use) generator object itself, a replay buffer is cached per key.  Each call returns a new
+    iterator over this buffer, which replays all items that were already produced and then continues the shared
+    underlying iteration, lazily, one item at a time as consumers pull them.  The underlying generator is therefore
+    executed at most once per key, regardless of the number of (possibly concurrent) consumers.
+
+    If the underlying iteration raises an exception, consumers reaching that point receive the same exception and the
+    entry is recomputed on the next call.
+    """
+
+    # -------------------------------------------------------------------------
+    #  Constructor
+    # -------------------------------------------------------------------------
+    def __init__(self, func: Callable[..., Iterable], maxsize: int | None = None, typed: bool = False):
+        # settings
+        self._func = func
+        self._maxsize = maxsize
+        self._typed = typed
+
+        # state
+        self._lock = threading.RLock()
+        self._data: OrderedDict[Hashable, _ReplayBuffer] = OrderedDict()  # ordered from least to most recently used
+        self._hits = 0
+        self._misses = 0
+
+        functools.update_wrapper(self, func)
+
+    # -------------------------------------------------------------------------
+    #  Main functionality
+    # -------------------------------------------------------------------------
+    def __call__(self, *args, **kwargs) -> Iterator:
+        key = _make_key(args, kwargs, self._typed)
+
+        with self._lock:
+            buffer = self._data.get(key)
+            if (buffer is not None) and (buffer.exception is None):
+                self._hits += 1
+                self._data.move_to_end(key)
+            else:
+                self._misses += 1
+                buffer = self._data[key] = _ReplayBuffer(iter(self._func(*args, **kwargs)))
+                self._data.move_to_end(key)
+                if self._maxsize is not None:
+                    while len(self._data) > max(0, self._maxsize):
+                        self._data.popitem(last=False)
+
+        return buffer.replay()
+
+    # -------------------------------------------------------------------------
+    #  lru_cache-compatible API
+    # -------------------------------------------------------------------------
+    def cache_info(self) -> CacheInfo:
+        with self._lock:
+            return CacheInfo(self._hits, self._misses, self._maxsize, len(self._data))
+
+    def cache_clear(self):
+        """Clear all cached buffers;  iterators that were already returned are not affected."""
+        with self._lock:
+            self._data.clear()
+            self._hits = 0
+            self._misses = 0
+
+    def cache_parameters(self) -> dict:
+        return dict(maxsize=self._maxsize, typed=self._typed)
+
+
+# =================================================================================================
+#  Replay buffer
+# =================================================================================================
+class _ReplayBuffer:
+    """Thread-safe buffer lazily materializing the items of an iterator, which can be replayed any number of times."""
+
+    def __init__(self, source: Iterator):
+        self._source: Iterator | None = source
+        self._items: list[Any] = []
+        self._lock = threading.Lock()
+        self.exception: BaseException | None = None
+
+    def replay(self) -> Iterator:
+        i = 0
+        while (i < len(self._items)) or self._advance(i):
+            yield self._items[i]
+            i += 1
+
+    def _advance(self, n_seen: int) -> bool:
+        """Make sure more than n_seen items are available;  returns False if the source is exhausted."""
+        with self._lock:
+            if len(self._items) > n_seen:
+                return True  # another consumer advanced the source in the meantime
+            if self.exception is not None:
+                raise self.exception
+            if self._source is None:
+                return False
+            try:
+                self._items.append(next(self._source))
+                return True
+            except StopIteration:
+                self._source = None
+                return False
+            except BaseException as e:
+                self.exception, self._source = e, None
+                raise
@@ -0,0 +1,114 @@
+import hashlib
+import pickle
+from typing import Any
+
+import numpy as np
+
+
+# =================================================================================================
+#  Stable hashing
+# =================================================================================================
+def stable_hash(*objects: Any) -> str:
+    """
+    Compute a hash (hex digest) of the provided objects that is stable across processes and Python sessions, unlike
+    the built-in hash() which is randomized per process for e.g. str and bytes.
+
+    Supports scalars, strings, bytes, numpy arrays (hashed by dtype, shape & raw buffer contents, without copy for
+    contiguous arrays), tuples, lists, dicts & sets (recursively).  Other objects are hashed by their pickled form.
+    """
+    h = hashlib.blake2b(digest_size=20)
+    for obj in objects:
+        _update_hash(h, obj)
+    return h.hexdigest()
+
+
+# =================================================================================================
+#  Freezing
+# =================================================================================================
+def freeze(obj: Any) -> Any:
+    """
+    Convert object into a hashable equivalent, to be used as (part of) a cache key:
+      - numpy arrays are represented by a content hash (dtype, shape & raw buffer; no copy for contiguous arrays)
+      - lists, dicts & sets are converted to tuples / frozensets  (recursively)
+      - tuples are frozen element-wise  (recursively)
+      - all other objects are returned as-is
+    """
+    if isinstance(obj, np.ndarray):
+        return _ARRAY_MARK, stable_hash(obj)
+    elif isinstance(obj, tuple):
+        return tuple(freeze(item) for item in obj)
+    elif isinstance(obj, list):
+        return _LIST_MARK, tuple(freeze(item) for item in obj)
+    elif isinstance(obj, dict):
+        return _DICT_MARK, frozenset((key, freeze(value)) for key, value in obj.items())
+    elif isinstance(obj, set):
+        return frozenset(freeze(item) for item in obj)
+    else:
+        return obj
+
+
+class _Mark:
+    """
+    Marker objects used in frozen representations, to avoid collisions between e.g. lists and tuples.
+
+    Markers are interned by name, such that they remain identical after unpickling (e.g. in cache snapshots).
+    """
+
+    __slots__ = ("name",)
+
+    def __new__(cls, name: str):
+        mark = _MARKS.get(name)
+        if mark is None:
+            mark = _MARKS[name] = super().__new__(cls)
+            mark.name = name
+        return mark
+
+    def __reduce__(self):
+        return _Mark, (self.name,)
+
+    def __repr__(self) -> str:
+        return f"<{self.name}>"
+
+
+_MARKS: dict[str, _Mark] = dict()
+
+
+_ARRAY_MARK = _Mark("ndarray")
+_LIST_MARK = _Mark("list")
+_DICT_MARK = _Mark("dict")
+
+
+# =================================================================================================
+#  Helpers
+# =================================================================================================
+def _update_hash(h: "hashlib._Hash", obj: Any):
+    if (obj is None) or isinstance(obj, (bool, int, float, complex, str)):
+        _update_tagged(h, type(obj).__name__, repr(obj).encode())
+    elif isinstance(obj, bytes):
+        _update_tagged(h, "bytes", obj)
+    elif isinstance(obj, np.ndarray) and not obj.dtype.hasobject:
+        _update_tagged(h, "ndarray", f"{obj.dtype.str}{obj.shape}".encode())
+        h.update(np.ascontiguousarray(obj).reshape(-1).view(np.uint8))  # raw bytes;  also for e.g. datetime64
+    elif isinstance(obj, np.generic):
+        _update_tagged(h, f"np.{obj.dtype.str}", obj.tobytes())
+    elif isinstance(obj, (tuple, list)):
+        _update_tagged(h, type(obj).__name__, str(len(obj)).encode())
+        for item in obj:
+            _update_hash(h, item)
+    elif isinstance(obj, dict):
+        _update_tagged(h, "dict", str(len(obj)).encode())
+        for key_hash, value in sorted(((stable_hash(k), v) for k, v in obj.items()), key=lambda kv: kv[0]):
+            h.update(key_hash.encode())
+            _update_hash(h, value)
+    elif isinstance(obj, (set, frozenset)):
+        _update_tagged(h, "set", str(len(obj)).encode())
+        for item_hash in sorted(stable_hash(item) for item in obj):
+            h.update(item_hash.encode())
+    else:
+        _update_tagged(h, "pickle", pickle.dumps(obj, protocol=4))
+
+
+def _update_tagged(h: "hashlib._Hash", tag: str, data: bytes):
+    # include tag & length to avoid collisions between e.g. ("ab", "c") and ("a", "bc") or 1 and "1"
+    h.update(f"<{tag}:{len(data)}>".encode())
+    h.update(data)
@@ -0,0 +1,106 @@
+import itertools
+import sys
+import threading
+import weakref
+from collections import OrderedDict
+from typing import Any, Hashable
+
+import numpy as np
+
+
+# =================================================================================================
+#  MemoryBudget
+# =================================================================================================
+class MemoryBudget:
+    """
+    Memory budget (in bytes) that can be shared by multiple per-instance caches, e.g. all per-instance caches of a
+    certain method, or even of multiple methods & classes.
+
+    When the total size of all cached entries exceeds max_bytes, entries are evicted in least-recently-used order
+    across all attached caches, until the total size is within budget again.
+
+    All caches attached to the same budget share a single lock, which keeps cross-cache eviction simple & safe, at the
+    cost of some lock contention in heavily multithreaded scenarios.
+
+    Example:
+
+        budget = MemoryBudget(max_bytes=512 * 1024 * 1024)
+
+        class MyClass:
+
+            @per_instance_cache(memory_budget=budget)
+            def compute_something(self, x: int) -> np.ndarray:
+                # expensive computation here
+                pass
+
+    """
+
+    # -------------------------------------------------------------------------
+    #  Constructor
+    # -------------------------------------------------------------------------
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self.lock = threading.RLock()
+
+        self._tokens = itertools.count()  # unique token per attached cache
+        self._entries: OrderedDict[tuple[int, Hashable], tuple[weakref.ref, int]] = OrderedDict()
+        self._total_bytes = 0
+        self._dead_tokens: list[int] = []  # tokens of garbage collected caches, of which entries are still present
+
+    # -------------------------------------------------------------------------
+    #  Public API
+    # -------------------------------------------------------------------------
+    @property
+    def total_bytes(self) -> int:
+        """Total size in bytes of all entries currently cached by all caches attached to this budget."""
+        with self.lock:
+            self._purge_dead()
+            return self._total_bytes
+
+    # -------------------------------------------------------------------------
+    #  Internal API - used by MethodCache;  assumes lock is held
+    # -------------------------------------------------------------------------
+    def _attach(self, cache: object) -> tuple[int, weakref.ref]:
+        """Attach cache to budget & return unique token + weak reference to be passed in subsequent calls."""
+        token = next(self._tokens)
+        return token, weakref.ref(cache, lambda _: self._dead_tokens.append(token))
+
+    def _register(self, token: int, cache_ref: weakref.ref, key: Hashable, size: int):
+        """Register new entry & evict least recently used entries (of any attached cache) until within budget."""
+        self._purge_dead()
+        self._entries[(token, key)] = (cache_ref, size)
+        self._total_bytes += size
+        while (self._total_bytes > self.max_bytes) and self._entries:
+            (token_evicted, key_evicted), (ref_evicted, size_evicted) = self._entries.popitem(last=False)
+            self._total_bytes -= size_evicted
+            if (cache := ref_evicted()) is not None:
+                cache._remove(key_evicted, notify_budget=False, evicted=True)
+
+    def _touch(self, token: int, key: Hashable):
+        """Mark entry as most recently used."""
+        self._entries.move_to_end((token, key))
+
+    def _unregister(self, token: int, key: Hashable):
+        # entries evicted by their own cache before being registered (e.g. with maxsize=0) are not present
+        entry = self._entries.pop((token, key), None)
+        if entry is not None:
+            self._total_bytes -= entry[1]
+
+    def _purge_dead(self):
+        """Remove entries of caches that were garbage collected."""
+        if self._dead_tokens:
+            dead_tokens = set(self._dead_tokens)
+            self._dead_tokens.clear()
+            for token, key in [entry_key for entry_key in self._entries if entry_key[0] in dead_tokens]:
+                self._unregister(token, key)
+
+
+# =================================================================================================
+#  Sizing
+# =================================================================================================
+def default_sizer(value: Any) -> int:
+    """Estimate memory footprint in bytes of a cached value; uses ndarray.nbytes for numpy arrays."""
+    if isinstance(value, np.ndarray):
+        return value.nbytes
+    else:
+        return sys.getsizeof(value)
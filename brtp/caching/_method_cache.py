@@ -0,0 +1,508 @@
+import functools
+import math
+import threading
+import time
+import warnings
+import weakref
+from collections import namedtuple
+from concurrent.futures import Future, wait
+from typing import Any, Callable, Hashable, Iterable
+
+import numpy as np
+
+from ._eviction_policies import POLICIES, validate_policy
+from ._hashing import _Mark, freeze
+from ._memory_budget import MemoryBudget, default_sizer
+from ._prefetch import PrefetchInfo, prefetch_executor
+from ._statistics import CacheStats
+
+# same fields as functools.lru_cache's cache_info()
+CacheInfo = namedtuple("CacheInfo", ["hits", "misses", "maxsize", "currsize"])
+
+
+# =================================================================================================
+#  MethodCache
+# =================================================================================================
+class MethodCache:
+    """
+    Pure-Python lru-cache with the same interface as the objects returned by functools.lru_cache
+    (__call__, cache_info, cache_clear, cache_parameters), used as per-instance cache whenever options are requested
+    that functools.lru_cache does not support.
+
+    When single_flight=True, concurrent calls with a key that is not cached yet result in only 1 actual computation;
+    all other callers block until that computation finishes and then receive the same result (or exception).
+
+    When ttl is provided, entries expire after a given number of seconds (measured using a monotonic clock).  ttl can
+    either be a float (same time-to-live for all entries) or a callable mapping a result to its time-to-live
+    (or None for entries that should never expire), to provide a per-entry max-age.  Expired entries are removed
+    lazily when they are accessed, or explicitly using expire().
+
+    When max_bytes is provided, the size of each entry is estimated using sizer (default: ndarray.nbytes for numpy
+    arrays, sys.getsizeof otherwise) and least recently used entries are evicted until the total size is within
+    max_bytes.  Additionally, a MemoryBudget can be provided, which is shared with other caches and enforces a global
+    limit across all of them.
+
+    When stats is provided, hits, misses, evictions, time spent computing misses, ... are additionally recorded in
+    this CacheStats object, which is typically shared by all per-instance caches of the same method.
+
+    When content_keys=True, unhashable arguments are supported by freezing them before constructing the cache key;
+    numpy arrays are represented by a content hash, lists, dicts & sets are converted to hashable equivalents.
+    In this mode, numpy array results are marked read-only before caching, such that cached arrays shared between
+    callers cannot be modified.
+
+    The policy argument selects which entries are evicted when the cache is full:  'lru' (default), 'lfu' (least
+    frequently used, with aging), '2q' (scan-resistant) or 's3fifo' (FIFO-based, scan-resistant).  All policies
+    other than 'lru' require maxsize to be set.  Byte-based eviction follows the same policy.
+
+    When prefetch is provided, it is called with the arguments of each call and should return an iterable of
+    predicted positional argument tuples (or single arguments) that are likely to be requested next.  Predicted keys
+    that are not cached yet are computed on a shared background thread pool;  callers requesting a key that is being
+    prefetched wait for that computation instead of starting a new one, while keys of which the prefetch has not
+    started yet are claimed & computed by the caller itself.  Prefetch hits & waste (prefetched
+    entries removed without being requested) are reported by prefetch_info().
+    """
+
+    # -------------------------------------------------------------------------
+    #  Constructor
+    # -------------------------------------------------------------------------
+    def __init__(
+        self,
+        func: Callable,
+        maxsize: int | None = 128,
+        typed: bool = False,
+        single_flight: bool = False,
+        ttl: float | Callable[[Any], float | None] | None = None,
+        max_bytes: int | None = None,
+        sizer: Callable[[Any], int] | None = None,
+        memory_budget: MemoryBudget | None = None,
+        stats: CacheStats | None = None,
+        content_keys: bool = False,
+        policy: str = "lru",
+        prefetch: Callable[..., Iterable] | None = None,
+    ):
+        validate_policy(policy, maxsize)
+
+        # settings
+        self._func = func
+        self._maxsize = maxsize
+        self._typed = typed
+        self._single_flight = single_flight
+        self._ttl = ttl
+        self._max_bytes = max_bytes
+        self._sizer = sizer or default_sizer
+        self._memory_budget = memory_budget
+        self._track_bytes = (max_bytes is not None) or (memory_budget is not None)
+        self._stats = stats
+        self._content_keys = content_keys
+        self._policy_name = policy
+        self._prefetch = prefetch
+
+        # state
+        if memory_budget is None:
+            self._lock = threading.RLock()
+        else:
+            self._lock = memory_budget.lock
+            self._budget_token, self._budget_ref = memory_budget._attach(self)
+        self._data: dict[Hashable, Any] = dict()
+        self._policy = POLICIES[policy](maxsize)  # tracks which entry to evict next
+        self._in_flight: dict[Hashable, _InFlight] = dict()
+        self._generation = 0  # incremented by cache_clear();  results of computations started before are not stored
+        self._expiry: dict[Hashable, float] = dict()  # key -> monotonic time of expiry  (only used if ttl is set)
+        self._sizes: dict[Hashable, int] = dict()  # key -> size in bytes  (only used if bytes are tracked)
+        self._total_bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._prefetched: set[Hashable] = set()  # prefetched keys that were not requested yet
+        self._prefetch_submitted = 0
+        self._prefetch_hits = 0
+        self._prefetch_wasted = 0
+
+        if stats is not None:
+            # make sure entries are no longer counted in the shared stats once this cache is garbage collected
+            self._stats_live = [0, 0]  # [n_entries, n_bytes] of this cache, as registered in stats
+            weakref.finalize(self, _release_stats, stats, self._stats_live)
+
+        functools.update_wrapper(self, func)
+
+    # -------------------------------------------------------------------------
+    #  Main functionality
+    # -------------------------------------------------------------------------
+    def __call__(self, *args, **kwargs) -> Any:
+        key = _make_key(args, kwargs, self._typed, self._content_keys)
+
+        # --- cache lookup --------------------------------
+        with self._lock:
+            value = self._lookup(key)
+            if value is _MISSING:
+                computing, waiting_for = self._register_miss(key)
+                generation = self._generation
+
+        if self._prefetch is not None:
+            self._submit_prefetch(key, args, kwargs)  # before computing, such that prefetching happens concurrently
+        if value is not _MISSING:
+            return value
+
+        # --- wait for other thread -----------------------
+        if waiting_for is not None:
+            return waiting_for.result()
+
+        # --- compute -------------------------------------
+        t_start = time.perf_counter()
+        try:
+            result = self._func(*args, **kwargs)
+        except BaseException as e:
+            if computing is not None:
+                with self._lock:
+                    self._release(key, computing)
+                computing.set_exception(e)
+            raise
+        finally:
+            if self._stats is not None:
+                self._stats.record_miss(time.perf_counter() - t_start)
+        if self._content_keys and isinstance(result, np.ndarray):
+            result.flags.writeable = False
+
+        with self._lock:
+            if generation == self._generation:
+                self._store(key, result)  # (computed before the cache was cleared otherwise -> possibly outdated)
+            if computing is not None:
+                self._release(key, computing)
+        if computing is not None:
+            computing.set_result(result)
+
+        return result
+
+    def _lookup(self, key: Hashable) -> Any:
+        """Return cached value & register hit, or _MISSING if not (or no longer) cached.  Assumes lock is held."""
+        if key in self._data:
+            if self._expiry and (self._expiry.get(key, math.inf) <= time.monotonic()):
+                self._remove(key, expired=True)
+            else:
+                self._hits += 1
+                if self._stats is not None:
+                    self._stats.record_hit()
+                if self._prefetched and (key in self._prefetched):
+                    self._prefetched.discard(key)
+                    self._prefetch_hits += 1
+                self._policy.on_hit(key)
+                if self._memory_budget is not None:
+                    self._memory_budget._touch(self._budget_token, key)
+                return self._data[key]
+        return _MISSING
+
+    def _register_miss(self, key: Hashable) -> tuple["_InFlight | None", "_InFlight | None"]:
+        """
+        Register cache miss & return (computing, waiting_for), with 'computing' the in-flight computation this thread
+        is responsible for and 'waiting_for' the in-flight computation of another thread to wait for (if any).
+        Assumes lock is held.
+        """
+        computing = None
+        waiting_for = None
+        in_flight = self._in_flight.get(key)  # only non-empty with single_flight or prefetch
+        if (in_flight is not None) and (in_flight.thread_id is not None) and (in_flight.generation != self._generation):
+            in_flight = None  # started before the cache was cleared -> possibly outdated, so don't wait for it
+        if (in_flight is not None) and in_flight.prefetched and (in_flight.thread_id is None):
+            # prefetch is still queued -> claim it & compute in this thread.  Never wait for a queued prefetch, since
+            # the waiting thread might be a prefetch worker itself (recursive methods), which would deadlock the pool.
+            in_flight.thread_id = threading.get_ident()
+            in_flight.prefetched = False
+            in_flight.generation = self._generation
+            computing = in_flight
+        elif (in_flight is not None) and (in_flight.thread_id != threading.get_ident()):
+            waiting_for = in_flight
+        elif self._single_flight and (in_flight is None):
+            computing = self._in_flight[key] = _InFlight(generation=self._generation)
+        # else: recursive call for the same key from the owning thread -> just compute
+
+        if waiting_for is None:
+            self._misses += 1
+        else:
+            self._hits += 1
+            if self._stats is not None:
+                self._stats.record_hit()
+            if waiting_for.prefetched:
+                waiting_for.requested = True
+                self._prefetch_hits += 1
+        return computing, waiting_for
+
+    def _release(self, key: Hashable, in_flight: "_InFlight"):
+        """Remove in-flight computation of key, unless it was superseded after cache_clear().  Assumes lock is held."""
+        if self._in_flight.get(key) is in_flight:
+            del self._in_flight[key]
+
+    def _store(self, key: Hashable, value: Any):
+        """Store new key-value pair & evict entries according to the eviction policy if needed.  Assumes lock is held."""
+        if key in self._data:
+            # can happen with recursive calls for the same key
+            self._remove(key)
+
+        # --- check size ----------------------------------
+        maxsize = math.inf if self._maxsize is None else max(0, self._maxsize)
+        if maxsize == 0:
+            return  # nothing is cached, analogous to functools.lru_cache(maxsize=0)
+        max_bytes = math.inf if self._max_bytes is None else self._max_bytes
+        size = 0
+        if self._track_bytes:
+            size = self._sizer(value)
+            if (size > max_bytes) or ((self._memory_budget is not None) and (size > self._memory_budget.max_bytes)):
+                # entry on its own exceeds the budget -> don't cache it, rather than evicting all other entries
+                return
+
+        # --- evict ---------------------------------------
+        # before inserting, such that the policy can never select the new key itself
+        while self._data and ((len(self._data) >= maxsize) or (self._total_bytes + size > max_bytes)):
+            self._remove(self._policy.victim(), evicted=True)
+
+        # --- store ---------------------------------------
+        self._data[key] = value
+        self._policy.on_insert(key)
+        if self._track_bytes:
+            self._sizes[key] = size
+            self._total_bytes += size
+        if self._ttl is not None:
+            ttl = self._ttl(value) if callable(self._ttl) else self._ttl
+            if ttl is not None:
+                self._expiry[key] = time.monotonic() + ttl
+        if self._stats is not None:
+            self._stats.record_added(size)
+            self._stats_live[0] += 1
+            self._stats_live[1] += size
+
+        if self._memory_budget is not None:
+            self._memory_budget._register(self._budget_token, self._budget_ref, key, size)
+
+    def _remove(self, key: Hashable, notify_budget: bool = True, evicted: bool = False, expired: bool = False):
+        """Remove entry from the cache.  Assumes lock is held."""
+        del self._data[key]
+        self._policy.on_remove(key)
+        if self._prefetched and (key in self._prefetched):
+            self._prefetched.discard(key)
+            self._prefetch_wasted += 1
+        self._expiry.pop(key, None)
+        size = self._sizes.pop(key, 0)
+        if self._track_bytes:
+            self._total_bytes -= size
+            if notify_budget and (self._memory_budget is not None):
+                self._memory_budget._unregister(self._budget_token, key)
+        if self._stats is not None:
+            self._stats.record_removed(size, evicted=evicted, expired=expired)
+            self._stats_live[0] -= 1
+            self._stats_live[1] -= size
+
+    # -------------------------------------------------------------------------
+    #  Prefetching
+    # -------------------------------------------------------------------------
+    def _submit_prefetch(self, current_key: Hashable, args: tuple, kwargs: dict):
+        """
+        Submit keys predicted by the prefetch hook for background computation, if not cached or in flight.
+        Prefetching is speculative, so errors (in the hook, or when submitting) are reported as a warning instead of
+        being raised, such that they never affect the caller's own computation.
+        """
+        try:
+            for predicted_args in self._prefetch(*args, **kwargs):
+                predicted_args = predicted_args if isinstance(predicted_args, tuple) else (predicted_args,)
+                key = _make_key(predicted_args, {}, self._typed, self._content_keys)
+                with self._lock:
+                    if (key == current_key) or (key in self._data) or (key in self._in_flight):
+                        continue
+                    in_flight = self._in_flight[key] = _InFlight(prefetched=True, generation=self._generation)
+                    self._prefetch_submitted += 1
+                try:
+                    prefetch_executor().submit(self._run_prefetch, key, predicted_args, in_flight)
+                except BaseException as e:
+                    with self._lock:
+                        if in_flight.thread_id is not None:
+                            raise  # claimed by a caller in the meantime, which is responsible for it
+                        self._release(key, in_flight)
+                        self._prefetch_submitted -= 1
+                    in_flight.set_exception(e)
+                    raise
+        except Exception as e:
+            warnings.warn(
+                f"Prefetching for {getattr(self._func, '__qualname__', self._func)} failed: {e!r}",
+                RuntimeWarning,
+                stacklevel=3,
+            )
+
+    def _run_prefetch(self, key: Hashable, args: tuple, in_flight: "_InFlight"):
+        """Compute & store a prefetched entry;  executed on the shared prefetch thread pool."""
+        with self._lock:
+            if in_flight.thread_id is not None:
+                return  # claimed by a caller in the meantime, which computes it instead
+            in_flight.thread_id = threading.get_ident()
+            in_flight.generation = self._generation
+        try:
+            result = self._func(*args)
+        except BaseException as e:
+            with self._lock:
+                self._release(key, in_flight)
+            in_flight.set_exception(e)  # only raised in callers that were waiting for this result
+            return
+        if self._content_keys and isinstance(result, np.ndarray):
+            result.flags.writeable = False
+
+        with self._lock:
+            if in_flight.generation == self._generation:
+                self._store(key, result)
+                if (key in self._data) and not in_flight.requested:
+                    self._prefetched.add(key)
+            self._release(key, in_flight)
+        in_flight.set_result(result)
+
+    def prefetch_info(self) -> PrefetchInfo:
+        """Number of submitted, hit & wasted speculative precomputations."""
+        with self._lock:
+            return PrefetchInfo(self._prefetch_submitted, self._prefetch_hits, self._prefetch_wasted)
+
+    def prefetch_wait(self, timeout: float | None = None):
+        """Wait until all prefetches that are currently in flight have finished."""
+        with self._lock:
+            in_flight = [f for f in self._in_flight.values() if f.prefetched]
+        wait(in_flight, timeout=timeout)
+
+    # -------------------------------------------------------------------------
+    #  Expiry
+    # -------------------------------------------------------------------------
+    def expire(self) -> int:
+        """Remove all expired entries from the cache & return the number of removed entries."""
+        with self._lock:
+            now = time.monotonic()
+            expired_keys = [key for key, t_expiry in self._expiry.items() if t_expiry <= now]
+            for key in expired_keys:
+                self._remove(key, expired=True)
+            return len(expired_keys)
+
+    # -------------------------------------------------------------------------
+    #  lru_cache-compatible API
+    # -------------------------------------------------------------------------
+    def cache_info(self) -> CacheInfo:
+        with self._lock:
+            return CacheInfo(self._hits, self._misses, self._maxsize, len(self._data))
+
+    def cache_clear(self):
+        """Remove all entries;  results of computations that are in progress at this time will not be cached."""
+        with self._lock:
+            self._generation += 1
+            for key in list(self._data):
+                self._remove(key)
+            self._hits = 0
+            self._misses = 0
+            self._prefetch_submitted = 0
+            self._prefetch_hits = 0
+            self._prefetch_wasted = 0
+
+    def cache_parameters(self) -> dict:
+        parameters = dict(maxsize=self._maxsize, typed=self._typed)
+        if self._ttl is not None:
+            parameters["ttl"] = self._ttl
+        if self._max_bytes is not None:
+            parameters["max_bytes"] = self._max_bytes
+        if self._content_keys:
+            parameters["content_keys"] = True
+        if self._policy_name != "lru":
+            parameters["policy"] = self._policy_name
+        if self._prefetch is not None:
+            parameters["prefetch"] = self._prefetch
+        return parameters
+
+    # -------------------------------------------------------------------------
+    #  Snapshots
+    # -------------------------------------------------------------------------
+    def cache_export(self) -> list[tuple[Hashable, Any, float | None]]:
+        """
+        Export all non-expired entries as a list of (key, value, remaining_ttl)-tuples, with remaining_ttl in seconds
+        (None = never expires).  Can be used to pre-populate another cache using cache_import().
+        """
+        with self._lock:
+            now = time.monotonic()
+            entries = []
+            for key, value in self._data.items():
+                t_expiry = self._expiry.get(key)
+                if t_expiry is None:
+                    entries.append((key, value, None))
+                elif t_expiry > now:
+                    entries.append((key, value, t_expiry - now))
+            return entries
+
+    def cache_import(self, entries: Iterable[tuple[Hashable, Any, float | None]]) -> int:
+        """
+        Pre-populate the cache with entries obtained using cache_export(), returning the number of entries retained.
+        Imported entries are subject to the usual limits (maxsize, max_bytes, ...) and count as neither hit nor miss.
+        """
+        with self._lock:
+            keys = dict()  # used as ordered set
+            for key, value, remaining_ttl in entries:
+                if self._content_keys and isinstance(value, np.ndarray):
+                    value.flags.writeable = False
+                self._store(key, value)
+                if key in self._data:
+                    keys[key] = None
+                    if remaining_ttl is not None:
+                        self._expiry[key] = time.monotonic() + remaining_ttl
+            return sum(key in self._data for key in keys)  # entries might have been evicted by later ones
+
+    def cache_bytes(self) -> int:
+        """Estimated total size in bytes of all entries in this cache (0 if neither max_bytes nor memory_budget set)."""
+        with self._lock:
+            return self._total_bytes
+
+
+# =================================================================================================
+#  Helpers
+# =================================================================================================
+_MISSING = object()  # sentinel indicating a cache miss
+
+
+def _release_stats(stats: CacheStats, stats_live: list[int]):
+    """Unregister remaining entries of a garbage collected cache from the shared stats."""
+    stats.record_released(n_entries=stats_live[0], n_bytes=stats_live[1])
+
+
+class _InFlight(Future):
+    """Future representing a computation in progress, remembering which thread is performing it."""
+
+    def __init__(self, prefetched: bool = False, generation: int = 0):
+        super().__init__()
+        self.thread_id = None if prefetched else threading.get_ident()  # prefetches: set once started
+        self.prefetched = prefetched
+        self.generation = generation  # generation of the cache when the computation started
+        self.requested = False  # True if a caller waited for this (prefetched) result
+
+
+class _HashedKey(list):
+    """List subclass that caches its hash, analogous to functools._HashedSeq."""
+
+    __slots__ = ("hash_value",)
+
+    def __init__(self, tup: tuple):
+        super().__init__(tup)
+        self.hash_value = hash(tup)
+
+    def __hash__(self):
+        return self.hash_value
+
+    def __reduce__(self):
+        # recompute hash after unpickling, since hashes of e.g. strings differ across processes
+        return _HashedKey, (tuple(self),)
+
+
+_KWARGS_MARK = _Mark("kwargs")  # separates positional from keyword arguments in cache keys
+
+
+def _make_key(args: tuple, kwargs: dict, typed: bool, content_keys: bool = False) -> Hashable:
+    """
+    Construct cache key from function arguments, following the same conventions as functools.lru_cache.
+    With content_keys=True, unhashable arguments (numpy arrays, lists, dicts, sets) are frozen first.
+    """
+    key = tuple(freeze(v) for v in args) if content_keys else args
+    if kwargs:
+        key += (_KWARGS_MARK,)
+        for k, v in kwargs.items():
+            key += (k, freeze(v) if content_keys else v)
+    if typed:
+        key += tuple(type(v) for v in args)
+        if kwargs:
+            key += tuple(type(v) for v in kwargs.values())
+    elif len(key) == 1 and type(key[0]) in {int, str}:
+        return key[0]
+    return _HashedKey(key)
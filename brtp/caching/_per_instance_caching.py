@@ -1,5 +1,19 @@
 import functools
-from typing import Callable
+import inspect
+import threading
+import weakref
+from typing import Any, Callable, Iterable
+
+from brtp.misc.argument_handling import all_are_none
+
+from ._async_method_cache import AsyncMethodCache
+from ._compact_method_cache import CompactMethodCache
+from ._dependencies import register_dependencies
+from ._eviction_policies import validate_policy
+from ._generator_method_cache import GeneratorMethodCache
+from ._memory_budget import MemoryBudget
+from ._method_cache import CacheInfo, MethodCache
+from ._statistics import cache_stats_registry
 
 
 # =================================================================================================
@@ -10,6 +24,18 @@ def per_instance_lru_cache(
     *,
     maxsize: int | None = 128,
     typed: bool = False,
+    thread_safe: bool = False,
+    ttl: float | Callable[[Any], float | None] | None = None,
+    max_bytes: int | None = None,
+    sizer: Callable[[Any], int] | None = None,
+    memory_budget: MemoryBudget | None = None,
+    track_stats: bool = False,
+    content_keys: bool = False,
+    compact: bool = False,
+    depends_on: Iterable[str] = (),
+    policy: str = "lru",
+    exportable: bool = False,
+    prefetch: Callable[..., Iterable] | None = None,
 ):
     """
     Caching decorator to be applied to instance methods, instantiating a lru_cache on a per-instance basis.
@@ -23,6 +49,65 @@ def per_instance_lru_cache(
       - keeps a separate cache per instance (instantiated on first method call per instance)
       - makes sure all additional functionality (cache_clear, ...) also works on a per-instance basis
 
+    With thread_safe=True, the decorator additionally guarantees that...
+      - the per-instance cache is created exactly once, also when multiple threads call the method simultaneously
+      - concurrent calls for a key that is not cached yet result in a single computation ('single-flight'); all other
+        callers block until that computation is finished and then share its result (or exception)
+
+    With ttl (time-to-live) provided, cached results expire after the given number of seconds (monotonic clock).
+    ttl can also be a callable mapping each result to its own max-age in seconds (or None = never expires).
+    Expired results are removed lazily on access, or explicitly using expire(), e.g. obj.compute_something.expire().
+
+    With max_bytes provided, the per-instance cache is additionally bounded by the estimated size in bytes of its
+    entries, evicting least recently used entries until within budget.  Sizes are estimated using ndarray.nbytes for
+    numpy arrays and sys.getsizeof otherwise, or using the provided sizer.  A MemoryBudget object can be provided to
+    enforce a global budget across all instances (or even across multiple methods).
+
+    With track_stats=True, hits, misses, evictions & time spent computing misses are aggregated across all instances
+    in the global cache_stats_registry, under the name '<module>.<qualified method name>'.
+
+    With content_keys=True, methods with unhashable arguments can be cached:  numpy arrays are keyed by a content
+    hash (dtype, shape & raw buffer), lists, dicts & sets are frozen into hashable equivalents.  Numpy array results
+    are returned as read-only arrays, such that cached arrays shared between callers cannot be modified.
+
+    With policy provided, a different eviction policy than least-recently-used is applied when the cache is full:
+      - 'lfu':     least frequently used, with aging such that formerly popular entries eventually get evicted
+      - '2q':      2Q, which is scan-resistant: entries accessed only once never push out frequently used entries
+      - 's3fifo':  S3-FIFO, scan-resistant using only FIFO queues, with quick demotion of one-hit wonders
+    All policies have O(1) (amortized) overhead per call and require maxsize to be set.
+
+    With exportable=True, the cache contents can be exported using cache_export() and imported into the cache of
+    another (e.g. freshly created) instance using cache_import(), or for all caches of an instance at once using
+    export_cache_snapshot & import_cache_snapshot.  This allows warm-starting caches after e.g. a restart.
+
+    With prefetch provided, results are speculatively precomputed on a background thread pool.  prefetch is called
+    with the same arguments as the method (including self) and should return the positional arguments (tuples, or
+    single values) of calls that are likely to follow, e.g. neighbouring values in a parameter sweep.  Callers
+    requesting a result that is still being prefetched wait for it rather than recomputing it.  Prefetch hits &
+    waste are reported per instance by prefetch_info(), e.g. obj.compute_something.prefetch_info().
+
+    Using any of these options comes at the cost of a pure-Python cache implementation, which has somewhat higher
+    per-call overhead.
+
+    With compact=True, a compact storage backend is used, which is intended for large numbers of small objects:
+      - works for classes with __slots__ (no instance __dict__ needed, but '__weakref__' should be in __slots__)
+      - no partial + lru_cache object per instance; all results are kept in 1 shared table per method, keyed by
+        weak instance reference, such that entries are freed as soon as the instance is garbage collected
+      - hits & misses reported by cache_info() are aggregated across all instances
+    This option can only be combined with maxsize, typed, content_keys, depends_on & exportable (compact caches are
+    always exportable).
+
+    With depends_on provided (names of instance attributes), the per-instance cache is automatically invalidated
+    whenever one of these attributes is reassigned (or deleted), such that cached results never go stale because of
+    such changes.  Caches of other methods, not depending on that attribute, are left untouched.  With thread_safe=True
+    (or compact=True), results of computations in progress during invalidation are not cached either.  NOTE: in-place
+    modifications of attribute values (e.g. self.x.append(...)) are not detected.
+
+    Class-wide, the caches of all live instances can be managed through the method on the class itself, e.g.
+    MyClass.compute_something.cache_clear_all() (e.g. after a global config change), cache_info_all() (hits, misses &
+    currsize summed across instances) & n_instances().  Caches are tracked using weak references, such that instances
+    are not kept alive.
+
     Example:
 
         class MyClass:
@@ -37,23 +122,89 @@ def per_instance_lru_cache(
                 # expensive computation here
                 pass
 
+            @per_instance_lru_cache(thread_safe=True)
+            def compute_something_shared(self, z: int) -> int:
+                # expensive computation here, called from multiple threads
+                pass
+
+            @per_instance_lru_cache(ttl=60.0)
+            def compute_something_volatile(self, z: int) -> int:
+                # expensive computation here, of which the result becomes stale after 1 minute
+                pass
+
+            @per_instance_lru_cache(maxsize=None, max_bytes=100_000_000, memory_budget=MemoryBudget(1_000_000_000))
+            def compute_something_large(self, z: int) -> np.ndarray:
+                # expensive computation here, returning large arrays (max 100MB/instance, 1GB in total)
+                pass
+
+            @per_instance_lru_cache(maxsize=1024, policy="s3fifo")
+            def compute_something_scanned(self, z: int) -> int:
+                # expensive computation here, with a skewed access pattern mixed with one-off scans
+                pass
+
+            @per_instance_lru_cache(prefetch=lambda self, n: [n + 1, n + 2])
+            def compute_something_swept(self, n: int) -> int:
+                # expensive computation here, typically called for n, n+1, n+2, ...
+                pass
+
+            @per_instance_lru_cache(depends_on=("a", "b"))
+            def compute_something_dependent(self, z: int) -> int:
+                # expensive computation here, using self.a & self.b
+                pass
+
+        class MySmallClass:
+
+            __slots__ = ("a", "__weakref__")
+
+            @per_instance_lru_cache(maxsize=16, compact=True)
+            def compute_something(self, x: int) -> int:
+                # expensive computation here
+                pass
+
 
     """
 
+    if compact and (
+        thread_safe or track_stats or (policy != "lru") or not all_are_none(ttl, max_bytes, memory_budget, prefetch)
+    ):
+        raise ValueError(
+            "compact=True can only be combined with the maxsize, typed, content_keys, depends_on & exportable options."
+        )
+    validate_policy(policy, maxsize)
+
     def decorator(wrapped: Callable) -> Callable:
-        def wrapper(self: object) -> Callable:
+        if compact:
+            return CompactMethodCache(
+                wrapped, maxsize=maxsize, typed=typed, content_keys=content_keys, depends_on=depends_on
+            )
+
+        stats = cache_stats_registry.get(f"{wrapped.__module__}.{wrapped.__qualname__}") if track_stats else None
+
+        def create_cache(self: object) -> Callable:
             # Create a cached version bound to this specific instance
-            return functools.lru_cache(maxsize=maxsize, typed=typed)(
-                functools.update_wrapper(
-                    functools.partial(wrapped, self),
-                    wrapped,
+            bound_method = functools.update_wrapper(functools.partial(wrapped, self), wrapped)
+            use_method_cache = thread_safe or track_stats or content_keys or exportable or (policy != "lru")
+            if use_method_cache or not all_are_none(ttl, max_bytes, memory_budget, prefetch):
+                return MethodCache(
+                    bound_method,
+                    maxsize=maxsize,
+                    typed=typed,
+                    single_flight=thread_safe,
+                    ttl=ttl,
+                    max_bytes=max_bytes,
+                    sizer=sizer,
+                    memory_budget=memory_budget,
+                    stats=stats,
+                    content_keys=content_keys,
+                    policy=policy,
+                    prefetch=None if prefetch is None else functools.partial(prefetch, self),
                 )
-            )
+            else:
+                return functools.lru_cache(maxsize=maxsize, typed=typed)(bound_method)
 
-        # the below usage of cached_property implements the actual per-instance behavior,
-        # making sure that the wrapper function is only called on first invocation per instance and then remembered,
-        # creating a new cache per instance
-        return functools.cached_property(wrapper)  # type: ignore
+        # the descriptor implements the actual per-instance behavior, making sure that create_cache is only called
+        # on first invocation per instance and then remembered, creating a new cache per instance
+        return _PerInstanceCacheDescriptor(wrapped, create_cache, thread_safe=thread_safe, depends_on=depends_on)
 
     return decorator if method is None else decorator(method)
 
@@ -61,4 +212,231 @@ def per_instance_lru_cache(
 # =================================================================================================
 #  per_instance_cache
 # =================================================================================================
-per_instance_cache = per_instance_lru_cache(maxsize=None)
+def per_instance_cache(
+    method: Callable | None = None,
+    *,
+    typed: bool = False,
+    thread_safe: bool = False,
+    ttl: float | Callable[[Any], float | None] | None = None,
+    max_bytes: int | None = None,
+    sizer: Callable[[Any], int] | None = None,
+    memory_budget: MemoryBudget | None = None,
+    track_stats: bool = False,
+    content_keys: bool = False,
+    compact: bool = False,
+    depends_on: Iterable[str] = (),
+    exportable: bool = False,
+    prefetch: Callable[..., Iterable] | None = None,
+):
+    """
+    Unbounded version of per_instance_lru_cache, i.e. with maxsize=None.  See per_instance_lru_cache for details.
+
+    Example:
+
+        class MyClass:
+
+            @per_instance_cache
+            def compute_something(self, x: int) -> int:
+                # expensive computation here
+                pass
+
+            @per_instance_cache(ttl=3600.0)
+            def compute_something_else(self, y: int) -> int:
+                # expensive computation here
+                pass
+
+    """
+    return per_instance_lru_cache(
+        method,
+        maxsize=None,
+        typed=typed,
+        thread_safe=thread_safe,
+        ttl=ttl,
+        max_bytes=max_bytes,
+        sizer=sizer,
+        memory_budget=memory_budget,
+        track_stats=track_stats,
+        content_keys=content_keys,
+        compact=compact,
+        depends_on=depends_on,
+        exportable=exportable,
+        prefetch=prefetch,
+    )
+
+
+# =================================================================================================
+#  per_instance_async_cache
+# =================================================================================================
+def per_instance_async_cache(
+    method: Callable | None = None,
+    *,
+    maxsize: int | None = None,
+    typed: bool = False,
+):
+    """
+    Async counterpart of per_instance_cache, to be applied to 'async def' instance methods.
+
+    Applying per_instance_(lru_)cache to a coroutine method would cache the coroutine object, which can only be
+    awaited once.  This decorator instead caches the awaited results, on a per-instance basis.  Concurrent awaits for
+    the same key are deduplicated into a single task, and cache_clear, cache_info, ... work per instance.
+
+    Example:
+
+        class MyClass:
+
+            @per_instance_async_cache
+            async def fetch_something(self, x: int) -> int:
+                # slow I/O here
+                pass
+
+            @per_instance_async_cache(maxsize=256)
+            async def fetch_something_else(self, y: int) -> int:
+                # slow I/O here
+                pass
+
+    """
+
+    def decorator(wrapped: Callable) -> Callable:
+        if not inspect.iscoroutinefunction(wrapped):
+            raise TypeError(f"per_instance_async_cache can only be applied to 'async def' methods, not {wrapped}.")
+
+        def create_cache(self: object) -> Callable:
+            # Create a cached version bound to this specific instance
+            bound_method = functools.update_wrapper(functools.partial(wrapped, self), wrapped)
+            return AsyncMethodCache(bound_method, maxsize=maxsize, typed=typed)
+
+        return _PerInstanceCacheDescriptor(wrapped, create_cache)
+
+    return decorator if method is None else decorator(method)
+
+
+# =================================================================================================
+#  per_instance_generator_cache
+# =================================================================================================
+def per_instance_generator_cache(
+    method: Callable | None = None,
+    *,
+    maxsize: int | None = None,
+    typed: bool = False,
+):
+    """
+    Counterpart of per_instance_cache, to be applied to generator methods (or other methods returning an iterator).
+
+    Applying per_instance_(lru_)cache to a generator method would cache the generator object, such that the second
+    caller receives an exhausted iterator.  This decorator instead caches a replay buffer per key, on a per-instance
+    basis:  each call returns a new iterator which replays the items produced so far and then continues the shared
+    underlying iteration, lazily, as items are pulled.  Concurrent consumers (also from different threads) share the
+    same underlying iteration, such that each item is computed only once.
+
+    NOTE: all produced items are kept in memory for as long as the entry is cached.
+
+    Example:
+
+        class MyClass:
+
+            @per_instance_generator_cache
+            def stream_something(self, n: int) -> Iterator[np.ndarray]:
+                for i in range(n):
+                    # expensive computation here
+                    yield ...
+
+    """
+
+    def decorator(wrapped: Callable) -> Callable:
+        def create_cache(self: object) -> Callable:
+            # Create a cached version bound to this specific instance
+            bound_method = functools.update_wrapper(functools.partial(wrapped, self), wrapped)
+            return GeneratorMethodCache(bound_method, maxsize=maxsize, typed=typed)
+
+        return _PerInstanceCacheDescriptor(wrapped, create_cache, thread_safe=True)
+
+    return decorator if method is None else decorator(method)
+
+
+# =================================================================================================
+#  Internal
+# =================================================================================================
+class _PerInstanceCacheDescriptor:
+    """
+    Non-data descriptor that behaves like functools.cached_property:  on first attribute access per instance, a cache
+    is created using create_cache(instance) and stored in the instance's __dict__, such that all subsequent lookups
+    bypass the descriptor entirely.
+
+    Unlike functools.cached_property (which is not thread-safe since Python 3.12), cache creation can be protected
+    by a lock, guaranteeing that only 1 cache is ever created per instance.
+
+    All created caches are additionally tracked in a weak registry, such that they can be managed class-wide (e.g.
+    MyClass.method.cache_clear_all()) without keeping instances alive.
+    """
+
+    def __init__(
+        self,
+        wrapped: Callable,
+        create_cache: Callable[[object], Callable],
+        thread_safe: bool = False,
+        depends_on: Iterable[str] = (),
+    ):
+        self._create_cache = create_cache
+        self._creation_lock = threading.Lock() if thread_safe else None
+        self._attr_name = wrapped.__name__
+        self._depends_on = tuple(depends_on)
+        self._caches: weakref.WeakSet[Callable] = weakref.WeakSet()  # all live per-instance caches
+        self._registry_lock = threading.Lock()
+        functools.update_wrapper(self, wrapped)
+
+    def __set_name__(self, owner: type, name: str):
+        self._attr_name = name
+        if self._depends_on:
+            register_dependencies(owner, self, self._depends_on)
+
+    def invalidate(self, instance: object):
+        """Clear the cache of the given instance, if it was already created."""
+        cache = instance.__dict__.get(self._attr_name)
+        if cache is not None:
+            cache.cache_clear()
+
+    def __get__(self, instance: object | None, owner: type | None = None):
+        if instance is None:
+            return self
+
+        instance_dict = instance.__dict__
+        if self._creation_lock is None:
+            cache = instance_dict[self._attr_name] = self._new_cache(instance)
+        else:
+            with self._creation_lock:
+                cache = instance_dict.get(self._attr_name)
+                if cache is None:
+                    cache = instance_dict[self._attr_name] = self._new_cache(instance)
+        return cache
+
+    def _new_cache(self, instance: object) -> Callable:
+        cache = self._create_cache(instance)
+        with self._registry_lock:
+            self._caches.add(cache)
+        return cache
+
+    # -------------------------------------------------------------------------
+    #  Class-wide API
+    # -------------------------------------------------------------------------
+    def _live_caches(self) -> list[Callable]:
+        with self._registry_lock:
+            return list(self._caches)
+
+    def cache_clear_all(self):
+        """Clear the caches of all live instances."""
+        for cache in self._live_caches():
+            cache.cache_clear()
+
+    def cache_info_all(self) -> CacheInfo:
+        """Hits, misses & currsize summed across the caches of all live instances;  maxsize is per instance."""
+        infos = [cache.cache_info() for cache in self._live_caches()]
+        return CacheInfo(
+            hits=sum(info.hits for info in infos),
+            misses=sum(info.misses for info in infos),
+            maxsize=infos[0].maxsize if infos else None,
+            currsize=sum(info.currsize for info in infos),
+        )
+
+    def n_instances(self) -> int:
+        """Number of live instances for which a cache was created."""
+        return len(self._live_caches())
@@ -0,0 +1,30 @@
+import os
+import threading
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+
+# counters of speculative precomputations of a cache
+#   submitted:  number of keys submitted for background computation
+#   hits:       number of prefetched results that were subsequently requested (also while still being computed)
+#   wasted:     number of prefetched results that were removed from the cache without ever being requested
+# submitted prefetches that were claimed by a caller before they started count as neither hit nor wasted.
+PrefetchInfo = namedtuple("PrefetchInfo", ["submitted", "hits", "wasted"])
+
+
+# =================================================================================================
+#  Shared thread pool
+# =================================================================================================
+_executor: ThreadPoolExecutor | None = None
+_executor_lock = threading.Lock()
+
+
+def prefetch_executor() -> ThreadPoolExecutor:
+    """Thread pool shared by all caches for background precomputation, created on first use."""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=min(4, os.cpu_count() or 1),
+                thread_name_prefix="brtp-cache-prefetch",
+            )
+        return _executor
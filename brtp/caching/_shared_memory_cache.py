@@ -0,0 +1,319 @@
+import functools
+import struct
+import sys
+import tempfile
+import uuid
+from multiprocessing import resource_tracker, shared_memory
+from pathlib import Path
+from typing import Any, Callable
+
+import numpy as np
+
+from ._file_lock import file_lock
+from ._hashing import stable_hash
+from ._method_cache import CacheInfo
+
+# --- memory layout ---------------------------------------
+#  segment = [segment header] [slot 0] [slot 1] ... [slot n_slots-1]
+#  slot    = [slot header] [data (slot_bytes)]
+_SEGMENT_HEADER = struct.Struct("<8sQQ")  # magic, n_slots, slot_bytes
+_SEGMENT_HEADER_BYTES = 64
+_SEGMENT_MAGIC = b"brtpSMC1"
+
+_MAX_NDIM = 8
+_SLOT_SEQ = struct.Struct("<Q")  # sequence number (0 = empty, odd = being written, even = valid)
+_SLOT_HEADER = struct.Struct(f"<QBB6x8sQ{_MAX_NDIM}q16s")  # seq, kind, ndim, dtype, nbytes, shape, key digest
+_SLOT_HEADER_BYTES = 128
+
+# --- value kinds -----------------------------------------
+_KIND_ARRAY = 0
+_KIND_NP_SCALAR = 1
+_KIND_INT = 2
+_KIND_FLOAT = 3
+_KIND_BOOL = 4
+_KIND_COMPLEX = 5
+
+
+# =================================================================================================
+#  SharedMemoryCache
+# =================================================================================================
+class SharedMemoryCache:
+    """
+    Cache backend with storage in a multiprocessing.shared_memory segment, such that worker processes (e.g. of a
+    ProcessPoolExecutor) see each other's results, without pickling round-trips.
+
+    Storage is a fixed-size hash table of n_slots slots, each able to hold a result of up to slot_bytes bytes.
+    Supported results are scalars (int, float, bool, complex, numpy scalars) and numpy arrays (non-object dtype,
+    max 8 dimensions).  Other results, or results that are too large, are simply not cached.  Keys are stable hashes
+    of function identity & arguments; collisions are resolved using linear probing, and when all probed slots are
+    occupied, the first one is overwritten.
+
+    Reads are lock-free (using a per-slot sequence number to detect concurrent overwrites) and always return a copy.
+    Writes are serialized across processes using a file lock (POSIX only).
+
+    The process creating the cache owns the shared memory segment and should unlink it when it is no longer needed,
+    e.g. by using it as a context manager.  SharedMemoryCache objects (and functions decorated with them) can be
+    pickled, in which case the unpickled copy attaches to the same segment, e.g. in worker processes.
+
+    Example:
+
+        def compute_something(x: float) -> np.ndarray:
+            # expensive computation here
+            pass
+
+        with SharedMemoryCache(n_slots=4096, slot_bytes=65536) as cache:
+            f = cache(compute_something)
+            with ProcessPoolExecutor() as executor:
+                results = list(executor.map(f, values))
+
+    """
+
+    # -------------------------------------------------------------------------
+    #  Constructor
+    # -------------------------------------------------------------------------
+    def __init__(self, n_slots: int = 1024, slot_bytes: int = 65536, name: str | None = None, create: bool = True):
+        """
+        :param n_slots: (int, default=1024) number of slots of the hash table.  Ignored if create=False.
+        :param slot_bytes: (int, default=65536) max size in bytes of a single result.  Ignored if create=False.
+        :param name: (str, optional) name of the shared memory segment;  auto-generated if not provided.
+        :param create: (bool, default=True) create a new segment (True) or attach to an existing one (False).
+        """
+        if create:
+            name = name or f"brtp_smc_{uuid.uuid4().hex[:16]}"
+            slot_bytes = -(-slot_bytes // 8) * 8  # round up to multiple of 8 bytes to keep slots aligned
+            size = _SEGMENT_HEADER_BYTES + n_slots * (_SLOT_HEADER_BYTES + slot_bytes)
+            self._shm = shared_memory.SharedMemory(name=name, create=True, size=size)
+            _SEGMENT_HEADER.pack_into(self._shm.buf, 0, _SEGMENT_MAGIC, n_slots, slot_bytes)
+        else:
+            self._shm = _attach(name)
+            magic, n_slots, slot_bytes = _SEGMENT_HEADER.unpack_from(self._shm.buf, 0)
+            if magic != _SEGMENT_MAGIC:
+                raise ValueError(f"Shared memory segment '{name}' is not a SharedMemoryCache.")
+
+        self._owner = create
+        self._n_slots = n_slots
+        self._slot_bytes = slot_bytes
+        self._max_probes = min(8, n_slots)
+        self._lock_path = Path(tempfile.gettempdir()) / f"{self._shm.name}.lock"
+
+        # statistics of the current process
+        self._hits = 0
+        self._misses = 0
+
+    # -------------------------------------------------------------------------
+    #  Properties
+    # -------------------------------------------------------------------------
+    @property
+    def name(self) -> str:
+        return self._shm.name
+
+    @property
+    def n_slots(self) -> int:
+        return self._n_slots
+
+    @property
+    def slot_bytes(self) -> int:
+        return self._slot_bytes
+
+    # -------------------------------------------------------------------------
+    #  Decorator
+    # -------------------------------------------------------------------------
+    def __call__(self, func: Callable) -> "SharedMemoryCachedFunction":
+        """Wrap function such that its results are cached in this shared memory cache."""
+        return functools.update_wrapper(SharedMemoryCachedFunction(func, self), func)
+
+    # -------------------------------------------------------------------------
+    #  Get / Set
+    # -------------------------------------------------------------------------
+    def get(self, key: bytes, default: Any = None) -> Any:
+        """Get value stored under the given 16-byte key, or default if not present."""
+        buf = self._shm.buf
+        for offset in self._probe_offsets(key):
+            seq_1, kind, ndim, dtype, nbytes, *shape_and_key = _SLOT_HEADER.unpack_from(buf, offset)
+            if seq_1 == 0:
+                break  # empty slot -> key is not present
+            if (seq_1 % 2 == 1) or (shape_and_key[-1] != key):
+                continue  # being written or other key
+
+            data_offset = offset + _SLOT_HEADER_BYTES
+            data = bytes(buf[data_offset : data_offset + nbytes])
+            if _SLOT_SEQ.unpack_from(buf, offset)[0] != seq_1:
+                break  # overwritten while reading
+
+            self._hits += 1
+            return _decode(kind, dtype, shape_and_key[:ndim], data)
+
+        self._misses += 1
+        return default
+
+    def set(self, key: bytes, value: Any) -> bool:
+        """Store value under the given 16-byte key.  Returns False if value is not supported or too large."""
+        encoded = _encode(value)
+        if (encoded is None) or (len(encoded[3]) > self._slot_bytes):
+            return False
+        kind, dtype, shape, data = encoded
+
+        buf = self._shm.buf
+        with file_lock(self._lock_path):
+            # --- select slot -----------------------------
+            offsets = self._probe_offsets(key)
+            selected_offset = offsets[0]  # overwrite first slot if all slots are occupied by other keys
+            for offset in offsets:
+                seq, *_, slot_key = _SLOT_HEADER.unpack_from(buf, offset)
+                if (seq == 0) or (slot_key == key):
+                    selected_offset = offset
+                    break
+
+            # --- write -----------------------------------
+            seq = _SLOT_SEQ.unpack_from(buf, selected_offset)[0]
+            _SLOT_SEQ.pack_into(buf, selected_offset, seq + 1)  # odd -> being written
+            data_offset = selected_offset + _SLOT_HEADER_BYTES
+            buf[data_offset : data_offset + len(data)] = data
+            padded_shape = list(shape) + [0] * (_MAX_NDIM - len(shape))
+            _SLOT_HEADER.pack_into(
+                buf, selected_offset, seq + 1, kind, len(shape), dtype, len(data), *padded_shape, key
+            )
+            _SLOT_SEQ.pack_into(buf, selected_offset, seq + 2)  # even -> valid
+
+        return True
+
+    def _probe_offsets(self, key: bytes) -> list[int]:
+        i_slot = int.from_bytes(key[:8], "little") % self._n_slots
+        slot_size = _SLOT_HEADER_BYTES + self._slot_bytes
+        return [
+            _SEGMENT_HEADER_BYTES + ((i_slot + i_probe) % self._n_slots) * slot_size
+            for i_probe in range(self._max_probes)
+        ]
+
+    # -------------------------------------------------------------------------
+    #  Management
+    # -------------------------------------------------------------------------
+    def cache_info(self) -> CacheInfo:
+        """Hits & misses of the current process;  currsize = number of occupied slots."""
+        n_occupied = sum(
+            _SLOT_SEQ.unpack_from(self._shm.buf, offset)[0] != 0
+            for offset in range(_SEGMENT_HEADER_BYTES, self._shm.size, _SLOT_HEADER_BYTES + self._slot_bytes)
+        )
+        return CacheInfo(self._hits, self._misses, self._n_slots, n_occupied)
+
+    def cache_clear(self):
+        with file_lock(self._lock_path):
+            for offset in range(_SEGMENT_HEADER_BYTES, self._shm.size, _SLOT_HEADER_BYTES + self._slot_bytes):
+                _SLOT_SEQ.pack_into(self._shm.buf, offset, 0)
+        self._hits = 0
+        self._misses = 0
+
+    def close(self):
+        """Close access to the shared memory segment from this process."""
+        self._shm.close()
+
+    def unlink(self):
+        """Destroy the shared memory segment;  should be called once, typically by the creating process."""
+        self._shm.unlink()
+        self._lock_path.unlink(missing_ok=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+        if self._owner:
+            self.unlink()
+
+    # -------------------------------------------------------------------------
+    #  Pickling
+    # -------------------------------------------------------------------------
+    def __reduce__(self):
+        return _attach_cache, (self.name,)
+
+
+# =================================================================================================
+#  SharedMemoryCachedFunction
+# =================================================================================================
+class SharedMemoryCachedFunction:
+    """Function wrapper returned by SharedMemoryCache.__call__;  picklable if the wrapped function is picklable."""
+
+    def __init__(self, func: Callable, cache: SharedMemoryCache):
+        self._func = func
+        self._cache = cache
+        self._func_id = (func.__module__, func.__qualname__)
+
+    def __call__(self, *args, **kwargs) -> Any:
+        key = bytes.fromhex(stable_hash(self._func_id, args, kwargs))[:16]
+        result = self._cache.get(key, _MISSING)
+        if result is _MISSING:
+            result = self._func(*args, **kwargs)
+            self._cache.set(key, result)
+        return result
+
+    def cache_info(self) -> CacheInfo:
+        return self._cache.cache_info()
+
+    def __reduce__(self):
+        return SharedMemoryCachedFunction, (self._func, self._cache)
+
+
+# =================================================================================================
+#  Helpers
+# =================================================================================================
+_MISSING = object()
+
+_attached_caches: dict[str, SharedMemoryCache] = dict()  # caches attached by unpickling, per process
+
+
+def _attach_cache(name: str) -> SharedMemoryCache:
+    """Attach to an existing cache by name, re-using previous attachments within the same process."""
+    if name not in _attached_caches:
+        _attached_caches[name] = SharedMemoryCache(name=name, create=False)
+    return _attached_caches[name]
+
+
+def _attach(name: str) -> shared_memory.SharedMemory:
+    """Attach to existing shared memory segment, without letting this process' resource tracker destroy it."""
+    if sys.version_info >= (3, 13):
+        return shared_memory.SharedMemory(name=name, track=False)
+    else:
+        shm = shared_memory.SharedMemory(name=name)
+        resource_tracker.unregister(shm._name, "shared_memory")  # private API, needed before Python 3.13
+        return shm
+
+
+def _encode(value: Any) -> tuple[int, bytes, tuple[int, ...], bytes] | None:
+    """Encode value as (kind, dtype, shape, data), or None if not supported."""
+    if isinstance(value, bool):
+        kind, arr = _KIND_BOOL, np.asarray(value)
+    elif isinstance(value, int):
+        if not (-(2**63) <= value < 2**63):
+            return None
+        kind, arr = _KIND_INT, np.asarray(value, dtype=np.int64)
+    elif isinstance(value, float):
+        kind, arr = _KIND_FLOAT, np.asarray(value)
+    elif isinstance(value, complex):
+        kind, arr = _KIND_COMPLEX, np.asarray(value)
+    elif isinstance(value, np.generic):
+        kind, arr = _KIND_NP_SCALAR, np.asarray(value)
+    elif isinstance(value, np.ndarray):
+        kind, arr = _KIND_ARRAY, value
+    else:
+        return None
+
+    dtype = arr.dtype.str.encode()
+    if arr.dtype.hasobject or (arr.ndim > _MAX_NDIM) or (len(dtype) > 8):
+        return None
+    return kind, dtype, arr.shape, np.ascontiguousarray(arr).tobytes()
+
+
+def _decode(kind: int, dtype: bytes, shape: list[int], data: bytes) -> Any:
+    arr = np.frombuffer(data, dtype=np.dtype(dtype.rstrip(b"\0").decode())).reshape(shape)
+    if kind == _KIND_ARRAY:
+        return arr.copy()  # frombuffer returns read-only array backed by immutable bytes
+    elif kind == _KIND_NP_SCALAR:
+        return arr[()]
+    elif kind == _KIND_INT:
+        return int(arr[()])
+    elif kind == _KIND_FLOAT:
+        return float(arr[()])
+    elif kind == _KIND_BOOL:
+        return bool(arr[()])
+    else:
+        return complex(arr[()])
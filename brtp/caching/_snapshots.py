@@ -0,0 +1,94 @@
+import pickle
+
+from ._compact_method_cache import CompactMethodCache
+from ._per_instance_caching import _PerInstanceCacheDescriptor
+
+_SNAPSHOT_VERSION = 1
+
+
+# =================================================================================================
+#  Export / import
+# =================================================================================================
+def export_cache_snapshot(instance: object, *method_names: str) -> bytes:
+    """
+    Export the contents of the per-instance caches of the given instance to a serialized snapshot, which can be used
+    to warm-start the caches of another instance (e.g. after a restart) using import_cache_snapshot.
+
+    Without method names, all exportable caches that were already created for this instance are exported, i.e.
+    caches decorated with exportable=True, any other option requiring the pure-Python backend, or compact=True.
+    Explicitly requested methods must have exportable caches.
+
+    Keys & values of cached results need to be picklable.  Recency & frequency information is not preserved.
+
+    :param instance: object whose per-instance caches should be exported.
+    :param method_names: (str, optional) names of the cached methods to export.  Default: all exportable caches.
+    :return: snapshot as bytes.
+    """
+    if method_names:
+        caches = dict()
+        for name in method_names:
+            cache = getattr(instance, name)
+            if not hasattr(cache, "cache_export"):
+                raise TypeError(f"Cache of method '{name}' is not exportable; decorate it with exportable=True.")
+            caches[name] = cache
+    else:
+        caches = {name: cache for name, cache in _created_caches(instance).items() if hasattr(cache, "cache_export")}
+
+    snapshot = dict(version=_SNAPSHOT_VERSION, caches={name: cache.cache_export() for name, cache in caches.items()})
+    return pickle.dumps(snapshot, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def import_cache_snapshot(instance: object, snapshot: bytes) -> int:
+    """
+    Pre-populate the per-instance caches of the given instance with the contents of a snapshot obtained using
+    export_cache_snapshot.  Entries are subject to the usual limits of each cache (maxsize, max_bytes, ...) & the
+    remaining time-to-live of entries with a ttl is preserved.
+
+    NOTE: snapshots are unpickled, so they should only be imported from trusted sources.
+
+    :param instance: object whose per-instance caches should be pre-populated.
+    :param snapshot: (bytes) snapshot obtained using export_cache_snapshot.
+    :return: total number of imported entries retained in the caches.
+    """
+    content = pickle.loads(snapshot)
+    if content.get("version") != _SNAPSHOT_VERSION:
+        raise ValueError(f"Unsupported cache snapshot version: {content.get('version')}.")
+
+    cached_method_names = _cached_method_names(type(instance))
+    n_imported = 0
+    for name, entries in content["caches"].items():
+        if name not in cached_method_names:
+            raise ValueError(f"'{name}' is not a per-instance cached method of {type(instance).__name__}.")
+        cache = getattr(instance, name)
+        if not hasattr(cache, "cache_import"):
+            raise TypeError(f"Cache of method '{name}' is not exportable; decorate it with exportable=True.")
+        n_imported += cache.cache_import(entries)
+    return n_imported
+
+
+# =================================================================================================
+#  Helpers
+# =================================================================================================
+def _cached_method_names(cls: type) -> list[str]:
+    """Names of all per-instance cached methods of a class, taking into account overrides in subclasses."""
+    seen = set()
+    names = []
+    for klass in cls.__mro__:
+        for name, attr in vars(klass).items():
+            if name not in seen:
+                seen.add(name)
+                if isinstance(attr, (_PerInstanceCacheDescriptor, CompactMethodCache)):
+                    names.append(name)
+    return names
+
+
+def _created_caches(instance: object) -> dict[str, object]:
+    """All per-instance caches that were already created for the given instance, without creating new ones."""
+    instance_dict = getattr(instance, "__dict__", dict())
+    caches = dict()
+    for name in _cached_method_names(type(instance)):
+        if isinstance(getattr(type(instance), name), CompactMethodCache):
+            caches[name] = getattr(instance, name)
+        elif name in instance_dict:
+            caches[name] = instance_dict[name]
+    return caches
@@ -0,0 +1,135 @@
+import json
+import threading
+from dataclasses import dataclass, field, fields
+
+
+# =================================================================================================
+#  CacheStats
+# =================================================================================================
+@dataclass
+class CacheStats:
+    """Statistics of a single cached method, aggregated across all instances."""
+
+    name: str
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0  # entries removed to stay within maxsize, max_bytes or memory_budget
+    expirations: int = 0  # entries removed because their time-to-live expired
+    miss_time_sec: float = 0.0  # total time spent computing results on cache misses
+    currsize: int = 0  # current number of entries, summed across all instances
+    currbytes: int = 0  # current estimated size in bytes, summed across all instances (only if bytes are tracked)
+
+    _lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False, compare=False)
+
+    # -------------------------------------------------------------------------
+    #  Derived statistics
+    # -------------------------------------------------------------------------
+    @property
+    def hit_rate(self) -> float:
+        n_calls = self.hits + self.misses
+        return self.hits / n_calls if n_calls > 0 else 0.0
+
+    @property
+    def mean_miss_time_sec(self) -> float:
+        return self.miss_time_sec / self.misses if self.misses > 0 else 0.0
+
+    # -------------------------------------------------------------------------
+    #  Recording
+    # -------------------------------------------------------------------------
+    def record_hit(self):
+        with self._lock:
+            self.hits += 1
+
+    def record_miss(self, t_sec: float):
+        with self._lock:
+            self.misses += 1
+            self.miss_time_sec += t_sec
+
+    def record_added(self, n_bytes: int):
+        with self._lock:
+            self.currsize += 1
+            self.currbytes += n_bytes
+
+    def record_removed(self, n_bytes: int, evicted: bool = False, expired: bool = False):
+        with self._lock:
+            self.currsize -= 1
+            self.currbytes -= n_bytes
+            self.evictions += evicted
+            self.expirations += expired
+
+    def record_released(self, n_entries: int, n_bytes: int):
+        """Remove entries of a garbage collected cache from current size statistics."""
+        with self._lock:
+            self.currsize -= n_entries
+            self.currbytes -= n_bytes
+
+    # -------------------------------------------------------------------------
+    #  Export
+    # -------------------------------------------------------------------------
+    def as_dict(self) -> dict:
+        with self._lock:
+            result = {f.name: getattr(self, f.name) for f in fields(self) if not f.name.startswith("_")}
+        result["hit_rate"] = self.hit_rate
+        result["mean_miss_time_sec"] = self.mean_miss_time_sec
+        return result
+
+
+# =================================================================================================
+#  CacheStatsRegistry
+# =================================================================================================
+class CacheStatsRegistry:
+    """
+    Registry of CacheStats objects, one per cached method (identified by module & qualified name).
+
+    The global instance cache_stats_registry is used by per_instance_(lru_)cache(track_stats=True).
+
+    Example:
+
+        class MyClass:
+
+            @per_instance_lru_cache(track_stats=True)
+            def compute_something(self, x: int) -> int:
+                # expensive computation here
+                pass
+
+        ...
+
+        print(cache_stats_registry.to_json())
+
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._stats: dict[str, CacheStats] = dict()
+
+    def get(self, name: str) -> CacheStats:
+        """Get CacheStats object with given name, creating it if it does not exist yet."""
+        with self._lock:
+            if name not in self._stats:
+                self._stats[name] = CacheStats(name)
+            return self._stats[name]
+
+    def names(self) -> list[str]:
+        with self._lock:
+            return sorted(self._stats)
+
+    def snapshot(self) -> dict[str, dict]:
+        """Return snapshot of all statistics as a dict, mapping names to dicts with statistics."""
+        with self._lock:
+            all_stats = list(self._stats.values())
+        return {stats.name: stats.as_dict() for stats in sorted(all_stats, key=lambda s: s.name)}
+
+    def to_json(self, indent: int | None = 2) -> str:
+        """Return snapshot of all statistics as a JSON string."""
+        return json.dumps(self.snapshot(), indent=indent)
+
+    def reset(self):
+        """Reset hits, misses, evictions, expirations & timings of all registered stats; current sizes are kept."""
+        with self._lock:
+            for stats in self._stats.values():
+                with stats._lock:
+                    stats.hits = stats.misses = stats.evictions = stats.expirations = 0
+                    stats.miss_time_sec = 0.0
+
+
+cache_stats_registry = CacheStatsRegistry()
@@ -167,7 +167,10 @@ def ordered_weighted_geo_mean(values: Iterable[int | float], c: float | None = N
 # =================================================================================================
 @lru_cache
 def _exponential_weights(c: float, n: int) -> np.ndarray:
-    return _exponential_weights_numba(float(c), int(n))
+    # cached result is shared between all callers -> make read-only to avoid accidental modification
+    w = _exponential_weights_numba(float(c), int(n))
+    w.flags.writeable = False
+    return w
 
 
 @numba.njit
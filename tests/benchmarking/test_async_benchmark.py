@@ -0,0 +1,80 @@
+import asyncio
+
+import numpy as np
+import pytest
+
+from brtp.benchmarking import AsyncBenchmarkResult, abenchmark
+
+
+@pytest.mark.parametrize("silent", [True, False])
+@pytest.mark.flaky(reruns=10, reruns_delay=0.1)  # benchmark tests are flaky in GitHub Actions
+def test_abenchmark(silent: bool):
+    # --- arrange -----------------------------------------
+    t_sleep = 0.005
+
+    async def f_test():
+        await asyncio.sleep(t_sleep)
+
+    # --- act ---------------------------------------------
+    t_est = asyncio.run(abenchmark(f_test, t_per_run=0.02, n_warmup=2, n_benchmark=5, silent=silent))
+
+    # --- assert ------------------------------------------
+    assert 0.5 * t_sleep <= t_est <= 2 * t_sleep
+
+
+@pytest.mark.flaky(reruns=10, reruns_delay=0.1)  # benchmark tests are flaky in GitHub Actions
+def test_abenchmark_concurrency():
+    # --- arrange -----------------------------------------
+    t_sleep = 0.005
+    concurrency = 10
+
+    async def f_test():
+        await asyncio.sleep(t_sleep)
+
+    # --- act ---------------------------------------------
+    result = asyncio.run(
+        abenchmark(
+            f_test,
+            t_per_run=0.02,
+            n_warmup=2,
+            n_benchmark=5,
+            concurrency=concurrency,
+            silent=True,
+            return_result=True,
+        )
+    )
+
+    # --- assert ------------------------------------------
+    assert isinstance(result, AsyncBenchmarkResult)
+    assert result.concurrency == concurrency
+    assert result.n_runs == 5
+    assert len(result.latency_sec) == np.sum(result.n_executions)
+    assert 0.5 * concurrency / t_sleep <= result.throughput <= 2 * concurrency / t_sleep
+    p50, p99 = result.latency_quantiles([0.5, 0.99])
+    assert t_sleep <= p50 <= p99
+    assert p50 <= 2 * t_sleep
+    assert "throughput" in str(result)
+
+
+def test_abenchmark_running_loop():
+    # --- arrange -----------------------------------------
+    async def f_test():
+        pass
+
+    async def main():
+        return await abenchmark(f_test, t_per_run=0.001, n_warmup=1, n_benchmark=3, silent=True)
+
+    # --- act ---------------------------------------------
+    t_est = asyncio.run(main())
+
+    # --- assert ------------------------------------------
+    assert isinstance(t_est, float)
+    assert t_est >= 0
+
+
+def test_abenchmark_invalid_concurrency():
+    async def f_test():
+        pass
+
+    with pytest.raises(ValueError):
+        asyncio.run(abenchmark(f_test, concurrency=0))
@@ -0,0 +1,69 @@
+import numpy as np
+import pytest
+
+from brtp.benchmarking import BenchmarkResult
+
+
+# =================================================================================================
+#  Helpers
+# =================================================================================================
+def make_result(t_sec: list[float]) -> BenchmarkResult:
+    n = len(t_sec)
+    return BenchmarkResult(t_sec=np.array(t_sec), n_executions=np.full(n, 10), t_baseline_sec=np.full(n, 1e-8))
+
+
+# =================================================================================================
+#  Tests
+# =================================================================================================
+def test_benchmark_result_statistics():
+    # --- arrange -----------------------------------------
+    result = make_result([1.0, 2.0, 3.0, 4.0, 5.0])
+
+    # --- act & assert ------------------------------------
+    assert result.n_runs == 5
+    assert result.median == 3.0
+    assert result.mean == 3.0
+    assert result.quantiles([0.25, 0.75]) == [2.0, 4.0]
+    assert result.iqr == 2.0
+    assert result.baseline_overhead_sec == 1e-8
+    assert float(result) == 3.0
+
+
+def test_benchmark_result_median_ci():
+    # --- arrange -----------------------------------------
+    rng = np.random.default_rng(1)
+    result_narrow = make_result(list(1.0 + 0.01 * rng.standard_normal(100)))
+    result_wide = make_result(list(1.0 + 0.1 * rng.standard_normal(100)))
+
+    # --- act ---------------------------------------------
+    ci_narrow = result_narrow.median_ci()
+    ci_wide = result_wide.median_ci()
+    ci_wide_99 = result_wide.median_ci(confidence=0.99)
+
+    # --- assert ------------------------------------------
+    assert ci_narrow[0] < result_narrow.median < ci_narrow[1]
+    assert (ci_narrow[1] - ci_narrow[0]) < (ci_wide[1] - ci_wide[0]) < (ci_wide_99[1] - ci_wide_99[0])
+    assert result_wide.median_ci() == ci_wide  # reproducible with default seed
+
+
+@pytest.mark.parametrize(
+    "t_extra, expected",
+    [
+        ([], dict(low_severe=0, low_mild=0, high_mild=0, high_severe=0)),
+        ([1.17], dict(low_severe=0, low_mild=0, high_mild=1, high_severe=0)),
+        ([2.0, 0.0], dict(low_severe=1, low_mild=0, high_mild=0, high_severe=1)),
+    ],
+)
+def test_benchmark_result_outliers(t_extra: list[float], expected: dict):
+    # --- arrange -----------------------------------------
+    t_base = list(np.linspace(0.95, 1.05, 21))  # Q1 ~ 0.975, Q3 ~ 1.025, IQR ~ 0.05
+    result = make_result(t_base + t_extra)
+
+    # --- act ---------------------------------------------
+    classification = result.classify_outliers()
+    mask = result.outliers()
+
+    # --- assert ------------------------------------------
+    assert classification == expected
+    assert int(np.sum(mask)) == sum(expected.values())
+    assert not np.any(mask[: len(t_base)])
@@ -0,0 +1,107 @@
+import os
+
+import pytest
+
+from brtp.benchmarking import BenchmarkResult, available_cpus, benchmark_isolated, run_benchmarks
+from brtp.benchmarking._cli import _parse_cpus
+from brtp.benchmarking._discovery import _import_file
+from brtp.benchmarking._isolation import _run_isolated
+from brtp.benchmarking._registry import benchmark_registry
+
+FAST_SETTINGS = dict(t_per_run=0.001, n_warmup=1, n_benchmark=3)
+
+
+# =================================================================================================
+#  Helpers - module-level, such that they can be pickled
+# =================================================================================================
+def _sum_range():
+    sum(range(1000))
+
+
+def _check_affinity():
+    if hasattr(os, "sched_getaffinity") and len(os.sched_getaffinity(0)) != 1:
+        raise RuntimeError("not pinned")
+
+
+def _fail():
+    raise ValueError("boom")
+
+
+# =================================================================================================
+#  benchmark_isolated
+# =================================================================================================
+def test_benchmark_isolated():
+    # --- act ---------------------------------------------
+    result = benchmark_isolated(_sum_range, silent=True, return_result=True, **FAST_SETTINGS)
+
+    # --- assert ------------------------------------------
+    assert isinstance(result, BenchmarkResult)
+    assert result.n_runs == 3
+    assert result.median > 0
+
+
+def test_benchmark_isolated_pinned():
+    # --- act ---------------------------------------------
+    t = benchmark_isolated(_check_affinity, cpu=available_cpus()[-1], silent=True, **FAST_SETTINGS)
+
+    # --- assert ------------------------------------------
+    assert isinstance(t, float)
+
+
+def test_benchmark_isolated_failure():
+    with pytest.raises(RuntimeError, match="boom"):
+        benchmark_isolated(_fail, silent=True, **FAST_SETTINGS)
+
+
+def test_benchmark_isolated_not_picklable():
+    with pytest.raises(Exception):
+        benchmark_isolated(lambda: None, silent=True, **FAST_SETTINGS)
+
+
+# =================================================================================================
+#  run_benchmarks(..., isolated=True)
+# =================================================================================================
+def test_run_benchmarks_isolated(tmp_path, capsys):
+    # --- arrange -----------------------------------------
+    bench_file = tmp_path / "bench_isolated.py"
+    bench_file.write_text(
+        "from brtp.benchmarking import register_benchmark\n"
+        "\n"
+        "@register_benchmark(group='isolated', params=dict(n=[10, 100_000]))\n"
+        "def bench_sum(n):\n"
+        "    sum(range(n))\n"
+    )
+    _import_file(bench_file)
+    cases = benchmark_registry.cases(groups=["isolated"])
+
+    # --- act ---------------------------------------------
+    try:
+        results = run_benchmarks(cases, isolated=True, cpus=available_cpus()[:2], **FAST_SETTINGS)
+    finally:
+        benchmark_registry.clear()
+
+    # --- assert ------------------------------------------
+    assert list(results) == ["isolated/bench_sum[n=10]", "isolated/bench_sum[n=100000]"]
+    assert 0 < results["isolated/bench_sum[n=10]"] < results["isolated/bench_sum[n=100000]"]
+    assert "| cpu" in capsys.readouterr().out
+
+
+@pytest.mark.parametrize("cpus", [[], [0, 0]])
+def test_run_isolated_invalid_cpus(cpus: list[int]):
+    with pytest.raises(ValueError):
+        _run_isolated({"sum_range": _sum_range}, cpus=cpus, silent=True, **FAST_SETTINGS)
+
+
+# =================================================================================================
+#  CLI
+# =================================================================================================
+@pytest.mark.parametrize(
+    "s, expected",
+    [
+        ("3", [3]),
+        ("0,2", [0, 2]),
+        ("0,4-6", [0, 4, 5, 6]),
+    ],
+)
+def test_parse_cpus(s: str, expected: list[int]):
+    assert _parse_cpus(s) == expected
@@ -0,0 +1,120 @@
+import gc
+import tracemalloc
+
+import numpy as np
+import pytest
+
+from brtp.benchmarking import BenchmarkResult, MemoryProfile, benchmark, profile_memory
+from brtp.benchmarking._memory_profile import _format_bytes
+
+
+# =================================================================================================
+#  profile_memory
+# =================================================================================================
+def test_profile_memory_peak():
+    # --- arrange -----------------------------------------
+    n_bytes = 1_000_000
+
+    def f():
+        return bytearray(n_bytes)
+
+    # --- act ---------------------------------------------
+    profile = profile_memory(f, n_executions=5)
+
+    # --- assert ------------------------------------------
+    assert isinstance(profile, MemoryProfile)
+    assert len(profile.peak_bytes) == 5
+    assert np.all(profile.peak_bytes >= n_bytes)
+    assert np.all(np.abs(profile.net_bytes) < n_bytes / 10)  # result is released after execution
+    assert not tracemalloc.is_tracing()
+
+
+def test_profile_memory_net():
+    # --- arrange -----------------------------------------
+    kept = []
+
+    def f():
+        kept.append(bytearray(100_000))
+
+    # --- act ---------------------------------------------
+    profile = profile_memory(f, n_executions=3)
+
+    # --- assert ------------------------------------------
+    assert np.all(profile.net_bytes >= 100_000)
+    assert np.all(profile.net_blocks >= 1)
+    assert len(kept) == 3
+
+
+def test_profile_memory_gc_collections():
+    # --- arrange -----------------------------------------
+    def f():
+        gc.collect()
+
+    # --- act ---------------------------------------------
+    profile = profile_memory(f, n_executions=3)
+
+    # --- assert ------------------------------------------
+    assert np.all(profile.gc_collections >= 1)
+    assert profile.mean_gc_collections >= 1
+
+
+def test_profile_memory_keeps_tracing():
+    # --- arrange -----------------------------------------
+    tracemalloc.start()
+
+    # --- act ---------------------------------------------
+    try:
+        profile_memory(lambda: [0] * 1000, n_executions=2)
+        still_tracing = tracemalloc.is_tracing()
+    finally:
+        tracemalloc.stop()
+
+    # --- assert ------------------------------------------
+    assert still_tracing
+
+
+# =================================================================================================
+#  benchmark(..., profile_memory=True)
+# =================================================================================================
+def test_benchmark_profile_memory(capsys):
+    # --- act ---------------------------------------------
+    result = benchmark(
+        lambda: np.zeros(100_000),
+        t_per_run=0.001,
+        n_warmup=2,
+        n_benchmark=5,
+        return_result=True,
+        profile_memory=True,
+    )
+
+    # --- assert ------------------------------------------
+    assert isinstance(result, BenchmarkResult)
+    assert isinstance(result.memory, MemoryProfile)
+    assert len(result.memory.peak_bytes) == 5
+    assert result.memory.median_peak_bytes >= 800_000
+    assert "Memory:" in capsys.readouterr().out
+
+
+def test_benchmark_no_profile_memory():
+    # --- act ---------------------------------------------
+    result = benchmark(lambda: None, t_per_run=0.001, n_warmup=1, n_benchmark=3, silent=True, return_result=True)
+
+    # --- assert ------------------------------------------
+    assert result.memory is None
+
+
+# =================================================================================================
+#  Formatting
+# =================================================================================================
+@pytest.mark.parametrize(
+    "n_bytes, expected",
+    [
+        (0, "0 B"),
+        (1000, "1000 B"),
+        (2048, "2.0 KB"),
+        (3 * 1024**2, "3.0 MB"),
+        (5 * 1024**4, "5120.0 GB"),
+    ],
+)
+def test_format_bytes(n_bytes: float, expected: str):
+    assert _format_bytes(n_bytes) == expected
@@ -1,6 +1,7 @@
+import numpy as np
 import pytest
 
-from brtp.benchmarking import benchmark, high_precision_sleep
+from brtp.benchmarking import BenchmarkResult, Timer, benchmark, high_precision_sleep
 
 
 @pytest.mark.parametrize("t_sleep", [1e-5, 1e-4, 1e-3])
@@ -16,3 +17,126 @@ def test_micro_benchmark(t_sleep: float, silent: bool):
 
     # --- assert ------------------------------------------
     assert 0.5 * t_sleep <= t_est <= 2 * t_sleep
+
+
+@pytest.mark.flaky(reruns=10, reruns_delay=0.1)  # benchmark tests are flaky in GitHub Actions
+def test_micro_benchmark_return_result():
+    # --- arrange -----------------------------------------
+    t_sleep = 1e-4
+
+    def f_test():
+        high_precision_sleep(t_sleep)
+
+    # --- act ---------------------------------------------
+    result = benchmark(f_test, t_per_run=0.01, n_warmup=2, n_benchmark=20, silent=True, return_result=True)
+
+    # --- assert ------------------------------------------
+    assert isinstance(result, BenchmarkResult)
+    assert result.n_runs == 20
+    assert len(result.n_executions) == len(result.t_baseline_sec) == 20
+    assert np.all(result.n_executions >= 1)
+    assert 0.5 * t_sleep <= result.median <= 2 * t_sleep
+    ci_lower, ci_upper = result.median_ci()
+    assert ci_lower <= result.median <= ci_upper
+    assert 0 <= result.baseline_overhead_sec < t_sleep
+    assert "per execution" in str(result)
+
+
+def test_micro_benchmark_setup_teardown():
+    # --- arrange -----------------------------------------
+    calls = dict(setup=0, teardown=0, setup_execution=0, teardown_execution=0, f=0)
+
+    def count(name: str):
+        calls[name] += 1
+
+    # --- act ---------------------------------------------
+    result = benchmark(
+        lambda: count("f"),
+        t_per_run=0.001,
+        n_warmup=2,
+        n_benchmark=5,
+        silent=True,
+        return_result=True,
+        setup=lambda: count("setup"),
+        teardown=lambda: count("teardown"),
+        setup_execution=lambda: count("setup_execution"),
+        teardown_execution=lambda: count("teardown_execution"),
+    )
+
+    # --- assert ------------------------------------------
+    assert calls["setup"] == calls["teardown"] == 7
+    assert calls["setup_execution"] == calls["teardown_execution"] == 2 * calls["f"]  # f + baseline
+    assert calls["f"] >= 7
+    assert np.sum(result.n_executions) <= calls["f"]
+
+
+def test_micro_benchmark_arg_provider():
+    # --- arrange -----------------------------------------
+    inputs = []
+    received = []
+
+    def arg_provider():
+        inputs.append(len(inputs))
+        return inputs[-1]
+
+    # --- act ---------------------------------------------
+    benchmark(received.append, t_per_run=0.001, n_warmup=1, n_benchmark=3, silent=True, arg_provider=arg_provider)
+
+    # --- assert ------------------------------------------
+    assert received == inputs  # each execution gets its own, pre-generated input
+
+
+@pytest.mark.flaky(reruns=10, reruns_delay=0.1)  # benchmark tests are flaky in GitHub Actions
+def test_micro_benchmark_arg_provider_in_place():
+    # --- arrange -----------------------------------------
+    values = list(np.random.default_rng(0).random(10_000))
+    sorted_values = sorted(values)
+
+    # --- act ---------------------------------------------
+    t_fresh = benchmark(
+        lambda x: x.sort(), t_per_run=0.01, n_warmup=2, n_benchmark=10, silent=True, arg_provider=values.copy
+    )
+    t_sorted = benchmark(lambda: sorted_values.sort(), t_per_run=0.01, n_warmup=2, n_benchmark=10, silent=True)
+
+    # --- assert ------------------------------------------
+    assert t_fresh > 5 * t_sorted  # sorting unsorted data each time (timsort is O(n) for sorted data)
+
+
+def test_micro_benchmark_slow_arg_provider_wall_time():
+    # --- arrange -----------------------------------------
+    def arg_provider():
+        high_precision_sleep(2e-4)  # preparing inputs is much slower than f
+        return 1
+
+    # --- act ---------------------------------------------
+    with Timer() as timer:
+        result = benchmark(
+            lambda x: x + 1,
+            t_per_run=0.01,
+            n_warmup=5,
+            n_benchmark=10,
+            silent=True,
+            arg_provider=arg_provider,
+            return_result=True,
+        )
+
+    # --- assert ------------------------------------------
+    assert timer.t_elapsed_sec() < 2.0  # 15 runs of ~t_per_run each (including input generation)
+    assert max(result.n_executions) <= 100  # ~0.01s / 200µs = 50 inputs per run
+
+
+def test_micro_benchmark_profile_memory_excludes_inputs():
+    # --- act ---------------------------------------------
+    result = benchmark(
+        lambda x: len(x),
+        t_per_run=0.001,
+        n_warmup=1,
+        n_benchmark=3,
+        silent=True,
+        return_result=True,
+        profile_memory=True,
+        arg_provider=lambda: bytearray(1_000_000),
+    )
+
+    # --- assert ------------------------------------------
+    assert result.memory.median_peak_bytes < 100_000
@@ -0,0 +1,62 @@
+import time
+
+import numpy as np
+import pytest
+
+from brtp.benchmarking import ParallelScalingResult, benchmark_parallel
+
+FAST_SETTINGS = dict(t_per_run=0.02, n_warmup=1, n_benchmark=3)
+
+
+# =================================================================================================
+#  Helpers - module-level, such that they can be pickled
+# =================================================================================================
+def _sleep():
+    time.sleep(0.001)
+
+
+def _fail():
+    raise ValueError("boom")
+
+
+# =================================================================================================
+#  Tests
+# =================================================================================================
+@pytest.mark.parametrize("silent", [True, False])
+@pytest.mark.flaky(reruns=10, reruns_delay=0.1)  # benchmark tests are flaky in GitHub Actions
+def test_benchmark_parallel_threads(silent: bool):
+    # --- act ---------------------------------------------
+    result = benchmark_parallel(_sleep, n_workers=[2, 4], silent=silent, **FAST_SETTINGS)
+
+    # --- assert ------------------------------------------
+    assert isinstance(result, ParallelScalingResult)
+    assert list(result.n_workers) == [1, 2, 4]  # single-worker baseline is always included
+    assert result.speedup[0] == 1.0
+    assert np.all(result.efficiency > 0.5)  # sleeping releases the GIL, so it should scale well
+    assert result.levels[0].n_workers == 1
+    assert len(result.levels[0].throughput) == 3
+    p50, p99 = result.levels[2].latency_quantiles([0.5, 0.99])
+    assert 0.001 <= p50 <= p99
+    assert "efficiency" in str(result)
+
+
+@pytest.mark.flaky(reruns=10, reruns_delay=0.1)  # benchmark tests are flaky in GitHub Actions
+def test_benchmark_parallel_processes():
+    # --- act ---------------------------------------------
+    result = benchmark_parallel(_sleep, n_workers=[2], use_processes=True, silent=True, **FAST_SETTINGS)
+
+    # --- assert ------------------------------------------
+    assert result.use_processes
+    assert list(result.n_workers) == [1, 2]
+    assert result.speedup[1] > 1.0
+
+
+@pytest.mark.parametrize("use_processes", [False, True])
+def test_benchmark_parallel_failure(use_processes: bool):
+    with pytest.raises((ValueError, RuntimeError), match="boom"):
+        benchmark_parallel(_fail, n_workers=[2], use_processes=use_processes, silent=True, **FAST_SETTINGS)
+
+
+def test_benchmark_parallel_invalid_n_workers():
+    with pytest.raises(ValueError):
+        benchmark_parallel(_sleep, n_workers=[0], silent=True, **FAST_SETTINGS)
@@ -0,0 +1,223 @@
+import asyncio
+import threading
+
+import pytest
+
+from brtp.benchmarking import Profiler, RegionStats, high_precision_sleep, profile, profiler
+
+
+# =================================================================================================
+#  Profiler
+# =================================================================================================
+def test_profiler_nested_regions():
+    # --- arrange -----------------------------------------
+    prof = Profiler()
+
+    # --- act ---------------------------------------------
+    for _ in range(3):
+        with prof.region("outer"):
+            with prof.region("inner"):
+                high_precision_sleep(0.002)
+            high_precision_sleep(0.001)
+    with prof.region("other"):
+        pass
+
+    tree = prof.tree()
+
+    # --- assert ------------------------------------------
+    assert [stats.name for stats in tree] == ["outer", "other"]
+    outer, inner = tree[0], tree[0].find("inner")
+    assert isinstance(inner, RegionStats)
+    assert outer.count == inner.count == 3
+    assert outer.total_sec >= 3 * 0.003
+    assert inner.total_sec >= 3 * 0.002
+    assert outer.self_sec == pytest.approx(outer.total_sec - inner.total_sec)
+    assert outer.self_sec >= 3 * 0.001
+    assert inner.self_sec == inner.total_sec  # leaf region
+    assert outer.min_sec <= outer.mean_sec <= outer.max_sec
+    assert outer.find("missing") is None
+
+
+def test_profiler_decorator():
+    # --- arrange -----------------------------------------
+    prof = Profiler()
+
+    @prof.region("f")
+    def f(x: int) -> int:
+        with prof.region("g"):
+            return 2 * x
+
+    # --- act ---------------------------------------------
+    results = [f(i) for i in range(5)]
+
+    # --- assert ------------------------------------------
+    assert results == [0, 2, 4, 6, 8]
+    assert f.__name__ == "f"
+    [stats] = prof.tree()
+    assert (stats.name, stats.count) == ("f", 5)
+    assert stats.find("g").count == 5
+
+
+def test_profiler_same_name_different_parents():
+    # --- arrange -----------------------------------------
+    prof = Profiler()
+
+    # --- act ---------------------------------------------
+    with prof.region("a"):
+        with prof.region("x"):
+            pass
+    with prof.region("b"):
+        with prof.region("x"):
+            pass
+        with prof.region("x"):
+            pass
+
+    tree = prof.tree()
+
+    # --- assert ------------------------------------------
+    assert tree[0].find("x").count == 1
+    assert tree[1].find("x").count == 2
+
+
+def test_profiler_exception():
+    # --- arrange -----------------------------------------
+    prof = Profiler()
+
+    # --- act ---------------------------------------------
+    with pytest.raises(ValueError):
+        with prof.region("failing"):
+            raise ValueError()
+    with prof.region("next"):
+        pass
+
+    # --- assert ------------------------------------------
+    assert [(stats.name, stats.count) for stats in prof.tree()] == [("failing", 1), ("next", 1)]
+
+
+def test_profiler_threads():
+    # --- arrange -----------------------------------------
+    prof = Profiler()
+
+    def work():
+        for _ in range(10):
+            with prof.region("work"):
+                with prof.region("step"):
+                    pass
+
+    threads = [threading.Thread(target=work) for _ in range(4)]
+
+    # --- act ---------------------------------------------
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    # --- assert ------------------------------------------
+    [stats] = prof.tree()  # merged across threads
+    assert stats.count == 40
+    assert stats.find("step").count == 40
+    assert len(prof._roots) <= 1  # trees of finished threads are merged into a shared tree
+
+
+def test_profiler_many_threads():
+    # --- arrange -----------------------------------------
+    prof = Profiler()
+
+    def work():
+        with prof.region("request"):
+            pass
+
+    # --- act ---------------------------------------------
+    for _ in range(100):  # e.g. 1 thread per request
+        thread = threading.Thread(target=work)
+        thread.start()
+        thread.join()
+
+    # --- assert ------------------------------------------
+    assert [(stats.name, stats.count) for stats in prof.tree()] == [("request", 100)]
+    assert len(prof._roots) <= 1  # no unbounded growth
+
+
+def test_profiler_asyncio_tasks():
+    # --- arrange -----------------------------------------
+    prof = Profiler()
+
+    async def task(name: str):
+        with prof.region(name):
+            await asyncio.sleep(0.02)
+
+    async def main():
+        with prof.region("main"):
+            await asyncio.gather(task("a"), task("b"))
+
+    # --- act ---------------------------------------------
+    asyncio.run(main())
+
+    # --- assert ------------------------------------------
+    [stats] = prof.tree()
+    assert [child.name for child in stats.children] == ["a", "b"]  # siblings, not nested
+    for child in stats.children:
+        assert child.count == 1
+        assert child.children == []
+        assert child.self_sec >= 0.015
+
+
+def test_profiler_disabled():
+    # --- arrange -----------------------------------------
+    prof = Profiler(enabled=False)
+
+    @prof.region("f")
+    def f():
+        pass
+
+    # --- act & assert ------------------------------------
+    with prof.region("a"):
+        f()
+    assert prof.region("a") is prof.region("a")  # shared no-op region
+    assert prof.tree() == []
+
+    prof.enable()
+    f()
+    assert [stats.name for stats in prof.tree()] == ["f"]  # decorated while disabled, recorded when enabled
+
+    prof.disable()
+    f()
+    assert prof.tree()[0].count == 1
+
+
+def test_profiler_reset_and_report():
+    # --- arrange -----------------------------------------
+    prof = Profiler()
+    with prof.region("outer"):
+        with prof.region("inner"):
+            pass
+
+    # --- act ---------------------------------------------
+    report = prof.report()
+    prof.reset()
+
+    # --- assert ------------------------------------------
+    lines = report.splitlines()
+    assert lines[0].startswith("region")
+    assert lines[1].startswith("outer")
+    assert lines[2].startswith("  inner")
+    assert prof.tree() == []
+
+
+# =================================================================================================
+#  Global profiler
+# =================================================================================================
+def test_global_profile():
+    # --- act ---------------------------------------------
+    profiler.enable()
+    try:
+        with profile("test_global_profile"):
+            pass
+        stats = [s for s in profiler.tree() if s.name == "test_global_profile"]
+    finally:
+        profiler.disable()
+        profiler.reset()
+
+    # --- assert ------------------------------------------
+    assert len(stats) == 1
+    assert stats[0].count == 1
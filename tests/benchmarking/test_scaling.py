@@ -0,0 +1,80 @@
+import numpy as np
+import pytest
+
+from brtp.benchmarking import ScalingResult, benchmark_scaling, crossover_size, fit_complexity
+
+# =================================================================================================
+#  Helpers
+# =================================================================================================
+SIZES = np.array([10, 30, 100, 300, 1_000, 3_000, 10_000, 30_000, 100_000])
+
+
+def make_result(t_sec: np.ndarray) -> ScalingResult:
+    return ScalingResult(sizes=SIZES, t_sec=t_sec, fits=fit_complexity(SIZES, t_sec))
+
+
+# =================================================================================================
+#  Complexity fitting
+# =================================================================================================
+@pytest.mark.parametrize(
+    "t_func, expected_model, expected_exponent",
+    [
+        (lambda n: 1e-6 + 0 * n, "O(1)", 0.0),
+        (lambda n: 1e-7 * np.log(n), "O(log n)", None),
+        (lambda n: 1e-6 + 1e-8 * n, "O(n)", None),
+        (lambda n: 1e-9 * n * np.log(n), "O(n log n)", None),
+        (lambda n: 1e-12 * n**2, "O(n^k)", 2.0),
+        (lambda n: 1e-10 * n**1.5, "O(n^k)", 1.5),
+    ],
+)
+def test_fit_complexity(t_func, expected_model: str, expected_exponent: float | None):
+    # --- arrange -----------------------------------------
+    rng = np.random.default_rng(0)
+    t_sec = t_func(SIZES.astype(float)) * (1 + 0.02 * rng.standard_normal(len(SIZES)))
+
+    # --- act ---------------------------------------------
+    result = make_result(t_sec)
+
+    # --- assert ------------------------------------------
+    assert result.best_fit.model == expected_model
+    if expected_exponent is not None:
+        assert result.exponent == pytest.approx(expected_exponent, abs=0.05)
+    np.testing.assert_allclose(result.best_fit.predict(SIZES), t_sec, rtol=0.1)
+
+
+def test_crossover_size():
+    # --- arrange -----------------------------------------
+    n = SIZES.astype(float)
+    result_a = make_result(1e-5 + 1e-9 * n)  # high fixed overhead, fast per element
+    result_b = make_result(1e-7 + 1e-8 * n)  # low fixed overhead, slow per element
+
+    # --- act ---------------------------------------------
+    n_cross = crossover_size(result_a, result_b)
+    n_cross_none = crossover_size(result_a, make_result(1.0 + 0 * n))
+
+    # --- assert ------------------------------------------
+    assert 1_000 < n_cross < 1_200  # exact: 9.9e-6 / 9e-9 = 1100
+    assert n_cross_none is None
+    with pytest.raises(ValueError):
+        crossover_size(result_a, ScalingResult(SIZES[:3], result_b.t_sec[:3], result_b.fits))
+
+
+@pytest.mark.flaky(reruns=10, reruns_delay=0.1)  # benchmark tests are flaky in GitHub Actions
+def test_benchmark_scaling():
+    # --- act ---------------------------------------------
+    result = benchmark_scaling(
+        lambda x: sorted(x),
+        n_min=1_000,
+        n_max=100_000,
+        n_sizes=5,
+        setup=lambda n: list(np.random.default_rng(0).random(n)),
+        t_per_run=0.01,
+        n_warmup=1,
+        n_benchmark=5,
+        silent=True,
+    )
+
+    # --- assert ------------------------------------------
+    assert list(result.sizes) == [1_000, 3_162, 10_000, 31_623, 100_000]
+    assert 0.8 < result.exponent < 1.5
+    assert result.best_fit.model in ["O(n)", "O(n log n)", "O(n^k)"]
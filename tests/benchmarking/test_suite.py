@@ -0,0 +1,156 @@
+import json
+
+import pytest
+
+from brtp.benchmarking import (
+    BenchmarkComparison,
+    BenchmarkRegistry,
+    compare_results,
+    load_results,
+    register_benchmark,
+    run_benchmarks,
+    save_results,
+)
+from brtp.benchmarking._cli import main
+
+FAST_SETTINGS = dict(t_per_run=0.001, n_warmup=1, n_benchmark=3)
+
+
+# =================================================================================================
+#  Registry
+# =================================================================================================
+def test_register_benchmark_cases():
+    # --- arrange -----------------------------------------
+    registry = BenchmarkRegistry()
+    calls = []
+
+    # --- act ---------------------------------------------
+    @register_benchmark(registry=registry)
+    def bench_a():
+        calls.append("a")
+
+    @register_benchmark(name="b", group="grp", params=dict(n=[1, 2], method=["x"]), registry=registry)
+    def bench_b(n: int, method: str):
+        calls.append((n, method))
+
+    cases = registry.cases()
+    cases[1].as_callable()()
+
+    # --- assert ------------------------------------------
+    assert bench_a.__name__ == "bench_a"  # returned unchanged
+    assert [case.name for case in cases] == ["default/bench_a", "grp/b[n=1,method=x]", "grp/b[n=2,method=x]"]
+    assert calls == [(1, "x")]
+    assert registry.groups() == ["default", "grp"]
+    assert [case.name for case in registry.cases(groups=["grp"], pattern="*n=2*")] == ["grp/b[n=2,method=x]"]
+
+
+def test_run_benchmarks():
+    # --- arrange -----------------------------------------
+    registry = BenchmarkRegistry()
+
+    @register_benchmark(params=dict(n=[10, 100_000]), registry=registry)
+    def bench_sum(n: int):
+        sum(range(n))
+
+    # --- act ---------------------------------------------
+    results = run_benchmarks(registry=registry, silent=True, **FAST_SETTINGS)
+
+    # --- assert ------------------------------------------
+    assert list(results) == ["default/bench_sum[n=10]", "default/bench_sum[n=100000]"]
+    assert 0 < results["default/bench_sum[n=10]"] < results["default/bench_sum[n=100000]"]
+
+
+# =================================================================================================
+#  Results
+# =================================================================================================
+def test_save_load_results(tmp_path):
+    # --- arrange -----------------------------------------
+    results = {"default/a": 1e-6, "default/b[n=1]": 2e-3}
+    path = tmp_path / "results.json"
+
+    # --- act ---------------------------------------------
+    save_results(results, path)
+    loaded = load_results(path)
+
+    # --- assert ------------------------------------------
+    assert loaded == results
+    assert "python" in json.loads(path.read_text())["metadata"]
+
+
+def test_compare_results():
+    # --- arrange -----------------------------------------
+    baseline = {"a": 1.0, "b": 1.0, "c": 1.0, "d": 1.0}
+    results = {"a": 1.05, "b": 1.5, "c": 0.5, "e": 1.0}
+
+    # --- act ---------------------------------------------
+    comparisons = compare_results(results, baseline, threshold=0.1)
+
+    # --- assert ------------------------------------------
+    assert [c.name for c in comparisons] == ["a", "b", "c"]
+    assert [c.is_regression for c in comparisons] == [False, True, False]
+    assert [c.is_improvement for c in comparisons] == [False, False, True]
+    assert comparisons[1].ratio == pytest.approx(1.5)
+    assert "REGRESSION" in str(comparisons[1])
+    assert BenchmarkComparison("x", 0.0, 1.0, 0.1).is_regression
+
+
+# =================================================================================================
+#  Command-line runner
+# =================================================================================================
+BENCHMARK_FILE_CONTENT = """
+from brtp.benchmarking import register_benchmark, high_precision_sleep
+
+@register_benchmark(group="cli_test_{suffix}", params=dict(t=[1e-5]))
+def bench_sleep(t: float):
+    high_precision_sleep(t * {factor})
+"""
+
+
+def _write_benchmark_file(directory, suffix: str, factor: float):
+    directory.mkdir(parents=True, exist_ok=True)
+    (directory / "bench_sleep.py").write_text(BENCHMARK_FILE_CONTENT.format(suffix=suffix, factor=factor))
+
+
+@pytest.mark.flaky(reruns=10, reruns_delay=0.1)
+def test_cli_main(tmp_path, capsys):
+    # --- arrange -----------------------------------------
+    suffix = tmp_path.name
+    group = f"cli_test_{suffix}"
+    _write_benchmark_file(tmp_path / "benchmarks", suffix, factor=1.0)
+    output = tmp_path / "results.json"
+    fast_args = ["--t-per-run", "0.001", "--n-warmup", "1", "--n-benchmark", "5", "-q"]
+
+    # --- act ---------------------------------------------
+    exit_code_list = main([str(tmp_path / "benchmarks"), "-g", group, "--list"])
+    s_list = capsys.readouterr().out
+    exit_code_run = main([str(tmp_path / "benchmarks"), "-g", group, "-o", str(output)] + fast_args)
+    t_sec = load_results(output)[f"{group}/bench_sleep[t=1e-05]"]
+
+    save_results({f"{group}/bench_sleep[t=1e-05]": t_sec / 10}, tmp_path / "baseline.json")
+    exit_code_compare = main(
+        [str(tmp_path / "benchmarks"), "-g", group, "-b", str(tmp_path / "baseline.json")] + fast_args
+    )
+    s_compare = capsys.readouterr().out
+
+    # --- assert ------------------------------------------
+    assert exit_code_list == 0
+    assert s_list.strip() == f"{group}/bench_sleep[t=1e-05]"
+    assert exit_code_run == 0
+    assert 0.5e-5 < t_sec < 2e-5
+    assert exit_code_compare == 1
+    assert "REGRESSION" in s_compare
+
+
+def test_save_results_detailed(tmp_path):
+    # --- arrange -----------------------------------------
+    registry = BenchmarkRegistry()
+    register_benchmark(lambda: None, name="noop", registry=registry)
+    results = run_benchmarks(registry=registry, silent=True, return_results=True, **FAST_SETTINGS)
+
+    # --- act ---------------------------------------------
+    save_results(results, tmp_path / "results.json")
+    content = json.loads((tmp_path / "results.json").read_text())
+
+    # --- assert ------------------------------------------
+    assert set(content["results"]["default/noop"]) >= {"median_sec", "q25_sec", "q75_sec", "median_ci95_sec"}
+    assert load_results(tmp_path / "results.json") == {"default/noop": results["default/noop"].median}
@@ -0,0 +1,110 @@
+import numpy as np
+import pytest
+
+from brtp.caching import batch_cache
+
+
+# =================================================================================================
+#  Helpers
+# =================================================================================================
+class VectorizedFunction:
+    def __init__(self):
+        self.batches = []
+
+    def __call__(self, c: np.ndarray, n: int) -> np.ndarray:
+        self.batches.append(c.tolist())
+        return np.exp(np.outer(c, np.linspace(0.0, 1.0, n)))
+
+
+# =================================================================================================
+#  Tests
+# =================================================================================================
+def test_batch_cache_correct():
+    # --- arrange -----------------------------------------
+    f = VectorizedFunction()
+    f_cached = batch_cache(f)
+
+    # --- act ---------------------------------------------
+    result_1 = f_cached(np.array([1.0, 2.0]), 5)
+    result_2 = f_cached(np.array([2.0, 3.0, 1.0, 3.0]), 5)  # only 3.0 is missing (once, despite duplicate)
+    result_3 = f_cached([1.0], n=5)  # different other arguments -> separately cached
+    result_4 = f_cached(np.array([3.0, 1.0]), 5)  # fully cached
+
+    # --- assert ------------------------------------------
+    assert f.batches == [[1.0, 2.0], [3.0], [1.0]]
+    np.testing.assert_array_equal(result_1, VectorizedFunction()(np.array([1.0, 2.0]), 5))
+    np.testing.assert_array_equal(result_2, VectorizedFunction()(np.array([2.0, 3.0, 1.0, 3.0]), 5))
+    np.testing.assert_array_equal(result_3, VectorizedFunction()(np.array([1.0]), 5))
+    np.testing.assert_array_equal(result_4, VectorizedFunction()(np.array([3.0, 1.0]), 5))
+    assert f_cached.cache_info() == (4, 4, None, 4)
+
+
+def test_batch_cache_maxsize_and_scalar_results():
+    # --- arrange -----------------------------------------
+    calls = []
+
+    @batch_cache(maxsize=2)
+    def square(x: np.ndarray) -> np.ndarray:
+        calls.append(x.tolist())
+        return x**2
+
+    # --- act ---------------------------------------------
+    result_1 = square(np.array([1, 2, 3]))  # 1 is evicted
+    result_2 = square(np.array([3, 1]))
+
+    # --- assert ------------------------------------------
+    assert calls == [[1, 2, 3], [1]]
+    np.testing.assert_array_equal(result_1, [1, 4, 9])
+    np.testing.assert_array_equal(result_2, [9, 1])
+    assert result_2.dtype == np.int64
+
+
+def test_batch_cache_errors():
+    # --- arrange -----------------------------------------
+    @batch_cache
+    def wrong_length(x: np.ndarray) -> np.ndarray:
+        return x[:1]
+
+    # --- act & assert ------------------------------------
+    with pytest.raises(ValueError):
+        wrong_length(np.zeros((2, 2)))
+    with pytest.raises(ValueError):
+        wrong_length(np.array([1.0, 2.0]))
+    assert len(wrong_length(np.array([]))) == 0
+
+
+def test_batch_cache_method():
+    # --- arrange -----------------------------------------
+    class MyClass:
+        def __init__(self, factor: float):
+            self.factor = factor
+            self.batches = []
+
+        @batch_cache(maxsize=10)
+        def compute(self, keys: np.ndarray, offset: float = 0.0) -> np.ndarray:
+            self.batches.append(keys.tolist())
+            return self.factor * keys + offset
+
+    obj_1 = MyClass(factor=2.0)
+    obj_2 = MyClass(factor=3.0)
+
+    # --- act ---------------------------------------------
+    result_1 = obj_1.compute(np.array([1.0, 2.0]))
+    result_2 = obj_1.compute([2.0, 3.0], offset=0.0)
+    result_3 = obj_1.compute(np.array([2.0, 3.0]))
+    result_4 = obj_2.compute(np.array([1.0, 2.0]))  # separate cache per instance
+
+    # --- assert ------------------------------------------
+    np.testing.assert_array_equal(result_1, [2.0, 4.0])
+    np.testing.assert_array_equal(result_2, [4.0, 6.0])
+    np.testing.assert_array_equal(result_3, [4.0, 6.0])
+    np.testing.assert_array_equal(result_4, [3.0, 6.0])
+    assert obj_1.batches == [[1.0, 2.0], [2.0, 3.0], [3.0]]  # different other arguments -> separately cached
+    assert obj_2.batches == [[1.0, 2.0]]
+    assert obj_1.compute is obj_1.compute  # cache is created once per instance
+    assert obj_1.compute.cache_info() == (1, 5, 10, 5)
+    assert MyClass.compute.n_instances() == 2
+    assert MyClass.compute.cache_info_all().currsize == 7
+
+    MyClass.compute.cache_clear_all()
+    assert MyClass.compute.cache_info_all().currsize == 0
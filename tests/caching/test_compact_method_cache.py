@@ -0,0 +1,110 @@
+import gc
+
+import numpy as np
+import pytest
+
+from brtp.caching import per_instance_cache, per_instance_lru_cache
+
+
+# =================================================================================================
+#  Helpers
+# =================================================================================================
+class SlottedClass:
+    __slots__ = ("factor", "__weakref__")
+    call_count = 0
+
+    def __init__(self, factor: int):
+        self.factor = factor
+
+    @per_instance_lru_cache(maxsize=2, compact=True)
+    def compute_something(self, x: int) -> int:
+        SlottedClass.call_count += 1
+        return self.factor * x
+
+    @per_instance_cache(compact=True, content_keys=True)
+    def compute_something_else(self, arr: np.ndarray) -> float:
+        SlottedClass.call_count += 1
+        return float(self.factor * np.sum(arr))
+
+
+# =================================================================================================
+#  Tests
+# =================================================================================================
+def test_compact_cache_correct():
+    # --- arrange -----------------------------------------
+    SlottedClass.call_count = 0
+    obj_1 = SlottedClass(1)
+    obj_2 = SlottedClass(10)
+
+    # --- act ---------------------------------------------
+    results = [
+        obj_1.compute_something(1),
+        obj_1.compute_something(2),
+        obj_1.compute_something(1),  # hit
+        obj_1.compute_something(3),  # evicts 2
+        obj_1.compute_something(2),  # miss
+        obj_2.compute_something(1),  # independent instance -> miss
+        obj_2.compute_something_else(np.arange(4)),
+        obj_2.compute_something_else(np.arange(4)),  # hit
+    ]
+
+    # --- assert ------------------------------------------
+    assert results == [1, 2, 1, 3, 2, 10, 60.0, 60.0]
+    assert SlottedClass.call_count == 6
+    assert obj_1.compute_something.cache_info() == (1, 5, 2, 2)
+    assert obj_2.compute_something.cache_info() == (1, 5, 2, 1)
+    assert obj_2.compute_something_else.cache_parameters()["compact"]
+
+
+def test_compact_cache_clear_and_release():
+    # --- arrange -----------------------------------------
+    obj_1 = SlottedClass(1)
+    obj_2 = SlottedClass(2)
+    obj_1.compute_something(1)
+    obj_2.compute_something(1)
+    n_instances_before = SlottedClass.compute_something.n_instances()
+
+    # --- act ---------------------------------------------
+    obj_1.compute_something.cache_clear()
+    currsize_after_clear = obj_1.compute_something.cache_info().currsize
+    del obj_1, obj_2
+    gc.collect()
+
+    # --- assert ------------------------------------------
+    assert currsize_after_clear == 0
+    assert SlottedClass.compute_something.n_instances() == n_instances_before - 2
+
+
+def test_compact_cache_class_wide():
+    # --- arrange -----------------------------------------
+    objects = [SlottedClass(i) for i in range(3)]
+    SlottedClass.compute_something.cache_clear_all()
+    for obj in objects:
+        obj.compute_something(1)
+        obj.compute_something(1)
+
+    # --- act ---------------------------------------------
+    info_before = SlottedClass.compute_something.cache_info_all()
+    SlottedClass.compute_something.cache_clear_all()
+    info_after = SlottedClass.compute_something.cache_info_all()
+
+    # --- assert ------------------------------------------
+    assert info_before == (3, 3, 2, 3)
+    assert info_after == (0, 0, 2, 0)
+
+
+def test_compact_cache_errors():
+    # --- arrange -----------------------------------------
+    class NoWeakrefClass:
+        __slots__ = ()
+
+        @per_instance_cache(compact=True)
+        def compute_something(self, x: int) -> int:
+            return x
+
+    # --- act & assert ------------------------------------
+    with pytest.raises(TypeError):
+        NoWeakrefClass().compute_something(1)
+
+    with pytest.raises(ValueError):
+        per_instance_cache(compact=True, thread_safe=True)
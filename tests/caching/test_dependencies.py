@@ -0,0 +1,123 @@
+import threading
+
+import pytest
+
+from brtp.caching import per_instance_cache, per_instance_lru_cache
+
+
+# =================================================================================================
+#  Helpers
+# =================================================================================================
+class Model:
+    def __init__(self, x: float, y: float, z: float):
+        self.x = x
+        self.y = y
+        self.z = z
+        self.call_counts = dict(sum_xy=0, prod_z=0)
+
+    @per_instance_lru_cache(depends_on=("x", "y"))
+    def sum_xy(self, factor: float) -> float:
+        self.call_counts["sum_xy"] += 1
+        return factor * (self.x + self.y)
+
+    @per_instance_cache(depends_on=("z",), thread_safe=True)
+    def prod_z(self, factor: float) -> float:
+        self.call_counts["prod_z"] += 1
+        return factor * self.z
+
+
+class SlottedModel:
+    __slots__ = ("x", "__weakref__")
+
+    def __init__(self, x: float):
+        self.x = x
+
+    @per_instance_cache(compact=True, depends_on=("x",))
+    def double_x(self) -> float:
+        return 2 * self.x
+
+
+# =================================================================================================
+#  Tests
+# =================================================================================================
+def test_depends_on_selective_invalidation():
+    # --- arrange -----------------------------------------
+    model = Model(1.0, 2.0, 3.0)
+    model.sum_xy(1.0)
+    model.prod_z(1.0)
+
+    # --- act ---------------------------------------------
+    model.x = 10.0  # should only invalidate sum_xy
+    result_sum = model.sum_xy(1.0)
+    result_prod = model.prod_z(1.0)
+
+    # --- assert ------------------------------------------
+    assert result_sum == 12.0
+    assert result_prod == 3.0
+    assert model.call_counts == dict(sum_xy=2, prod_z=1)
+
+
+def test_depends_on_per_instance_and_delattr():
+    # --- arrange -----------------------------------------
+    model_1 = Model(1.0, 2.0, 3.0)
+    model_2 = Model(1.0, 2.0, 3.0)
+    model_1.prod_z(2.0)
+    model_2.prod_z(2.0)
+
+    # --- act ---------------------------------------------
+    model_1.z = 5.0  # should only invalidate model_1
+    currsize_1 = model_1.prod_z.cache_info().currsize
+    currsize_2 = model_2.prod_z.cache_info().currsize
+    del model_2.z
+
+    # --- assert ------------------------------------------
+    assert (currsize_1, currsize_2) == (0, 1)
+    assert model_2.prod_z.cache_info().currsize == 0
+    with pytest.raises(AttributeError):
+        model_2.prod_z(2.0)
+
+
+def test_depends_on_compact():
+    # --- arrange -----------------------------------------
+    model = SlottedModel(1.0)
+
+    # --- act ---------------------------------------------
+    result_1 = model.double_x()
+    model.x = 4.0
+    result_2 = model.double_x()
+
+    # --- assert ------------------------------------------
+    assert (result_1, result_2) == (2.0, 8.0)
+
+
+@pytest.mark.parametrize("options", [dict(thread_safe=True), dict(compact=True)])
+def test_depends_on_invalidated_during_computation(options: dict):
+    # --- arrange -----------------------------------------
+    started, release = threading.Event(), threading.Event()
+
+    class SlowModel:
+        def __init__(self, x: float):
+            self.x = x
+
+        @per_instance_cache(depends_on=("x",), **options)
+        def double_x(self) -> float:
+            x = self.x
+            started.set()
+            release.wait(10)
+            return 2 * x
+
+    model = SlowModel(1.0)
+    results = []
+    thread = threading.Thread(target=lambda: results.append(model.double_x()))
+
+    # --- act ---------------------------------------------
+    thread.start()
+    started.wait(10)
+    model.x = 4.0  # invalidates while the computation with the old value is in progress
+    release.set()
+    thread.join()
+    result_after = model.double_x()
+
+    # --- assert ------------------------------------------
+    assert results == [2.0]
+    assert result_after == 8.0  # outdated result was not cached
@@ -0,0 +1,116 @@
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from brtp.caching import disk_cache
+
+
+# =================================================================================================
+#  Helpers
+# =================================================================================================
+class CountingFunction:
+    def __init__(self, f):
+        self.f = f
+        self.call_count = 0
+        self.__module__ = f.__module__
+        self.__qualname__ = f.__qualname__
+
+    def __call__(self, *args, **kwargs):
+        self.call_count += 1
+        return self.f(*args, **kwargs)
+
+
+def _make_array(n: int, value: float = 1.0) -> np.ndarray:
+    return np.full(n, value)
+
+
+def _make_dict(x: int, label: str = "") -> dict:
+    return dict(x=x, label=label)
+
+
+# =================================================================================================
+#  Tests
+# =================================================================================================
+def test_disk_cache_correct(tmp_path: Path):
+    # --- arrange -----------------------------------------
+    f = CountingFunction(_make_dict)
+    f_cached = disk_cache(f, cache_dir=tmp_path)
+
+    # --- act ---------------------------------------------
+    result_1 = f_cached(1)
+    result_2 = f_cached(1, label="a")
+    result_3 = f_cached(1)  # should be cached
+    result_4 = f_cached(1, label="a")  # should be cached
+
+    # --- assert ------------------------------------------
+    assert result_1 == result_3 == dict(x=1, label="")
+    assert result_2 == result_4 == dict(x=1, label="a")
+    assert f.call_count == 2
+    assert f_cached.cache_info() == (2, 2, None, 2)
+
+
+def test_disk_cache_persistent_numpy(tmp_path: Path):
+    # --- arrange -----------------------------------------
+    f = CountingFunction(_make_array)
+    f_cached_1 = disk_cache(f, cache_dir=tmp_path)
+    f_cached_2 = disk_cache(f, cache_dir=tmp_path)  # simulates other process or restart
+
+    # --- act ---------------------------------------------
+    result_1 = f_cached_1(10, value=np.float64(2.0))
+    result_2 = f_cached_2(10, value=np.float64(2.0))
+
+    # --- assert ------------------------------------------
+    assert f.call_count == 1
+    assert isinstance(result_2, np.memmap)
+    assert not result_2.flags.writeable
+    np.testing.assert_array_equal(result_1, result_2)
+
+
+def test_disk_cache_array_arguments_and_version(tmp_path: Path):
+    # --- arrange -----------------------------------------
+    f = CountingFunction(lambda arr: float(np.sum(arr)))
+    f_cached_v1 = disk_cache(f, cache_dir=tmp_path, version="1")
+    f_cached_v2 = disk_cache(f, cache_dir=tmp_path, version="2")
+
+    # --- act ---------------------------------------------
+    results = [
+        f_cached_v1(np.arange(10)),
+        f_cached_v1(np.arange(10)),  # same contents -> cached
+        f_cached_v1(np.arange(10.0)),  # different dtype -> not cached
+        f_cached_v2(np.arange(10)),  # different version -> not cached
+    ]
+
+    # --- assert ------------------------------------------
+    assert results == [45.0] * 4
+    assert f.call_count == 3
+
+
+def test_disk_cache_eviction_and_clear(tmp_path: Path):
+    # --- arrange -----------------------------------------
+    f_cached = disk_cache(_make_array, cache_dir=tmp_path, max_bytes=20_000, mmap=False)
+
+    # --- act ---------------------------------------------
+    for n in range(1, 6):
+        f_cached(1_000 * n)  # each entry ~8kB * n
+    n_entries_before_clear = f_cached.cache_info().currsize
+    total_bytes_before_clear = sum(p.stat().st_size for p in tmp_path.glob("*/*.npy"))
+    f_cached.cache_clear()
+
+    # --- assert ------------------------------------------
+    assert n_entries_before_clear == 1  # only the last (most recent) entry fits
+    assert total_bytes_before_clear <= 40_000 + 1_000  # last entry is always retained, even if too large
+    assert f_cached.cache_info().currsize == 0
+
+
+def test_disk_cache_exception(tmp_path: Path):
+    # --- arrange -----------------------------------------
+    @disk_cache(cache_dir=tmp_path)
+    def failing_function(x: int) -> int:
+        raise ValueError("failed")
+
+    # --- act & assert ------------------------------------
+    with pytest.raises(ValueError):
+        failing_function(1)
+    assert failing_function.cache_info().currsize == 0
+    assert list(tmp_path.glob("*/*.tmp")) == []
@@ -0,0 +1,231 @@
+import numpy as np
+import pytest
+
+from brtp.caching import MemoryBudget, per_instance_lru_cache
+from brtp.caching._eviction_policies import POLICIES, LfuPolicy, S3FifoPolicy, TwoQueuePolicy
+
+
+# =================================================================================================
+#  Helpers
+# =================================================================================================
+def make_class(policy: str, maxsize: int) -> type:
+    class MyClass:
+        def __init__(self):
+            self.call_count = 0
+
+        @per_instance_lru_cache(maxsize=maxsize, policy=policy)
+        def compute_something(self, x: int) -> int:
+            self.call_count += 1
+            return 2 * x
+
+    return MyClass
+
+
+# =================================================================================================
+#  Policies - unit tests
+# =================================================================================================
+def test_lfu_policy_evicts_least_frequently_used():
+    # --- arrange -----------------------------------------
+    policy = LfuPolicy(maxsize=100)
+    for key in "abc":
+        policy.on_insert(key)
+
+    # --- act ---------------------------------------------
+    policy.on_hit("a")
+    policy.on_hit("a")
+    policy.on_hit("b")
+
+    # --- assert ------------------------------------------
+    assert policy.victim() == "c"
+    policy.on_remove("c")
+    assert policy.victim() == "b"
+
+
+def test_lfu_policy_aging():
+    # --- arrange -----------------------------------------
+    policy = LfuPolicy(maxsize=2)  # aging period = 20 accesses
+    policy.on_insert("a")
+    for _ in range(10):
+        policy.on_hit("a")  # freq(a) = 11
+
+    # --- act ---------------------------------------------
+    policy.on_insert("b")
+    for _ in range(8):
+        policy.on_hit("b")  # 20th access triggers aging: freq(a)=5, freq(b)=4
+    for _ in range(2):
+        policy.on_hit("b")  # freq(b) = 6
+
+    # --- assert ------------------------------------------
+    assert policy.victim() == "a"
+
+
+def test_lfu_policy_matches_reference():
+    # --- arrange -----------------------------------------
+    rng = np.random.default_rng(0)
+    policy = LfuPolicy(maxsize=10_000)  # no aging during this test
+    freq, t_last = dict(), dict()  # reference:  victim = key with lowest freq, least recently used among those
+
+    # --- act & assert ------------------------------------
+    for t in range(5_000):
+        action = rng.integers(3) if freq else 0
+        if action == 0:
+            key = t
+            policy.on_insert(key)
+            freq[key] = 1
+        elif action == 1:
+            key = list(freq)[rng.integers(len(freq))]
+            policy.on_hit(key)
+            freq[key] += 1
+        else:
+            key = list(freq)[rng.integers(len(freq))]
+            policy.on_remove(key)
+            del freq[key]
+        if key in freq:
+            t_last[key] = t
+        if freq:
+            assert policy.victim() == min(freq, key=lambda k: (freq[k], t_last[k]))
+
+
+def test_2q_policy_promotes_from_ghost_queue():
+    # --- arrange -----------------------------------------
+    policy = TwoQueuePolicy(maxsize=8)  # k_in=2, k_out=4
+    for key in "abc":
+        policy.on_insert(key)
+
+    # --- act ---------------------------------------------
+    victim = policy.victim()  # 'a' moves to ghost queue
+    policy.on_remove(victim)
+    policy.on_insert("a")  # re-inserted while in ghost queue -> hot
+    policy.on_insert("d")
+
+    # --- assert ------------------------------------------
+    assert victim == "a"
+    assert "a" in policy._am
+    assert policy.victim() == "b"  # A1in exceeds k_in -> evict from A1in, not Am
+
+
+def test_s3fifo_policy_promotes_accessed_keys():
+    # --- arrange -----------------------------------------
+    policy = S3FifoPolicy(maxsize=10)  # small queue size = 1
+    for key in "abc":
+        policy.on_insert(key)
+    policy.on_hit("a")
+
+    # --- act ---------------------------------------------
+    victim = policy.victim()  # 'a' was accessed -> moves to main queue;  'b' is evicted
+    policy.on_remove(victim)
+
+    # --- assert ------------------------------------------
+    assert victim == "b"
+    assert "a" in policy._m
+    assert "b" in policy._g
+
+
+# =================================================================================================
+#  per_instance_lru_cache - policy
+# =================================================================================================
+@pytest.mark.parametrize("policy", list(POLICIES))
+def test_per_instance_lru_cache_policy_correct(policy: str):
+    # --- arrange -----------------------------------------
+    MyClass = make_class(policy, maxsize=10)
+    obj_1, obj_2 = MyClass(), MyClass()
+    rng = np.random.default_rng(0)
+
+    # --- act ---------------------------------------------
+    keys = rng.integers(0, 30, size=1000).tolist()
+    results = [obj_1.compute_something(x) for x in keys]
+    obj_2.compute_something(1)
+
+    # --- assert ------------------------------------------
+    assert results == [2 * x for x in keys]
+    info = obj_1.compute_something.cache_info()
+    assert info.currsize == 10
+    assert info.hits + info.misses == 1000
+    assert info.misses == obj_1.call_count
+    assert obj_2.compute_something.cache_info().currsize == 1
+    assert obj_1.compute_something.cache_parameters().get("policy", "lru") == policy
+
+
+@pytest.mark.parametrize("policy", ["lfu", "2q", "s3fifo"])
+def test_per_instance_lru_cache_policy_scan_resistant(policy: str):
+    # --- arrange -----------------------------------------
+    obj_lru = make_class("lru", maxsize=20)()
+    obj_policy = make_class(policy, maxsize=20)()
+    hot_keys = list(range(10))
+
+    def workload(obj):
+        for _ in range(5):
+            for x in hot_keys:
+                obj.compute_something(x)
+        for x in range(1_000, 1_300):  # one-off scan, interleaved with hot keys
+            obj.compute_something(x)
+            if x % 15 == 0:
+                for y in hot_keys:
+                    obj.compute_something(y)
+
+    # --- act ---------------------------------------------
+    workload(obj_lru)
+    workload(obj_policy)
+
+    # --- assert ------------------------------------------
+    assert obj_policy.compute_something.cache_info().hits > obj_lru.compute_something.cache_info().hits
+
+
+@pytest.mark.parametrize("use_budget", [False, True])
+@pytest.mark.parametrize("policy", list(POLICIES))
+def test_per_instance_lru_cache_policy_new_key_is_cached(policy: str, use_budget: bool):
+    # --- arrange -----------------------------------------
+    budget = MemoryBudget(max_bytes=10**9) if use_budget else None
+
+    class MyClass:
+        def __init__(self):
+            self.call_count = 0
+
+        @per_instance_lru_cache(maxsize=5, policy=policy, memory_budget=budget)
+        def compute_something(self, x: int) -> np.ndarray:
+            self.call_count += 1
+            return np.zeros(100, dtype=np.uint8)
+
+    obj = MyClass()
+    for x in range(5):
+        obj.compute_something(x)
+        obj.compute_something(x)  # hit once -> all resident keys are more valuable than a new key
+
+    # --- act ---------------------------------------------
+    obj.compute_something(100)
+    call_count_before = obj.call_count
+    obj.compute_something(100)
+
+    # --- assert ------------------------------------------
+    assert obj.call_count == call_count_before  # new key was cached, rather than immediately evicted
+    assert obj.compute_something.cache_info().currsize == 5
+    if use_budget:
+        assert budget.total_bytes == 500
+
+
+def test_per_instance_lru_cache_policy_with_max_bytes():
+    # --- arrange -----------------------------------------
+    class MyClass:
+        @per_instance_lru_cache(maxsize=100, max_bytes=10_000, policy="lfu")
+        def compute_something(self, n: int) -> np.ndarray:
+            return np.zeros(n, dtype=np.uint8)
+
+    obj = MyClass()
+
+    # --- act ---------------------------------------------
+    obj.compute_something(4_000)
+    obj.compute_something(4_000)  # hit -> frequently used
+    obj.compute_something(5_000)
+    obj.compute_something(3_000)  # exceeds budget -> evicts 5_000 (least frequently used, least recent)
+
+    # --- assert ------------------------------------------
+    assert obj.compute_something.cache_bytes() == 7_000
+
+
+def test_per_instance_lru_cache_policy_invalid():
+    with pytest.raises(ValueError):
+        per_instance_lru_cache(policy="mru")
+    with pytest.raises(ValueError):
+        per_instance_lru_cache(maxsize=None, policy="lfu")
+    with pytest.raises(ValueError):
+        per_instance_lru_cache(maxsize=10, policy="lfu", compact=True)
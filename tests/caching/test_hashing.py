@@ -0,0 +1,52 @@
+import numpy as np
+import pytest
+
+from brtp.caching._hashing import freeze, stable_hash
+
+
+@pytest.mark.parametrize(
+    "obj_1, obj_2",
+    [
+        (1, 1.0),
+        (1, "1"),
+        (("ab", "c"), ("a", "bc")),
+        ([1, 2], (1, 2)),
+        (np.arange(3), np.arange(3.0)),
+        (np.zeros((2, 3)), np.zeros((3, 2))),
+        (np.arange(6), np.arange(6)[::-1]),
+        (dict(a=1), dict(a=2)),
+        (np.arange(3).astype("datetime64[D]"), np.arange(1, 4).astype("datetime64[D]")),
+        (np.arange(3).astype("datetime64[D]"), np.arange(3).astype("datetime64[s]")),
+        (np.arange(3).astype("timedelta64[s]"), np.arange(1, 4).astype("timedelta64[s]")),
+        (np.arange(3).astype("timedelta64[s]"), np.arange(3)),
+    ],
+)
+def test_stable_hash_distinguishes(obj_1, obj_2):
+    assert stable_hash(obj_1) != stable_hash(obj_2)
+
+
+def test_stable_hash_consistent():
+    # --- arrange -----------------------------------------
+    arr = np.arange(12.0).reshape(3, 4)
+
+    # --- act & assert ------------------------------------
+    assert stable_hash(dict(a=1, b=[2, 3])) == stable_hash(dict(b=[2, 3], a=1))
+    assert stable_hash({3, 1, 2}) == stable_hash({1, 2, 3})
+    assert stable_hash(arr[:, ::2]) == stable_hash(np.array([[0.0, 2.0], [4.0, 6.0], [8.0, 10.0]]))
+    assert stable_hash(arr) == stable_hash(arr.copy())
+    assert stable_hash(arr.astype("datetime64[s]")[:, ::2]) == stable_hash(arr[:, ::2].astype("datetime64[s]"))
+
+
+def test_freeze():
+    # --- arrange -----------------------------------------
+    obj_1 = (np.arange(5), [1, 2, {3}], dict(a=np.ones(2)))
+    obj_2 = (np.arange(5), [1, 2, {3}], dict(a=np.ones(2)))
+    obj_3 = (np.arange(5), (1, 2, {3}), dict(a=np.ones(2)))
+
+    # --- act ---------------------------------------------
+    frozen_1, frozen_2, frozen_3 = freeze(obj_1), freeze(obj_2), freeze(obj_3)
+
+    # --- assert ------------------------------------------
+    assert hash(frozen_1) == hash(frozen_2)
+    assert frozen_1 == frozen_2
+    assert frozen_1 != frozen_3
@@ -0,0 +1,119 @@
+import gc
+
+import numpy as np
+
+from brtp.caching import MemoryBudget, per_instance_cache, per_instance_lru_cache
+
+
+def test_memory_budget_across_instances():
+    # --- arrange -----------------------------------------
+    budget = MemoryBudget(max_bytes=10_000)
+
+    class MyClass:
+        @per_instance_cache(memory_budget=budget)
+        def compute_something(self, n: int) -> np.ndarray:
+            return np.zeros(n, dtype=np.uint8)
+
+    obj_1 = MyClass()
+    obj_2 = MyClass()
+
+    # --- act ---------------------------------------------
+    obj_1.compute_something(4_000)
+    obj_2.compute_something(4_000)
+    obj_1.compute_something(4_000)  # hit -> obj_2's entry becomes least recently used globally
+    obj_2.compute_something(3_000)  # exceeds budget -> evicts obj_2's 4_000 entry
+
+    # --- assert ------------------------------------------
+    assert budget.total_bytes == 7_000
+    assert obj_1.compute_something.cache_bytes() == 4_000
+    assert obj_2.compute_something.cache_bytes() == 3_000
+    assert obj_2.compute_something.cache_info().currsize == 1
+
+
+def test_memory_budget_across_methods_and_clear():
+    # --- arrange -----------------------------------------
+    budget = MemoryBudget(max_bytes=1_000_000)
+
+    class MyClass:
+        @per_instance_lru_cache(memory_budget=budget)
+        def compute_something(self, n: int) -> np.ndarray:
+            return np.zeros(n, dtype=np.uint8)
+
+        @per_instance_lru_cache(memory_budget=budget)
+        def compute_something_else(self, n: int) -> np.ndarray:
+            return np.ones(n, dtype=np.uint8)
+
+    obj = MyClass()
+
+    # --- act ---------------------------------------------
+    obj.compute_something(1_000)
+    obj.compute_something_else(2_000)
+    total_bytes_before_clear = budget.total_bytes
+    obj.compute_something.cache_clear()
+
+    # --- assert ------------------------------------------
+    assert total_bytes_before_clear == 3_000
+    assert budget.total_bytes == 2_000
+
+
+def test_memory_budget_garbage_collected_instances():
+    # --- arrange -----------------------------------------
+    budget = MemoryBudget(max_bytes=1_000_000)
+
+    class MyClass:
+        @per_instance_cache(memory_budget=budget)
+        def compute_something(self, n: int) -> np.ndarray:
+            return np.zeros(n, dtype=np.uint8)
+
+    obj = MyClass()
+    obj.compute_something(1_000)
+
+    # --- act ---------------------------------------------
+    del obj
+    gc.collect()
+
+    # --- assert ------------------------------------------
+    assert budget.total_bytes == 0
+
+
+def test_memory_budget_maxsize_zero():
+    # --- arrange -----------------------------------------
+    budget = MemoryBudget(max_bytes=1_000_000)
+    calls = []
+
+    class MyClass:
+        @per_instance_lru_cache(maxsize=0, memory_budget=budget)
+        def compute_something(self, n: int) -> np.ndarray:
+            calls.append(n)
+            return np.zeros(n, dtype=np.uint8)
+
+    obj = MyClass()
+
+    # --- act ---------------------------------------------
+    obj.compute_something(1_000)
+    obj.compute_something(1_000)
+
+    # --- assert ------------------------------------------
+    assert calls == [1_000, 1_000]  # nothing is cached
+    assert obj.compute_something.cache_info().currsize == 0
+    assert budget.total_bytes == 0
+
+
+def test_memory_budget_maxsize_eviction():
+    # --- arrange -----------------------------------------
+    budget = MemoryBudget(max_bytes=1_000_000)
+
+    class MyClass:
+        @per_instance_lru_cache(maxsize=1, memory_budget=budget)
+        def compute_something(self, n: int) -> np.ndarray:
+            return np.zeros(n, dtype=np.uint8)
+
+    obj = MyClass()
+
+    # --- act ---------------------------------------------
+    for n in [1_000, 2_000, 3_000]:
+        obj.compute_something(n)
+
+    # --- assert ------------------------------------------
+    assert obj.compute_something.cache_info().currsize == 1
+    assert budget.total_bytes == obj.compute_something.cache_bytes() == 3_000
@@ -1,4 +1,19 @@
-from brtp.caching import per_instance_cache, per_instance_lru_cache
+import asyncio
+import gc
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pytest
+
+from brtp.caching import (
+    per_instance_async_cache,
+    per_instance_cache,
+    per_instance_generator_cache,
+    per_instance_lru_cache,
+)
+from brtp.caching._prefetch import prefetch_executor
 
 
 # =================================================================================================
@@ -94,6 +109,103 @@ def test_per_instance_lru_cache_cache_clear():
     assert obj_2.compute_something.cache_info().currsize == 3
 
 
+# =================================================================================================
+#  per_instance_lru_cache - thread_safe=True
+# =================================================================================================
+def test_per_instance_lru_cache_thread_safe_correct():
+    # --- arrange -----------------------------------------
+    class MyClass:
+        call_count = 0
+
+        @per_instance_lru_cache(maxsize=2, thread_safe=True)
+        def compute_something(self, x: int) -> int:
+            MyClass.call_count += 1
+            return x * x
+
+    obj = MyClass()
+
+    # --- act ---------------------------------------------
+    result_1 = obj.compute_something(1)
+    result_2 = obj.compute_something(2)
+    result_3 = obj.compute_something(1)  # should be cached
+    result_4 = obj.compute_something(3)  # should evict 2 (least recently used)
+    result_5 = obj.compute_something(2)  # should be recomputed
+
+    # --- assert ------------------------------------------
+    assert [result_1, result_2, result_3, result_4, result_5] == [1, 4, 1, 9, 4]
+    assert MyClass.call_count == 4
+    assert obj.compute_something.cache_info() == (1, 4, 2, 2)
+    assert obj.compute_something.cache_parameters() == dict(maxsize=2, typed=False)
+    assert obj.compute_something.__name__ == "compute_something"
+
+
+def test_per_instance_lru_cache_thread_safe_single_flight():
+    # --- arrange -----------------------------------------
+    n_threads = 16
+    barrier = threading.Barrier(n_threads)
+
+    class MyClass:
+        call_count = 0
+
+        @per_instance_lru_cache(thread_safe=True)
+        def compute_something(self, x: int) -> int:
+            MyClass.call_count += 1
+            time.sleep(0.05)  # make sure all threads overlap with the computation
+            return x * x
+
+    obj = MyClass()
+
+    def call_from_thread(_) -> tuple[int, int]:
+        barrier.wait()
+        return id(obj.compute_something), obj.compute_something(5)
+
+    # --- act ---------------------------------------------
+    with ThreadPoolExecutor(max_workers=n_threads) as executor:
+        results = list(executor.map(call_from_thread, range(n_threads)))
+
+    # --- assert ------------------------------------------
+    assert MyClass.call_count == 1
+    assert len({cache_id for cache_id, _ in results}) == 1  # all threads used the same per-instance cache
+    assert all(value == 25 for _, value in results)
+    assert obj.compute_something.cache_info().misses == 1
+    assert obj.compute_something.cache_info().hits == n_threads - 1
+
+
+def test_per_instance_lru_cache_thread_safe_exception():
+    # --- arrange -----------------------------------------
+    class MyClass:
+        call_count = 0
+
+        @per_instance_lru_cache(thread_safe=True)
+        def compute_something(self, x: int) -> int:
+            MyClass.call_count += 1
+            raise ValueError("failed")
+
+    obj = MyClass()
+
+    # --- act & assert ------------------------------------
+    for _ in range(2):
+        with pytest.raises(ValueError):
+            obj.compute_something(1)
+
+    assert MyClass.call_count == 2  # exceptions are not cached
+    assert obj.compute_something.cache_info().currsize == 0
+
+
+def test_per_instance_lru_cache_thread_safe_recursive():
+    # --- arrange -----------------------------------------
+    class MyClass:
+        @per_instance_lru_cache(thread_safe=True)
+        def fibonacci(self, n: int) -> int:
+            return n if n < 2 else self.fibonacci(n - 1) + self.fibonacci(n - 2)
+
+    # --- act ---------------------------------------------
+    result = MyClass().fibonacci(50)
+
+    # --- assert ------------------------------------------
+    assert result == 12586269025
+
+
 # =================================================================================================
 #  per_instance_cache
 # =================================================================================================
@@ -173,3 +285,500 @@ def test_per_instance_cache_cache_clear():
     assert MyClass.call_count == 5
     assert obj_1.compute_something.cache_info().currsize == 0
     assert obj_2.compute_something.cache_info().currsize == 3
+
+
+# =================================================================================================
+#  per_instance_async_cache
+# =================================================================================================
+def test_per_instance_async_cache_correct():
+    # --- arrange -----------------------------------------
+    class MyClass:
+        call_count = 0
+
+        @per_instance_async_cache
+        async def fetch_something(self, x: int) -> int:
+            MyClass.call_count += 1
+            await asyncio.sleep(0.01)
+            return x * x
+
+    obj_1 = MyClass()
+    obj_2 = MyClass()
+
+    async def main() -> list[int]:
+        return [
+            await obj_1.fetch_something(1),
+            await obj_1.fetch_something(2),
+            await obj_1.fetch_something(1),  # should be cached
+            await obj_2.fetch_something(1),  # should not be cached from obj_1
+        ]
+
+    # --- act ---------------------------------------------
+    results = asyncio.run(main())
+    obj_2.fetch_something.cache_clear()
+
+    # --- assert ------------------------------------------
+    assert results == [1, 4, 1, 1]
+    assert MyClass.call_count == 3
+    assert obj_1.fetch_something.cache_info() == (1, 2, None, 2)
+    assert obj_2.fetch_something.cache_info() == (0, 0, None, 0)
+
+
+def test_per_instance_async_cache_concurrent_awaits():
+    # --- arrange -----------------------------------------
+    class MyClass:
+        call_count = 0
+
+        @per_instance_async_cache(maxsize=16)
+        async def fetch_something(self, x: int) -> int:
+            MyClass.call_count += 1
+            await asyncio.sleep(0.05)
+            return x * x
+
+    obj = MyClass()
+
+    async def main() -> list[int]:
+        return await asyncio.gather(*[obj.fetch_something(3) for _ in range(10)])
+
+    # --- act ---------------------------------------------
+    results = asyncio.run(main())
+
+    # --- assert ------------------------------------------
+    assert results == [9] * 10
+    assert MyClass.call_count == 1
+    assert obj.fetch_something.cache_info() == (9, 1, 16, 1)
+
+
+def test_per_instance_async_cache_exception():
+    # --- arrange -----------------------------------------
+    class MyClass:
+        call_count = 0
+
+        @per_instance_async_cache
+        async def fetch_something(self, x: int) -> int:
+            MyClass.call_count += 1
+            await asyncio.sleep(0.01)
+            raise ValueError("failed")
+
+    obj = MyClass()
+
+    async def main() -> list:
+        return await asyncio.gather(*[obj.fetch_something(3) for _ in range(3)], return_exceptions=True)
+
+    # --- act ---------------------------------------------
+    results_1 = asyncio.run(main())
+    results_2 = asyncio.run(main())
+
+    # --- assert ------------------------------------------
+    assert all(isinstance(r, ValueError) for r in results_1 + results_2)
+    assert MyClass.call_count == 2  # deduplicated within 1 batch, but exceptions are not cached
+
+
+def test_per_instance_async_cache_requires_coroutine_function():
+    with pytest.raises(TypeError):
+
+        class MyClass:
+            @per_instance_async_cache
+            def compute_something(self, x: int) -> int:
+                return x * x
+
+
+# =================================================================================================
+#  per_instance_(lru_)cache - ttl
+# =================================================================================================
+@pytest.mark.flaky(reruns=10, reruns_delay=0.1)  # timing-based tests are flaky in GitHub Actions
+def test_per_instance_cache_ttl():
+    # --- arrange -----------------------------------------
+    class MyClass:
+        call_count = 0
+
+        @per_instance_cache(ttl=0.1)
+        def compute_something(self, x: int) -> int:
+            MyClass.call_count += 1
+            return x * x
+
+    obj = MyClass()
+
+    # --- act ---------------------------------------------
+    result_1 = obj.compute_something(2)
+    result_2 = obj.compute_something(2)  # should be cached
+    count_before_expiry = MyClass.call_count
+    time.sleep(0.2)
+    result_3 = obj.compute_something(2)  # should be expired & recomputed
+
+    # --- assert ------------------------------------------
+    assert [result_1, result_2, result_3] == [4, 4, 4]
+    assert count_before_expiry == 1
+    assert MyClass.call_count == 2
+    assert obj.compute_something.cache_parameters() == dict(maxsize=None, typed=False, ttl=0.1)
+
+
+@pytest.mark.flaky(reruns=10, reruns_delay=0.1)  # timing-based tests are flaky in GitHub Actions
+def test_per_instance_lru_cache_ttl_per_entry_expire():
+    # --- arrange -----------------------------------------
+    class MyClass:
+        @per_instance_lru_cache(maxsize=10, ttl=lambda result: None if result < 0 else 0.1)
+        def compute_something(self, x: int) -> int:
+            return x
+
+    obj = MyClass()
+    for x in [-2, -1, 1, 2, 3]:
+        obj.compute_something(x)
+
+    # --- act ---------------------------------------------
+    n_expired_1 = obj.compute_something.expire()
+    time.sleep(0.2)
+    n_expired_2 = obj.compute_something.expire()
+
+    # --- assert ------------------------------------------
+    assert n_expired_1 == 0
+    assert n_expired_2 == 3  # only entries with positive results expire
+    assert obj.compute_something.cache_info().currsize == 2
+
+
+# =================================================================================================
+#  per_instance_(lru_)cache - max_bytes
+# =================================================================================================
+def test_per_instance_cache_max_bytes():
+    # --- arrange -----------------------------------------
+    class MyClass:
+        @per_instance_cache(max_bytes=10_000)
+        def compute_something(self, n: int) -> np.ndarray:
+            return np.zeros(n, dtype=np.uint8)
+
+    obj = MyClass()
+
+    # --- act ---------------------------------------------
+    obj.compute_something(4_000)
+    obj.compute_something(5_000)
+    obj.compute_something(4_000)  # hit -> 5_000 becomes least recently used
+    obj.compute_something(3_000)  # exceeds budget -> evicts 5_000
+    obj.compute_something(20_000)  # exceeds budget on its own -> not retained
+
+    # --- assert ------------------------------------------
+    assert obj.compute_something.cache_bytes() == 7_000
+    assert obj.compute_something.cache_info().currsize == 2
+    assert obj.compute_something.cache_parameters()["max_bytes"] == 10_000
+
+
+def test_per_instance_lru_cache_custom_sizer():
+    # --- arrange -----------------------------------------
+    class MyClass:
+        @per_instance_lru_cache(max_bytes=10, sizer=len)
+        def compute_something(self, s: str) -> str:
+            return s
+
+    obj = MyClass()
+
+    # --- act ---------------------------------------------
+    for s in ["aaaa", "bbbb", "cc", "dddd"]:
+        obj.compute_something(s)
+
+    # --- assert ------------------------------------------
+    assert obj.compute_something.cache_bytes() == 10
+    assert obj.compute_something.cache_info().currsize == 3
+
+
+# =================================================================================================
+#  per_instance_(lru_)cache - content_keys
+# =================================================================================================
+def test_per_instance_lru_cache_content_keys():
+    # --- arrange -----------------------------------------
+    class MyClass:
+        call_count = 0
+
+        @per_instance_lru_cache(content_keys=True)
+        def compute_something(self, arr: np.ndarray, options: dict, indices: list) -> np.ndarray:
+            MyClass.call_count += 1
+            return arr[indices] * options["factor"]
+
+    obj = MyClass()
+
+    # --- act ---------------------------------------------
+    result_1 = obj.compute_something(np.arange(10), dict(factor=2), [1, 2])
+    result_2 = obj.compute_something(np.arange(10), dict(factor=2), indices=[1, 2])
+    result_3 = obj.compute_something(np.arange(10), dict(factor=2), indices=[1, 2])  # cached
+    result_4 = obj.compute_something(np.arange(10.0), dict(factor=2), indices=[1, 2])  # different dtype
+    result_5 = obj.compute_something(np.arange(10)[::-1], dict(factor=2), indices=[1, 2])  # different contents
+
+    # --- assert ------------------------------------------
+    assert MyClass.call_count == 4
+    assert result_2 is result_3
+    assert not result_1.flags.writeable
+    np.testing.assert_array_equal(result_4, [2.0, 4.0])
+    np.testing.assert_array_equal(result_5, [16, 14])
+    with pytest.raises(ValueError):
+        result_3[0] = 0
+
+
+# =================================================================================================
+#  per_instance_(lru_)cache - prefetch
+# =================================================================================================
+def test_per_instance_lru_cache_prefetch():
+    # --- arrange -----------------------------------------
+    class MyClass:
+        def __init__(self):
+            self.computed = []
+
+        @per_instance_lru_cache(prefetch=lambda self, n: [n + 1, n + 2])
+        def compute_something(self, n: int) -> int:
+            self.computed.append(n)
+            return n * n
+
+    obj = MyClass()
+
+    # --- act ---------------------------------------------
+    result_0 = obj.compute_something(0)  # miss;  prefetches 1, 2
+    obj.compute_something.prefetch_wait()
+    result_1 = obj.compute_something(1)  # prefetch hit;  prefetches 3
+    obj.compute_something.prefetch_wait()
+    prefetch_info = obj.compute_something.prefetch_info()
+    cache_info = obj.compute_something.cache_info()
+
+    # --- assert ------------------------------------------
+    assert (result_0, result_1) == (0, 1)
+    assert sorted(obj.computed) == [0, 1, 2, 3]
+    assert prefetch_info == (3, 1, 0)
+    assert cache_info.hits == 1
+    assert cache_info.misses == 1
+    assert cache_info.currsize == 4
+
+
+def test_per_instance_lru_cache_prefetch_waste():
+    # --- arrange -----------------------------------------
+    class MyClass:
+        @per_instance_lru_cache(maxsize=2, prefetch=lambda self, n: [n + 100])
+        def compute_something(self, n: int) -> int:
+            return n
+
+    obj = MyClass()
+
+    # --- act ---------------------------------------------
+    for n in range(3):
+        obj.compute_something(n)
+        obj.compute_something.prefetch_wait()
+
+    # --- assert ------------------------------------------
+    submitted, hits, wasted = obj.compute_something.prefetch_info()
+    assert (submitted, hits) == (3, 0)
+    assert wasted >= 2
+
+
+def test_per_instance_lru_cache_prefetch_in_flight():
+    # --- arrange -----------------------------------------
+    class MyClass:
+        def __init__(self):
+            self.n_computed = 0
+
+        @per_instance_lru_cache(prefetch=lambda self, n: [n + 1])
+        def compute_something(self, n: int) -> int:
+            self.n_computed += 1
+            time.sleep(0.05)
+            return n
+
+    obj = MyClass()
+
+    # --- act ---------------------------------------------
+    obj.compute_something(0)  # takes 50ms, while 1 is being prefetched concurrently
+    result = obj.compute_something(1)  # still in flight (or just finished) -> no recomputation
+    obj.compute_something.prefetch_wait()
+
+    # --- assert ------------------------------------------
+    assert result == 1
+    assert obj.compute_something.prefetch_info().hits == 1
+    assert obj.n_computed == 3  # 0, 1 & 2 (prefetched after requesting 1)
+
+
+def test_per_instance_lru_cache_prefetch_recursive():
+    # --- arrange -----------------------------------------
+    class MyClass:
+        @per_instance_lru_cache(maxsize=None, prefetch=lambda self, n: [n + i for i in range(1, 9)])
+        def fib(self, n: int) -> int:
+            return n if n < 2 else self.fib(n - 1) + self.fib(n - 2)
+
+    obj = MyClass()
+
+    # --- act ---------------------------------------------
+    result = obj.fib(60)  # prefetch workers recursively request neighbouring keys, which are prefetched as well
+    t_start = time.perf_counter()
+    obj.fib.prefetch_wait(timeout=10)
+    t_wait = time.perf_counter() - t_start
+
+    # --- assert ------------------------------------------
+    assert result == 1548008755920
+    assert t_wait < 10  # prefetch workers never block on queued sibling prefetches
+    assert obj.fib(68) == 72723460248141
+
+
+def test_per_instance_lru_cache_prefetch_claim_queued():
+    # --- arrange -----------------------------------------
+    class MyClass:
+        def __init__(self):
+            self.computed = []
+
+        @per_instance_lru_cache(prefetch=lambda self, n: [n + 1])
+        def compute_something(self, n: int) -> int:
+            self.computed.append(n)
+            return n
+
+    obj = MyClass()
+    release = threading.Event()
+    executor = prefetch_executor()
+    blockers = [executor.submit(release.wait, 10) for _ in range(executor._max_workers)]  # saturate the pool
+
+    # --- act ---------------------------------------------
+    try:
+        obj.compute_something(0)  # prefetch of 1 is queued, but cannot start
+        result = obj.compute_something(1)  # claims the queued prefetch & computes it in this thread
+        computed_before_release = list(obj.computed)
+    finally:
+        release.set()
+    for blocker in blockers:
+        blocker.result()
+    obj.compute_something.prefetch_wait(timeout=10)
+
+    # --- assert ------------------------------------------
+    assert result == 1
+    assert computed_before_release == [0, 1]
+    assert obj.computed.count(1) == 1  # queued prefetch does not compute it again
+
+
+def test_per_instance_lru_cache_prefetch_hook_error():
+    # --- arrange -----------------------------------------
+    def prefetch(self, n: int):
+        if n == 1 and not self.hook_failed:
+            self.hook_failed = True
+            raise ValueError("hook failure")
+        return []
+
+    class MyClass:
+        def __init__(self):
+            self.hook_failed = False
+
+        @per_instance_lru_cache(thread_safe=True, prefetch=prefetch)
+        def compute_something(self, n: int) -> int:
+            return 2 * n
+
+    obj = MyClass()
+    results = []
+
+    # --- act ---------------------------------------------
+    with pytest.warns(RuntimeWarning, match="hook failure"):
+        result = obj.compute_something(1)  # hook raises, but call itself succeeds
+    thread = threading.Thread(target=lambda: results.append(obj.compute_something(1)), daemon=True)
+    thread.start()
+    thread.join(timeout=3)
+
+    # --- assert ------------------------------------------
+    assert result == 2
+    assert results == [2]  # other threads do not block on a leaked in-flight computation
+
+
+# =================================================================================================
+#  per_instance_(lru_)cache - class-wide management
+# =================================================================================================
+@pytest.mark.parametrize("thread_safe", [False, True])
+def test_per_instance_lru_cache_class_wide(thread_safe: bool):
+    # --- arrange -----------------------------------------
+    class MyClass:
+        @per_instance_lru_cache(maxsize=16, thread_safe=thread_safe)
+        def compute_something(self, x: int) -> int:
+            return 2 * x
+
+    objects = [MyClass() for _ in range(3)]
+    for i, obj in enumerate(objects):
+        for x in range(i + 1):
+            obj.compute_something(x)
+            obj.compute_something(x)
+
+    # --- act ---------------------------------------------
+    info_before = MyClass.compute_something.cache_info_all()
+    n_instances_before = MyClass.compute_something.n_instances()
+    del objects[0]
+    gc.collect()
+    n_instances_after_gc = MyClass.compute_something.n_instances()
+    MyClass.compute_something.cache_clear_all()
+    info_after = MyClass.compute_something.cache_info_all()
+
+    # --- assert ------------------------------------------
+    assert info_before == (6, 6, 16, 6)
+    assert n_instances_before == 3
+    assert n_instances_after_gc == 2
+    assert info_after == (0, 0, 16, 0)
+    assert objects[0].compute_something.cache_info().currsize == 0
+
+
+# =================================================================================================
+#  per_instance_generator_cache
+# =================================================================================================
+class MyGeneratorClass:
+    def __init__(self):
+        self.n_produced = 0
+        self.n_calls = 0
+
+    @per_instance_generator_cache
+    def stream_something(self, n: int, fail_at: int | None = None):
+        self.n_calls += 1
+        for i in range(n):
+            if i == fail_at:
+                raise ValueError(f"failed at {i}")
+            self.n_produced += 1
+            yield i * i
+
+
+def test_per_instance_generator_cache_replay():
+    # --- arrange -----------------------------------------
+    obj = MyGeneratorClass()
+
+    # --- act ---------------------------------------------
+    it_1 = obj.stream_something(5)
+    first_items = [next(it_1), next(it_1)]
+    n_produced_lazy = obj.n_produced
+    it_2 = obj.stream_something(5)
+    all_items_2 = list(it_2)  # replays 2 items & continues shared iteration
+    all_items_1 = first_items + list(it_1)  # replays remaining items
+    all_items_3 = list(obj.stream_something(5))
+
+    # --- assert ------------------------------------------
+    assert n_produced_lazy == 2
+    assert all_items_1 == all_items_2 == all_items_3 == [0, 1, 4, 9, 16]
+    assert obj.n_produced == 5
+    assert obj.n_calls == 1
+    assert obj.stream_something.cache_info() == (2, 1, None, 1)
+
+
+def test_per_instance_generator_cache_concurrent_consumers():
+    # --- arrange -----------------------------------------
+    class MySlowGeneratorClass:
+        def __init__(self):
+            self.n_produced = 0
+
+        @per_instance_generator_cache
+        def stream_something(self, n: int):
+            for i in range(n):
+                time.sleep(0.001)
+                self.n_produced += 1
+                yield i
+
+    obj = MySlowGeneratorClass()
+
+    # --- act ---------------------------------------------
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(lambda _: list(obj.stream_something(50)), range(8)))
+
+    # --- assert ------------------------------------------
+    assert all(result == list(range(50)) for result in results)
+    assert obj.n_produced == 50
+
+
+def test_per_instance_generator_cache_exception():
+    # --- arrange -----------------------------------------
+    obj = MyGeneratorClass()
+
+    # --- act & assert ------------------------------------
+    with pytest.raises(ValueError):
+        list(obj.stream_something(5, fail_at=3))
+    with pytest.raises(ValueError):
+        list(obj.stream_something(5, fail_at=3))  # failed entries are recomputed
+
+    assert obj.n_calls == 2
+    assert list(obj.stream_something(3, fail_at=3)) == [0, 1, 4]
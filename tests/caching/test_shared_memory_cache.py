@@ -0,0 +1,106 @@
+import multiprocessing
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pytest
+
+from brtp.caching import SharedMemoryCache
+
+
+# =================================================================================================
+#  Helpers
+# =================================================================================================
+def _compute_array(n: int) -> np.ndarray:
+    return np.arange(n, dtype=np.float64) ** 2
+
+
+def _call_and_report(args: tuple) -> tuple[float, int]:
+    f, n = args
+    result = f(n)
+    return float(np.sum(result)), f.cache_info().hits
+
+
+# =================================================================================================
+#  Tests
+# =================================================================================================
+@pytest.mark.parametrize(
+    "value",
+    [
+        1,
+        -(2**40),
+        2.5,
+        True,
+        1 + 2j,
+        np.float32(1.5),
+        np.int16(-3),
+        np.arange(12, dtype=np.int32).reshape(3, 4),
+        np.array([[1.0, 2.0], [3.0, 4.0]]).T,
+        np.zeros(0),
+    ],
+)
+def test_shared_memory_cache_round_trip(value):
+    with SharedMemoryCache(n_slots=16, slot_bytes=1024) as cache:
+        # --- act -----------------------------------------
+        is_stored = cache.set(b"k" * 16, value)
+        result = cache.get(b"k" * 16)
+
+        # --- assert --------------------------------------
+        assert is_stored
+        assert type(result) is type(value)
+        np.testing.assert_array_equal(result, value)
+
+
+def test_shared_memory_cache_unsupported():
+    with SharedMemoryCache(n_slots=16, slot_bytes=64) as cache:
+        assert not cache.set(b"a" * 16, "a string")
+        assert not cache.set(b"b" * 16, np.zeros(100))  # too large
+        assert not cache.set(b"c" * 16, 2**70)
+        assert cache.get(b"a" * 16, "missing") == "missing"
+        assert cache.cache_info() == (0, 1, 16, 0)
+
+
+def test_shared_memory_cache_collisions_and_clear():
+    with SharedMemoryCache(n_slots=4, slot_bytes=64) as cache:
+        # --- act -----------------------------------------
+        for i in range(20):
+            cache.set(bytes([i]) * 16, i)
+        results = [cache.get(bytes([i]) * 16) for i in range(20)]
+        n_entries_before_clear = cache.cache_info().currsize
+        cache.cache_clear()
+
+        # --- assert --------------------------------------
+        assert n_entries_before_clear == 4
+        assert sum(r is not None for r in results) == 4  # table is full, but all retrieved values are correct
+        assert all(r == i for i, r in enumerate(results) if r is not None)
+        assert cache.cache_info().currsize == 0
+
+
+def test_shared_memory_cache_pickle_attaches():
+    with SharedMemoryCache(n_slots=16, slot_bytes=1024) as cache:
+        # --- arrange -------------------------------------
+        f = cache(_compute_array)
+        f(10)
+
+        # --- act -----------------------------------------
+        f_unpickled = pickle.loads(pickle.dumps(f))
+        result = f_unpickled(10)
+
+        # --- assert --------------------------------------
+        np.testing.assert_array_equal(result, _compute_array(10))
+        assert f_unpickled.cache_info().hits == 1
+
+
+def test_shared_memory_cache_process_pool():
+    with SharedMemoryCache(n_slots=64, slot_bytes=8192) as cache:
+        # --- arrange -------------------------------------
+        f = cache(_compute_array)
+        f(100)  # computed in parent process
+
+        # --- act -----------------------------------------
+        with ProcessPoolExecutor(max_workers=2, mp_context=multiprocessing.get_context("spawn")) as executor:
+            results = list(executor.map(_call_and_report, [(f, 100)] * 4))
+
+        # --- assert --------------------------------------
+        assert all(total == float(np.sum(_compute_array(100))) for total, _ in results)
+        assert all(hits >= 1 for _, hits in results)  # workers found the result computed by the parent
@@ -0,0 +1,176 @@
+import os
+import pickle
+import subprocess
+import sys
+import time
+
+import numpy as np
+import pytest
+
+from brtp.caching import export_cache_snapshot, import_cache_snapshot, per_instance_cache, per_instance_lru_cache
+
+
+# =================================================================================================
+#  Helpers
+# =================================================================================================
+class MyClass:
+    def __init__(self):
+        self.call_count = 0
+
+    @per_instance_lru_cache(exportable=True)
+    def compute_something(self, x: int, label: str = "") -> str:
+        self.call_count += 1
+        return f"{label}{x}"
+
+    @per_instance_cache(content_keys=True)
+    def compute_something_else(self, arr: np.ndarray) -> np.ndarray:
+        self.call_count += 1
+        return 2 * arr
+
+    @per_instance_cache(ttl=0.5)
+    def compute_something_volatile(self, x: int) -> int:
+        self.call_count += 1
+        return x
+
+    @per_instance_cache
+    def compute_something_plain(self, x: int) -> int:
+        self.call_count += 1
+        return x
+
+
+class MySlottedClass:
+    __slots__ = ("call_count", "__weakref__")
+
+    def __init__(self):
+        self.call_count = 0
+
+    @per_instance_lru_cache(maxsize=2, compact=True)
+    def compute_something(self, x: int) -> int:
+        self.call_count += 1
+        return 3 * x
+
+
+# =================================================================================================
+#  Tests
+# =================================================================================================
+def test_cache_export_import_single_method():
+    # --- arrange -----------------------------------------
+    obj_1, obj_2 = MyClass(), MyClass()
+    for x in range(5):
+        obj_1.compute_something(x, label="x=")
+
+    # --- act ---------------------------------------------
+    n_imported = obj_2.compute_something.cache_import(obj_1.compute_something.cache_export())
+    results = [obj_2.compute_something(x, label="x=") for x in range(5)]
+
+    # --- assert ------------------------------------------
+    assert n_imported == 5
+    assert results == [f"x={x}" for x in range(5)]
+    assert obj_2.call_count == 0
+    assert obj_2.compute_something.cache_info().hits == 5
+
+
+def test_export_import_cache_snapshot():
+    # --- arrange -----------------------------------------
+    obj_1 = MyClass()
+    obj_1.compute_something(1)
+    obj_1.compute_something_else(np.arange(3))
+    obj_1.compute_something_volatile(7)
+    obj_1.compute_something_plain(1)  # not exportable -> skipped
+
+    # --- act ---------------------------------------------
+    snapshot = export_cache_snapshot(obj_1)
+    obj_2 = MyClass()
+    n_imported = import_cache_snapshot(obj_2, snapshot)
+
+    # --- assert ------------------------------------------
+    assert isinstance(snapshot, bytes)
+    assert n_imported == 3
+    assert obj_2.compute_something(1) == "1"
+    result = obj_2.compute_something_else(np.arange(3))
+    np.testing.assert_array_equal(result, [0, 2, 4])
+    assert not result.flags.writeable
+    assert obj_2.compute_something_volatile(7) == 7
+    assert obj_2.call_count == 0
+    assert "compute_something_plain" not in obj_2.__dict__
+
+
+def test_import_cache_snapshot_preserves_remaining_ttl():
+    # --- arrange -----------------------------------------
+    obj_1 = MyClass()
+    obj_1.compute_something_volatile(1)
+    time.sleep(0.6)
+    obj_1.compute_something_volatile(2)
+    snapshot = export_cache_snapshot(obj_1, "compute_something_volatile")
+
+    # --- act ---------------------------------------------
+    obj_2 = MyClass()
+    n_imported = import_cache_snapshot(obj_2, snapshot)
+
+    # --- assert ------------------------------------------
+    assert n_imported == 1  # entry for x=1 had already expired
+    obj_2.compute_something_volatile(2)
+    assert obj_2.call_count == 0
+
+
+def test_cache_snapshot_compact():
+    # --- arrange -----------------------------------------
+    obj_1 = MySlottedClass()
+    for x in range(3):
+        obj_1.compute_something(x)
+
+    # --- act ---------------------------------------------
+    obj_2 = MySlottedClass()
+    n_imported = import_cache_snapshot(obj_2, export_cache_snapshot(obj_1))
+
+    # --- assert ------------------------------------------
+    assert n_imported == 2  # maxsize=2
+    assert [obj_2.compute_something(x) for x in [1, 2]] == [3, 6]
+    assert obj_2.call_count == 0
+
+
+def test_cache_snapshot_errors():
+    # --- arrange -----------------------------------------
+    obj = MyClass()
+
+    # --- act & assert ------------------------------------
+    with pytest.raises(TypeError):
+        export_cache_snapshot(obj, "compute_something_plain")
+    with pytest.raises(ValueError):
+        import_cache_snapshot(obj, pickle.dumps(dict(version=1, caches=dict(compute_nothing=[]))))
+    with pytest.raises(ValueError):
+        import_cache_snapshot(obj, pickle.dumps(dict(version=0, caches=dict())))
+
+
+def test_cache_snapshot_across_processes():
+    """Keys containing strings & keyword arguments should still match in another process (hash randomization)."""
+
+    # --- arrange -----------------------------------------
+    obj = MyClass()
+    obj.compute_something(1, label="a")
+    obj.compute_something_else(np.arange(3))
+    snapshot = export_cache_snapshot(obj)
+
+    code = (
+        "import sys\n"
+        "import numpy as np\n"
+        "from brtp.caching import import_cache_snapshot\n"
+        "from tests.caching.test_snapshots import MyClass\n"
+        "obj = MyClass()\n"
+        "import_cache_snapshot(obj, sys.stdin.buffer.read())\n"
+        "obj.compute_something(1, label='a')\n"
+        "obj.compute_something_else(np.arange(3))\n"
+        "print(obj.call_count)\n"
+    )
+
+    # --- act ---------------------------------------------
+    output = subprocess.run(
+        [sys.executable, "-c", code],
+        input=snapshot,
+        capture_output=True,
+        check=True,
+        env={**os.environ, "PYTHONHASHSEED": "123"},
+    )
+
+    # --- assert ------------------------------------------
+    assert output.stdout.decode().strip() == "0"
@@ -0,0 +1,74 @@
+import gc
+import json
+
+from brtp.caching import CacheStatsRegistry, cache_stats_registry, per_instance_cache, per_instance_lru_cache
+
+
+def test_cache_stats_aggregated_across_instances():
+    # --- arrange -----------------------------------------
+    class MyClassWithStats:
+        @per_instance_lru_cache(maxsize=2, track_stats=True)
+        def compute_something(self, x: int) -> int:
+            return x * x
+
+    obj_1 = MyClassWithStats()
+    obj_2 = MyClassWithStats()
+    name = f"{__name__}.{MyClassWithStats.compute_something.__qualname__}"
+
+    # --- act ---------------------------------------------
+    for obj in [obj_1, obj_2]:
+        obj.compute_something(1)  # miss
+        obj.compute_something(1)  # hit
+        obj.compute_something(2)  # miss
+        obj.compute_something(3)  # miss, evicts 1
+
+    # --- assert ------------------------------------------
+    stats = cache_stats_registry.snapshot()[name]
+    assert stats["hits"] == 2
+    assert stats["misses"] == 6
+    assert stats["evictions"] == 2
+    assert stats["currsize"] == 4
+    assert stats["hit_rate"] == 0.25
+    assert stats["miss_time_sec"] > 0.0
+    assert name in json.loads(cache_stats_registry.to_json())
+
+
+def test_cache_stats_garbage_collected_instances():
+    # --- arrange -----------------------------------------
+    class MyClassWithStats:
+        @per_instance_cache(max_bytes=1_000_000, sizer=lambda _: 10, track_stats=True)
+        def compute_something(self, x: int) -> int:
+            return x * x
+
+    obj = MyClassWithStats()
+    stats = cache_stats_registry.get(f"{__name__}.{MyClassWithStats.compute_something.__qualname__}")
+
+    # --- act ---------------------------------------------
+    obj.compute_something(1)
+    obj.compute_something(2)
+    currbytes_before_del = stats.currbytes
+    del obj
+    gc.collect()
+
+    # --- assert ------------------------------------------
+    assert currbytes_before_del == 20
+    assert (stats.currsize, stats.currbytes) == (0, 0)
+    assert stats.misses == 2
+
+
+def test_cache_stats_registry_reset():
+    # --- arrange -----------------------------------------
+    registry = CacheStatsRegistry()
+    stats = registry.get("my_stats")
+    stats.record_hit()
+    stats.record_miss(0.5)
+    stats.record_added(100)
+
+    # --- act ---------------------------------------------
+    registry.reset()
+
+    # --- assert ------------------------------------------
+    assert registry.names() == ["my_stats"]
+    assert registry.get("my_stats") is stats
+    assert (stats.hits, stats.misses, stats.miss_time_sec) == (0, 0, 0.0)
+    assert (stats.currsize, stats.currbytes) == (1, 100)
@@ -202,6 +202,7 @@ def test_exponential_weights(c: float, n: int):
 
     # --- assert ------------------------------------------
     assert np.allclose(w, w_expected)
+    assert not w.flags.writeable  # cached result should be protected against modification
 
 
 @pytest.mark.parametrize("q", [0.5, 0.50001, 0.5001, 0.501, 0.51, 0.6, 0.7, 0.9, 0.99])